@@ -27,6 +27,18 @@ def _windows_selector_loop_factory():
     return asyncio.SelectorEventLoop(selector)
 
 
+def _run_event_loop(main):
+    """Run a long-lived coroutine on uvloop where available, as uvicorn does for the server."""
+    if platform.system() != "Windows":
+        try:
+            import uvloop
+        except ImportError:
+            logger.info("uvloop not available, using the default asyncio event loop")
+        else:
+            return uvloop.run(main)
+    return asyncio.run(main)
+
+
 def init():
     # Set Windows-compatible event loop policy for psycopg async PostgreSQL driver
     if platform.system() == "Windows":
@@ -201,7 +213,7 @@ def worker_cmd():
     """
     validate_settings(dump=False)
     signal.signal(signal.SIGINT, signal_handler)
-    asyncio.run(_start_worker())
+    _run_event_loop(_start_worker())
 
 
 async def _dump_workflow(workflow_def_id: str):
@@ -15,6 +15,12 @@ class S3Settings(BaseSettings):
 class Settings(BaseSettings):
     model_config = SettingsConfigDict(env_nested_delimiter="__", env_nested_max_split=1)
     doc_db_url: str
+    # connection pool for server databases (ignored for SQLite)
+    db_pool_size: int = 20
+    db_max_overflow: int = 10
+    db_pool_recycle: int = 1800
+    db_pool_pre_ping: bool = True
+    db_null_pool: bool = False  # open a connection per session, e.g. behind PgBouncer
     docling_server_url: str = "http://localhost:5001/v1"
     docling_chunk_server_url: str = "http://localhost:5001/v1"
     docling_http_timeout: int = 600
@@ -0,0 +1,90 @@
+"""
+HTTP conditional-request helpers for Soliplex Ingester.
+
+Provides ETag and Last-Modified comparison for handlers that compute their
+own validators and a middleware that adds content-hash ETags to read-mostly GET endpoints.
+"""
+
+import hashlib
+from email.utils import formatdate
+from email.utils import parsedate_to_datetime
+
+from fastapi import Request
+from fastapi import Response
+from fastapi import status
+from starlette.middleware.base import BaseHTTPMiddleware
+from starlette.middleware.base import RequestResponseEndpoint
+
+
+def etag_matches(request: Request, etag: str) -> bool:
+    """Return True if the request's If-None-Match header matches etag (weak comparison)."""
+    if_none_match = request.headers.get("if-none-match")
+    if not if_none_match:
+        return False
+    candidates = {tag.strip().removeprefix("W/") for tag in if_none_match.split(",")}
+    return "*" in candidates or etag.removeprefix("W/") in candidates
+
+
+def last_modified(mtime_ns: int) -> str:
+    """Format a file mtime as an HTTP Last-Modified date."""
+    return formatdate(mtime_ns // 1_000_000_000, usegmt=True)
+
+
+def not_modified_since(request: Request, mtime_ns: int) -> bool:
+    """
+    Return True if the request's If-Modified-Since header is at or after mtime_ns.
+
+    HTTP dates have one-second resolution, so the mtime is truncated to whole
+    seconds. The header is ignored when If-None-Match is present, as RFC 9110
+    requires, and when it cannot be parsed.
+    """
+    if_modified_since = request.headers.get("if-modified-since")
+    if not if_modified_since or "if-none-match" in request.headers:
+        return False
+    try:
+        since = parsedate_to_datetime(if_modified_since)
+    except (TypeError, ValueError):
+        return False
+    if since.tzinfo is None:
+        return False
+    return mtime_ns // 1_000_000_000 <= since.timestamp()
+
+
+def content_etag(body: bytes) -> str:
+    """Build a strong ETag from a response body."""
+    return f'"{hashlib.blake2b(body, digest_size=16).hexdigest()}"'
+
+
+class ETagMiddleware(BaseHTTPMiddleware):
+    """
+    Add ETag and Cache-Control headers to successful GET responses under the given path prefixes.
+
+    The ETag is a hash of the response body, so it is identical across worker
+    processes and changes as soon as the underlying definitions change. A
+    request whose If-None-Match matches gets an empty 304 response.
+    """
+
+    def __init__(self, app, paths: tuple[str, ...], cache_control: str = "no-cache"):
+        super().__init__(app)
+        self.paths = paths
+        self.cache_control = cache_control
+
+    async def dispatch(self, request: Request, call_next: RequestResponseEndpoint) -> Response:
+        if request.method != "GET" or not request.url.path.startswith(self.paths):
+            return await call_next(request)
+
+        response = await call_next(request)
+        if response.status_code != status.HTTP_200_OK:
+            return response
+
+        body = b"".join([chunk async for chunk in response.body_iterator])
+        etag = content_etag(body)
+        cache_headers = {"ETag": etag, "Cache-Control": self.cache_control}
+        if etag_matches(request, etag):
+            return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=cache_headers)
+
+        rebuilt = Response(content=body, status_code=response.status_code)
+        # copy the raw header list; a dict would keep only one of repeated headers such as Set-Cookie
+        rebuilt.raw_headers = list(response.headers.raw)
+        rebuilt.headers.update(cache_headers)
+        return rebuilt
@@ -14,6 +14,7 @@ from sqlalchemy import Column
 from sqlalchemy import UniqueConstraint
 from sqlalchemy.ext.asyncio import AsyncEngine
 from sqlalchemy.ext.asyncio import create_async_engine
+from sqlalchemy.pool import NullPool
 from sqlmodel import Field
 from sqlmodel import SQLModel
 from sqlmodel.ext.asyncio.session import AsyncSession
@@ -23,7 +24,8 @@ class Database:
     """
     Database manager that handles engine lifecycle and session creation.
 
-    Connection pooling is handled automatically by SQLAlchemy's engine.
+    Connection pooling is handled by SQLAlchemy's engine and sized from the
+    DB_POOL_* settings for server databases.
 
     Usage:
         # Initialize once at application startup
@@ -56,16 +58,32 @@ class Database:
         if cls._initialized:
             return
 
-        if url is None:
-            from soliplex.ingester.lib.config import get_settings
+        from soliplex.ingester.lib.config import get_settings
 
-            url = get_settings().doc_db_url
+        settings = None
+        if url is None:
+            settings = get_settings()
+            url = settings.doc_db_url
 
-        connect_args = {}
+        engine_kwargs = {}
         if "sqlite" in url:
-            connect_args["check_same_thread"] = False
-
-        cls._engine = create_async_engine(url, connect_args=connect_args)
+            engine_kwargs["connect_args"] = {"check_same_thread": False}
+        else:
+            # pool options only apply to server databases; an explicit SQLite url needs no settings
+            if settings is None:
+                settings = get_settings()
+            if settings.db_null_pool:
+                # an external pooler (e.g. PgBouncer) owns the connections
+                engine_kwargs["poolclass"] = NullPool
+            else:
+                engine_kwargs.update(
+                    pool_size=settings.db_pool_size,
+                    max_overflow=settings.db_max_overflow,
+                    pool_recycle=settings.db_pool_recycle,
+                    pool_pre_ping=settings.db_pool_pre_ping,
+                )
+
+        cls._engine = create_async_engine(url, **engine_kwargs)
 
         # Create all tables
         async with cls._engine.begin() as conn:
@@ -88,15 +106,9 @@ class Database:
         if not cls._initialized:
             await cls.initialize()
 
-        async with AsyncSession(cls._engine) as session:
-            try:
-                async with session.begin():
-                    yield session
-            except Exception:
-                await session.rollback()
-                raise
-            finally:
-                await session.close()
+        # begin() rolls back on error and the session closes on exit
+        async with AsyncSession(cls._engine) as session, session.begin():
+            yield session
 
     @classmethod
     async def close(cls) -> None:
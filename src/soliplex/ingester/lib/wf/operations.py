@@ -14,6 +14,7 @@ from sqlalchemy import or_
 from sqlalchemy.dialects.postgresql import JSONB
 from sqlmodel import select
 from sqlmodel import update
+from sqlmodel.ext.asyncio.session import AsyncSession
 
 from soliplex.ingester.lib.dal import get_storage_operator
 from soliplex.ingester.lib.models import ArtifactType
@@ -29,6 +30,7 @@ from soliplex.ingester.lib.models import RunGroup
 from soliplex.ingester.lib.models import RunStatus
 from soliplex.ingester.lib.models import RunStep
 from soliplex.ingester.lib.models import StepConfig
+from soliplex.ingester.lib.models import WorkflowDefinition
 from soliplex.ingester.lib.models import WorkflowRun
 from soliplex.ingester.lib.models import WorkflowRunWithDetails
 from soliplex.ingester.lib.models import WorkflowStepType
@@ -81,6 +83,7 @@ async def create_workflow_runs_for_batch(
 
         existing_runs = await get_workflow_runs_for_group(run_group.id)
         existing_ids = set([run.doc_id for run in existing_runs])
+        run_context = await load_run_context(run_group)
         runs = []
         for doc in batch_documents:
             if doc.hash not in existing_ids:
@@ -88,6 +91,7 @@ async def create_workflow_runs_for_batch(
                     run_group=run_group,
                     doc_id=doc.hash,
                     priority=priority,
+                    run_context=run_context,
                 )
                 runs.append(run)
         return run_group, runs
@@ -98,12 +102,14 @@ async def create_workflow_runs_for_batch(
             param_id=param_id,
         )
         batch_documents = await get_documents_in_batch(batch_id)
+        run_context = await load_run_context(run_group)
         runs = []
         for doc in batch_documents:
             run, steps = await create_workflow_run(
                 run_group=run_group,
                 doc_id=doc.hash,
                 priority=priority,
+                run_context=run_context,
             )
             runs.append(run)
         return run_group, runs
@@ -289,51 +295,41 @@ async def delete_run_group(run_group_id: int) -> dict[str, int]:
     """
     async with get_session() as session:
         # Step 1: Verify RunGroup exists
-        q = select(RunGroup).where(RunGroup.id == run_group_id)
+        q = select(RunGroup.id).where(RunGroup.id == run_group_id)
         result = await session.exec(q)
-        run_group = result.first()
-
-        if not run_group:
+        if result.first() is None:
             raise NotFoundError(f"RunGroup with id {run_group_id} does not exist")
 
-        # Step 2: Get all workflow run IDs in this group (needed for cascading deletes)
-        workflow_run_q = select(WorkflowRun.id).where(WorkflowRun.run_group_id == run_group_id)
-        workflow_run_ids_result = await session.exec(workflow_run_q)
-        workflow_run_ids = list(workflow_run_ids_result.all())
-
-        # Step 3: Delete RunSteps for all WorkflowRuns in this group
-        deleted_runsteps = 0
-        if workflow_run_ids:
-            runstep_delete_q = delete(RunStep).where(RunStep.workflow_run_id.in_(workflow_run_ids))
-            runstep_result = await session.exec(runstep_delete_q)
-            deleted_runsteps = runstep_result.rowcount  # type: ignore
-
-        # Step 4: Delete LifecycleHistory records (for both RunGroup and WorkflowRuns)
-        if workflow_run_ids:
-            lifecycle_delete_q = delete(LifecycleHistory).where(
-                or_(
-                    LifecycleHistory.run_group_id == run_group_id,
-                    LifecycleHistory.workflow_run_id.in_(workflow_run_ids),
-                )
-            )
-        else:
-            # No workflow runs, just delete lifecycle history for the run group
-            lifecycle_delete_q = delete(LifecycleHistory).where(LifecycleHistory.run_group_id == run_group_id)
+        # the group's workflow runs as a subquery, so dependents are deleted set-wise
+        # without fetching the ids or binding one parameter per run
+        workflow_run_ids = select(WorkflowRun.id).where(WorkflowRun.run_group_id == run_group_id)
+
+        # Step 2: Delete RunSteps for all WorkflowRuns in this group
+        runstep_delete_q = delete(RunStep).where(RunStep.workflow_run_id.in_(workflow_run_ids))
+        runstep_result = await session.exec(runstep_delete_q)
+        deleted_runsteps = runstep_result.rowcount  # type: ignore
 
+        # Step 3: Delete LifecycleHistory records (for both RunGroup and WorkflowRuns)
+        lifecycle_delete_q = delete(LifecycleHistory).where(
+            or_(
+                LifecycleHistory.run_group_id == run_group_id,
+                LifecycleHistory.workflow_run_id.in_(workflow_run_ids),
+            )
+        )
         lifecycle_result = await session.exec(lifecycle_delete_q)
         deleted_lifecyclehistory = lifecycle_result.rowcount  # type: ignore
 
-        # Step 5: Delete WorkflowRuns
+        # Step 4: Delete WorkflowRuns
         workflowrun_delete_q = delete(WorkflowRun).where(WorkflowRun.run_group_id == run_group_id)
         workflowrun_result = await session.exec(workflowrun_delete_q)
         deleted_workflowruns = workflowrun_result.rowcount  # type: ignore
 
-        # Step 6: Delete the RunGroup itself
+        # Step 5: Delete the RunGroup itself
         rungroup_delete_q = delete(RunGroup).where(RunGroup.id == run_group_id)
         rungroup_result = await session.exec(rungroup_delete_q)
         deleted_rungroups = rungroup_result.rowcount  # type: ignore
 
-        # Step 7: Commit the transaction
+        # Step 6: Commit the transaction
         await session.commit()
 
         # Return statistics
@@ -505,34 +501,54 @@ async def create_single_workflow_run(
         raise DocumentNotFoundError(doc_id)
 
 
+async def load_run_context(
+    run_group: RunGroup,
+) -> tuple[DocumentBatch, WorkflowDefinition, dict[WorkflowStepType, int]]:
+    """
+    Load what every workflow run in a run group shares.
+
+    Args:
+        run_group (RunGroup): the run group the runs belong to
+
+    Returns:
+        A tuple of the batch, the workflow definition and the map of
+        step type to step config ID
+    """
+    batch = await get_batch(run_group.batch_id)
+    if batch is None:
+        raise NotFoundError(f"Batch {run_group.batch_id} not found")
+    workflow_def = await get_workflow_definition(run_group.workflow_definition_id)
+    parameter_ids = await get_step_config_ids(run_group.param_definition_id)
+    return batch, workflow_def, parameter_ids
+
+
 async def create_workflow_run(
     run_group: RunGroup,
     doc_id: str,
     priority: int = 0,
+    run_context: tuple[DocumentBatch, WorkflowDefinition, dict[WorkflowStepType, int]] | None = None,
 ) -> tuple[WorkflowRun, list[RunStep]]:
     """
     Creates a new workflow run.
 
     Args:
-        workflow_definitinon_id (str | None): the ID of the workflow
-            definition. if None, the default workflow will be used
-        batch_id (int): the ID of the batch containing the document
+        run_group (RunGroup): the run group the run belongs to
         doc_id (str): the ID of the document being processed
         priority (int): the priority of the workflow run
-        param_id (str | None): the ID of the parameter set
+        run_context (tuple | None): result of load_run_context for
+            run_group; loaded here if None. callers creating many runs
+            for one group pass it to avoid repeating the lookups per run
 
     Returns:
         A tuple containing the newly created workflow run and a list
         of newly created run steps
     """
+    if run_context is None:
+        run_context = await load_run_context(run_group)
+    batch, workflow_def, parameter_ids = run_context
     batch_id = run_group.batch_id
     workflow_definition_id = run_group.workflow_definition_id
     param_id = run_group.param_definition_id
-    batch = await get_batch(batch_id)
-    if batch is None:
-        raise NotFoundError(f"Batch {batch_id} not found")
-    workflow_def = await get_workflow_definition(workflow_definition_id)
-    parameter_ids = await get_step_config_ids(param_id)
     created = datetime.datetime.now(datetime.UTC)
     args = {
         "param_id": param_id,
@@ -596,44 +612,102 @@ async def get_document_info_for_workflow_runs(
     if not workflow_runs:
         return {}
 
-    # Collect unique doc_ids
+    async with get_session() as session:
+        return await _load_document_info(session, workflow_runs)
+
+
+async def _load_document_info(
+    session: AsyncSession,
+    workflow_runs: list[WorkflowRun],
+) -> dict[str, DocumentInfo]:
+    """
+    Load DocumentInfo for workflow runs with one query per table on an open session.
+
+    Only the columns DocumentInfo needs are selected, and URIs are limited
+    to the batches of the given runs.
+    """
+    if not workflow_runs:
+        return {}
+
+    # Collect unique doc_ids and batch ids
     doc_ids = list({run.doc_id for run in workflow_runs})
+    batch_ids = list({run.batch_id for run in workflow_runs})
 
-    # Build result within session to avoid detached instance errors
-    result: dict[str, DocumentInfo] = {}
+    doc_q = select(Document.hash, Document.file_size, Document.mime_type).where(Document.hash.in_(doc_ids))
+    doc_rs = await session.exec(doc_q)
+    documents = {doc_hash: (file_size, mime_type) for doc_hash, file_size, mime_type in doc_rs.all()}
 
-    async with get_session() as session:
-        # Fetch all Documents in one query
-        doc_q = select(Document).where(Document.hash.in_(doc_ids))
-        doc_rs = await session.exec(doc_q)
-        documents = {doc.hash: doc for doc in doc_rs.all()}
-
-        # Fetch all DocumentURIs matching doc_hash
-        doc_uri_q = select(DocumentURI).where(DocumentURI.doc_hash.in_(doc_ids))
-        doc_uri_rs = await session.exec(doc_uri_q)
-        all_doc_uris = doc_uri_rs.all()
-
-        # Build a lookup by (batch_id, doc_hash)
-        doc_uris_by_batch_hash: dict[tuple[int, str], DocumentURI] = {}
-        for uri in all_doc_uris:
-            key = (uri.batch_id, uri.doc_hash)
-            doc_uris_by_batch_hash[key] = uri
-
-        # Build DocumentInfo for each workflow run's doc_id within the session
-        for run in workflow_runs:
-            doc = documents.get(run.doc_id)
-            doc_uri = doc_uris_by_batch_hash.get((run.batch_id, run.doc_id))
-
-            result[run.doc_id] = DocumentInfo(
-                uri=doc_uri.uri if doc_uri else None,
-                source=doc_uri.source if doc_uri else None,
-                file_size=doc.file_size if doc else None,
-                mime_type=doc.mime_type if doc else None,
-            )
+    doc_uri_q = select(DocumentURI.batch_id, DocumentURI.doc_hash, DocumentURI.uri, DocumentURI.source).where(
+        DocumentURI.doc_hash.in_(doc_ids), DocumentURI.batch_id.in_(batch_ids)
+    )
+    doc_uri_rs = await session.exec(doc_uri_q)
+    # Build a lookup by (batch_id, doc_hash)
+    doc_uris_by_batch_hash = {(batch, doc_hash): (uri, source) for batch, doc_hash, uri, source in doc_uri_rs.all()}
+
+    # Build DocumentInfo for each workflow run's doc_id
+    result: dict[str, DocumentInfo] = {}
+    for run in workflow_runs:
+        file_size, mime_type = documents.get(run.doc_id, (None, None))
+        uri, source = doc_uris_by_batch_hash.get((run.batch_id, run.doc_id), (None, None))
+        result[run.doc_id] = DocumentInfo(
+            uri=uri,
+            source=source,
+            file_size=file_size,
+            mime_type=mime_type,
+        )
 
     return result
 
 
+async def _select_workflow_page(
+    session: AsyncSession,
+    filters: list,
+    page: int | None,
+    rows_per_page: int | None,
+) -> tuple[list[WorkflowRun], int]:
+    """
+    Select workflow runs newest first, with the total filtered row count.
+
+    A paged request reads the total from a COUNT(*) OVER () column on the
+    same statement, so the page and the count come back in one round trip.
+    The separate count query only runs when the requested page is past the end.
+    An unpaged request uses the number of rows returned.
+
+    Args:
+        session: Open database session
+        filters: WHERE clauses applied to WorkflowRun
+        page: Page number (1-indexed). If None, returns all rows.
+        rows_per_page: Number of rows per page. If None, returns all rows.
+
+    Returns:
+        Tuple of (detached workflow runs, total count)
+    """
+    order = WorkflowRun.created_date.desc()
+    if page is None or rows_per_page is None:
+        rs = await session.exec(select(WorkflowRun).where(*filters).order_by(order))
+        res = rs.all()
+        total = len(res)
+    else:
+        q = (
+            select(WorkflowRun, func.count().over().label("total"))
+            .where(*filters)
+            .order_by(order)
+            .offset((page - 1) * rows_per_page)
+            .limit(rows_per_page)
+        )
+        rs = await session.exec(q)
+        rows = rs.all()
+        res = [run for run, _ in rows]
+        if rows:
+            total = rows[0][1]
+        else:
+            count_rs = await session.exec(select(func.count()).select_from(WorkflowRun).where(*filters))
+            total = count_rs.one()
+    for x in res:
+        session.expunge(x)
+    return res, total
+
+
 async def get_workflows(
     batch_id: int | None,
     include_steps: bool = False,
@@ -655,46 +729,25 @@ async def get_workflows(
         Tuple of (list of workflow runs, total count)
     """
     async with get_session() as session:
-        # Build base query
-        q = select(WorkflowRun)
-        if batch_id is not None:
-            q = q.where(WorkflowRun.batch_id == batch_id)
-
-        # Add consistent ordering (newest first)
-        q = q.order_by(WorkflowRun.created_date.desc())
-
-        # Get total count before pagination
-        count_q = select(func.count()).select_from(WorkflowRun)
+        filters = []
         if batch_id is not None:
-            count_q = count_q.where(WorkflowRun.batch_id == batch_id)
-        count_rs = await session.exec(count_q)
-        total = count_rs.one()
-
-        # Apply pagination if parameters provided
-        if page is not None and rows_per_page is not None:
-            offset = (page - 1) * rows_per_page
-            q = q.offset(offset).limit(rows_per_page)
-
-        # Execute query
-        rs = await session.exec(q)
-        res = rs.all()
-        for x in res:
-            session.expunge(x)
+            filters.append(WorkflowRun.batch_id == batch_id)
+        res, total = await _select_workflow_page(session, filters, page, rows_per_page)
 
         # If neither steps nor doc_info requested, return raw workflow runs
         if not include_steps and not include_doc_info:
             return res, total
 
-        # Load optional data
+        # Load optional data in batched queries on the same session
         steps_by_run_id = {}
         doc_info_by_doc_id = {}
 
         if include_steps:
             workflow_run_ids = [run.id for run in res]
-            steps_by_run_id = await get_steps_for_workflow_runs(workflow_run_ids)
+            steps_by_run_id = await _load_steps(session, workflow_run_ids)
 
         if include_doc_info:
-            doc_info_by_doc_id = await get_document_info_for_workflow_runs(res)
+            doc_info_by_doc_id = await _load_document_info(session, res)
 
         # Combine workflow runs with their details
         result = []
@@ -733,38 +786,16 @@ async def get_workflows_for_status(
         Tuple of (list of workflow runs, total count)
     """
     async with get_session() as session:
-        # Build base query
-        q = select(WorkflowRun).where(WorkflowRun.status == status)
-        if batch_id is not None:
-            q = q.where(WorkflowRun.batch_id == batch_id)
-
-        # Add consistent ordering (newest first)
-        q = q.order_by(WorkflowRun.created_date.desc())
-
-        # Get total count before pagination
-        count_q = select(func.count()).select_from(WorkflowRun).where(WorkflowRun.status == status)
+        filters = [WorkflowRun.status == status]
         if batch_id is not None:
-            count_q = count_q.where(WorkflowRun.batch_id == batch_id)
-
-        count_result = await session.exec(count_q)
-        total = count_result.one()
-
-        # Apply pagination if requested
-        if page is not None and rows_per_page is not None:
-            offset = (page - 1) * rows_per_page
-            q = q.offset(offset).limit(rows_per_page)
-
-        # Execute query
-        rs = await session.exec(q)
-        res = rs.all()
-        for x in res:
-            session.expunge(x)
+            filters.append(WorkflowRun.batch_id == batch_id)
+        res, total = await _select_workflow_page(session, filters, page, rows_per_page)
 
         if not include_doc_info:
             return res, total
 
-        # Load document info
-        doc_info_by_doc_id = await get_document_info_for_workflow_runs(res)
+        # Load document info on the same session
+        doc_info_by_doc_id = await _load_document_info(session, res)
 
         # Combine workflow runs with their document info
         result = []
@@ -968,20 +999,25 @@ async def get_steps_for_workflow_runs(workflow_run_ids: list[int]) -> dict[int,
         return {}
 
     async with get_session() as session:
-        q = select(RunStep).where(RunStep.workflow_run_id.in_(workflow_run_ids))
-        rs = await session.exec(q)
-        all_steps = rs.all()
-        for x in all_steps:
-            session.expunge(x)
+        return await _load_steps(session, workflow_run_ids)
+
+
+async def _load_steps(session: AsyncSession, workflow_run_ids: list[int]) -> dict[int, list[RunStep]]:
+    """Load and detach the steps of several workflow runs in one query on an open session."""
+    if not workflow_run_ids:
+        return {}
+
+    q = select(RunStep).where(RunStep.workflow_run_id.in_(workflow_run_ids))
+    rs = await session.exec(q)
+    all_steps = rs.all()
 
-        # Group steps by workflow_run_id
-        steps_by_run_id: dict[int, list[RunStep]] = {}
-        for step in all_steps:
-            if step.workflow_run_id not in steps_by_run_id:
-                steps_by_run_id[step.workflow_run_id] = []
-            steps_by_run_id[step.workflow_run_id].append(step)
+    # Group steps by workflow_run_id
+    steps_by_run_id: dict[int, list[RunStep]] = {}
+    for step in all_steps:
+        session.expunge(step)
+        steps_by_run_id.setdefault(step.workflow_run_id, []).append(step)
 
-        return steps_by_run_id
+    return steps_by_run_id
 
 
 async def get_run_steps(status: RunStatus) -> list[RunStep]:
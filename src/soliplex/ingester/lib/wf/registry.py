@@ -1,3 +1,5 @@
+import asyncio
+import json
 import logging
 from pathlib import Path
 
@@ -10,6 +12,7 @@ from soliplex.ingester.lib.config import get_settings
 from soliplex.ingester.lib.models import RunGroup
 from soliplex.ingester.lib.models import WorkflowDefinition
 from soliplex.ingester.lib.models import WorkflowParams
+from soliplex.ingester.lib.models import WorkflowStepType
 from soliplex.ingester.lib.models import get_session
 
 logger = logging.getLogger(__name__)
@@ -17,12 +20,31 @@ _workflow_registry = None
 _workflow_file_paths: dict[str, Path] = {}
 _param_registry = None
 _param_file_paths: dict[str, Path] = {}
+# store data_dir -> param sets writing there; rebuilt with the param registry
+_param_target_index: dict[str, list[WorkflowParams]] = {}
+# serialize cold loads so concurrent requests parse the YAML files once
+_workflow_lock = asyncio.Lock()
+_param_lock = asyncio.Lock()
+# (registry, encoded JSON summary list); rebuilt whenever the registry dict is replaced
+_workflow_list_json: tuple[dict, bytes] | None = None
+_param_list_json: tuple[dict, bytes] | None = None
+# yaml file path -> (mtime_ns, content) for the raw YAML endpoints
+_yaml_content_cache: dict[Path, tuple[int, str]] = {}
+# libyaml's C parser is much faster than the pure-Python one; both only build plain Python objects
+_yaml_loader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+if _yaml_loader is yaml.SafeLoader:
+    logger.warning("libyaml not available, falling back to the pure-Python YAML parser")
+
+
+def parse_yaml(yaml_str: str):
+    """Parse YAML with safe_load semantics, using libyaml when PyYAML was built with it."""
+    return yaml.load(yaml_str, Loader=_yaml_loader)
 
 
 async def load_workflow_definition(yaml_file: Path) -> WorkflowDefinition:
     async with aiofiles.open(yaml_file) as f:
         yaml_str = await f.read()
-    loaded = yaml.safe_load(yaml_str)
+    loaded = parse_yaml(yaml_str)
     wf_loaded = WorkflowDefinition.model_validate(loaded)
     return wf_loaded
 
@@ -33,20 +55,24 @@ async def load_workflow_registry(
     global _workflow_registry, _workflow_file_paths
     if _workflow_registry is not None and not force_reload:
         return _workflow_registry
-    settings = get_settings()
-    reg = {}
-    file_paths = {}
-    for p in Path(settings.workflow_dir).glob("*.yaml"):
-        logger.debug(f"loading workflow {p}")
-        wf = await load_workflow_definition(p)
-        if wf.id in reg:
-            msg = f"duplicate workflow id {wf.id}"
-            raise ValueError(msg)
-        reg[wf.id] = wf
-        file_paths[wf.id] = p
-    _workflow_registry = reg
-    _workflow_file_paths = file_paths
-    return reg
+    async with _workflow_lock:
+        # another request may have loaded the registry while this one waited
+        if _workflow_registry is not None and not force_reload:
+            return _workflow_registry
+        settings = get_settings()
+        reg = {}
+        file_paths = {}
+        for p in Path(settings.workflow_dir).glob("*.yaml"):
+            logger.debug(f"loading workflow {p}")
+            wf = await load_workflow_definition(p)
+            if wf.id in reg:
+                msg = f"duplicate workflow id {wf.id}"
+                raise ValueError(msg)
+            reg[wf.id] = wf
+            file_paths[wf.id] = p
+        _workflow_registry = reg
+        _workflow_file_paths = file_paths
+        return reg
 
 
 async def get_workflow_definition(
@@ -64,7 +90,28 @@ async def get_workflow_definition(
         raise KeyError(f"workflow {wf_id} not found")
 
 
-async def get_workflow_definition_yaml_content(wf_id: str) -> str | None:
+def _summary_json(items: list[dict]) -> bytes:
+    """Encode a summary list the way FastAPI's JSONResponse does."""
+    return json.dumps(items, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
+
+async def get_workflow_list_json() -> bytes:
+    """
+    Get the id/name list of workflow definitions as encoded JSON.
+
+    Returns
+    -------
+    bytes
+        JSON array of {"id", "name"} objects, cached until the registry reloads
+    """
+    global _workflow_list_json
+    reg = await load_workflow_registry()
+    if _workflow_list_json is None or _workflow_list_json[0] is not reg:
+        _workflow_list_json = (reg, _summary_json([{"id": x.id, "name": x.name} for x in reg.values()]))
+    return _workflow_list_json[1]
+
+
+async def get_workflow_definition_yaml_content(wf_id: str) -> tuple[int, str] | None:
     """
     Get the raw YAML content for a workflow definition.
 
@@ -75,8 +122,8 @@ async def get_workflow_definition_yaml_content(wf_id: str) -> str | None:
 
     Returns
     -------
-    str | None
-        Raw YAML content as string, or None if not found
+    tuple[int, str] | None
+        File mtime in nanoseconds and raw YAML content, or None if not found
     """
     global _workflow_file_paths
     # Ensure registry is loaded to populate file paths
@@ -87,9 +134,31 @@ async def get_workflow_definition_yaml_content(wf_id: str) -> str | None:
         if wf_id not in _workflow_file_paths:
             return None
 
-    file_path = _workflow_file_paths[wf_id]
+    return await read_yaml_content(_workflow_file_paths[wf_id])
+
+
+async def read_yaml_content(file_path: Path) -> tuple[int, str]:
+    """
+    Read a YAML file, reusing the cached content while its mtime is unchanged.
+
+    Parameters
+    ----------
+    file_path : Path
+        YAML file to read
+
+    Returns
+    -------
+    tuple[int, str]
+        File mtime in nanoseconds and file content
+    """
+    mtime_ns = (await aos.stat(file_path)).st_mtime_ns
+    cached = _yaml_content_cache.get(file_path)
+    if cached is not None and cached[0] == mtime_ns:
+        return cached
     async with aiofiles.open(file_path) as f:
-        return await f.read()
+        content = await f.read()
+    _yaml_content_cache[file_path] = (mtime_ns, content)
+    return mtime_ns, content
 
 
 def get_default_workflow_id() -> str:
@@ -105,7 +174,7 @@ def get_default_param_id() -> str:
 async def load_param_set(yaml_file: Path) -> WorkflowParams:
     async with aiofiles.open(yaml_file) as f:
         yaml_str = await f.read()
-    loaded = yaml.safe_load(yaml_str)
+    loaded = parse_yaml(yaml_str)
     wf_loaded = WorkflowParams.model_validate(loaded)
     return wf_loaded
 
@@ -123,7 +192,23 @@ async def get_param_set(param_id: str | None = None) -> WorkflowParams:
         raise KeyError(f"param set {param_id} not found")
 
 
-async def get_param_set_yaml_content(param_id: str) -> str | None:
+async def get_param_list_json() -> bytes:
+    """
+    Get the id/name/source list of parameter sets as encoded JSON.
+
+    Returns
+    -------
+    bytes
+        JSON array of {"id", "name", "source"} objects, cached until the registry reloads
+    """
+    global _param_list_json
+    reg = await load_param_registry()
+    if _param_list_json is None or _param_list_json[0] is not reg:
+        _param_list_json = (reg, _summary_json([{"id": x.id, "name": x.name, "source": x.source} for x in reg.values()]))
+    return _param_list_json[1]
+
+
+async def get_param_set_yaml_content(param_id: str) -> tuple[int, str] | None:
     """
     Get the raw YAML content for a parameter set.
 
@@ -134,8 +219,8 @@ async def get_param_set_yaml_content(param_id: str) -> str | None:
 
     Returns
     -------
-    str | None
-        Raw YAML content as string, or None if not found
+    tuple[int, str] | None
+        File mtime in nanoseconds and raw YAML content, or None if not found
     """
     global _param_file_paths
     # Ensure registry is loaded to populate file paths
@@ -146,30 +231,61 @@ async def get_param_set_yaml_content(param_id: str) -> str | None:
         if param_id not in _param_file_paths:
             return None
 
-    file_path = _param_file_paths[param_id]
-    async with aiofiles.open(file_path) as f:
-        return await f.read()
+    return await read_yaml_content(_param_file_paths[param_id])
 
 
 async def load_param_registry(
     force_reload: bool = False,
 ) -> dict[str, WorkflowParams]:
-    global _param_registry, _param_file_paths
+    global _param_registry, _param_file_paths, _param_target_index
     if _param_registry is not None and not force_reload:
         return _param_registry
-    settings = get_settings()
-    reg = {}
-    file_paths = {}
-    for p in Path(settings.param_dir).glob("*.yaml"):
-        logger.debug(f"loading param set {p}")
-        wf = await load_param_set(p)
-        if wf.id in reg:
-            raise ValueError(f"duplicate param set id {wf.id}")
-        reg[wf.id] = wf
-        file_paths[wf.id] = p
-    _param_registry = reg
-    _param_file_paths = file_paths
-    return reg
+    async with _param_lock:
+        # another request may have loaded the registry while this one waited
+        if _param_registry is not None and not force_reload:
+            return _param_registry
+        settings = get_settings()
+        reg = {}
+        file_paths = {}
+        for p in Path(settings.param_dir).glob("*.yaml"):
+            logger.debug(f"loading param set {p}")
+            wf = await load_param_set(p)
+            if wf.id in reg:
+                raise ValueError(f"duplicate param set id {wf.id}")
+            reg[wf.id] = wf
+            file_paths[wf.id] = p
+        _param_registry = reg
+        _param_file_paths = file_paths
+        _param_target_index = build_param_target_index(reg)
+        return reg
+
+
+def build_param_target_index(reg: dict[str, WorkflowParams]) -> dict[str, list[WorkflowParams]]:
+    """Group param sets by the data_dir of their store step."""
+    index: dict[str, list[WorkflowParams]] = {}
+    store = WorkflowStepType.STORE
+    for pset in reg.values():
+        if (store_step := pset.config.get(store)) and (data_dir := store_step.get("data_dir")) is not None:
+            index.setdefault(data_dir, []).append(pset)
+    return index
+
+
+async def get_param_sets_by_target(target: str) -> list[WorkflowParams]:
+    """
+    Get the parameter sets whose store step writes to a data directory.
+
+    Parameters
+    ----------
+    target : str
+        Store data_dir to match
+
+    Returns
+    -------
+    list[WorkflowParams]
+        Matching parameter sets, empty if none
+    """
+    await load_param_registry()
+    return list(_param_target_index.get(target, []))
 
 
 async def save_param_set(yaml_content: str, overwrite: bool = False) -> Path:
@@ -195,7 +311,7 @@ async def save_param_set(yaml_content: str, overwrite: bool = False) -> Path:
     """
     settings = get_settings()
     param_dir = Path(settings.param_dir)
-    param_set = yaml.safe_load(yaml_content)
+    param_set = await asyncio.to_thread(parse_yaml, yaml_content)
     if "source" not in param_set:
         yaml_content = "source: user\n" + yaml_content
 
@@ -216,6 +332,7 @@ async def save_param_set(yaml_content: str, overwrite: bool = False) -> Path:
     # Clear registry cache to pick up new file
     global _param_registry
     _param_registry = None
+    _yaml_content_cache.pop(file_path, None)
 
     return file_path
 
@@ -271,6 +388,7 @@ async def delete_param_set(param_id: str) -> bool:
         # Clear registry cache
         global _param_registry
         _param_registry = None
+        _yaml_content_cache.pop(file_path, None)
         return True
 
     return False
@@ -15,8 +15,10 @@ from fastapi.staticfiles import StaticFiles
 from soliplex.ingester.lib import operations
 from soliplex.ingester.lib.auth import get_current_user
 from soliplex.ingester.lib.config import get_settings
+from soliplex.ingester.lib.http_cache import ETagMiddleware
 from soliplex.ingester.lib.models import Database
 
+from .errors import add_exception_handlers
 from .routes.batch import batch_router
 from .routes.document import doc_router
 from .routes.lancedb import lancedb_router
@@ -47,6 +49,17 @@ async def lifespan(app: FastAPI):
 
 
 app = FastAPI(lifespan=lifespan)
+add_exception_handlers(app)
+# workflow definitions and param sets change only on upload/delete; let clients revalidate cheaply
+app.add_middleware(
+    ETagMiddleware,
+    paths=(
+        "/api/v1/workflow/definitions",
+        "/api/v1/workflow/param-sets",
+        "/api/v1/workflow/param_sets/target/",
+    ),
+)
+# added last so CORS headers are applied to 304 responses as well
 app.add_middleware(
     CORSMiddleware,
     allow_origins=["*"],  # Allows all origins
@@ -0,0 +1,77 @@
+"""
+Exception handlers for the Soliplex Ingester API.
+
+Routes let domain errors propagate and these handlers turn them into the
+API's ``{"error": ...}`` responses.
+"""
+
+import logging
+
+from fastapi import FastAPI
+from fastapi import Request
+from fastapi import Response
+from fastapi import status
+from fastapi.responses import JSONResponse
+from starlette.middleware.base import BaseHTTPMiddleware
+from starlette.middleware.base import RequestResponseEndpoint
+
+from soliplex.ingester.lib import operations
+from soliplex.ingester.lib.wf import operations as wf_ops
+
+logger = logging.getLogger(__name__)
+
+
+class BadRequestError(ValueError):
+    """A request parameter was invalid; rendered as a 400 response."""
+
+
+# only errors that describe the request; anything else is a server fault
+ERROR_STATUS: dict[type[Exception], int] = {
+    wf_ops.NotFoundError: status.HTTP_404_NOT_FOUND,
+    operations.DocumentNotFoundError: status.HTTP_404_NOT_FOUND,
+    operations.BatchNotFoundError: status.HTTP_404_NOT_FOUND,
+    operations.DocumentURINotFoundError: status.HTTP_404_NOT_FOUND,
+    BadRequestError: status.HTTP_400_BAD_REQUEST,
+}
+
+
+async def error_response(request: Request, exc: Exception) -> JSONResponse:
+    """Render a domain exception as an error response with the status mapped from its type."""
+    # handlers are looked up along the MRO, so exc may be a subclass of a mapped type
+    status_code = next(ERROR_STATUS[t] for t in type(exc).__mro__ if t in ERROR_STATUS)
+    return JSONResponse(status_code=status_code, content={"error": str(exc)})
+
+
+class ServerErrorMiddleware(BaseHTTPMiddleware):
+    """
+    Render any other exception as a 500 ``{"error": ...}`` response.
+
+    Starlette runs handlers registered for ``Exception`` in its outermost
+    middleware, outside CORSMiddleware, so their responses carry no CORS
+    headers. This middleware is added before CORSMiddleware instead, which
+    keeps it inside the CORS layer.
+    """
+
+    async def dispatch(self, request: Request, call_next: RequestResponseEndpoint) -> Response:
+        try:
+            return await call_next(request)
+        except Exception as e:
+            logger.exception("unhandled error for %s %s", request.method, request.url.path, exc_info=e)
+            return JSONResponse(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, content={"error": str(e)})
+
+
+def add_exception_handlers(app: FastAPI) -> None:
+    """
+    Register the error handlers on an application.
+
+    Call this before adding CORSMiddleware so that 500 responses also get
+    CORS headers.
+
+    Parameters
+    ----------
+    app : FastAPI
+        Application to register the handlers on
+    """
+    for exc_type in ERROR_STATUS:
+        app.add_exception_handler(exc_type, error_response)
+    app.add_middleware(ServerErrorMiddleware)
@@ -73,14 +73,13 @@ async def start_workflows(
     summary="Get batch status document count and parsed count",
 )
 async def batch_status(batch_id: int, response: Response):
-    batch = await operations.get_batch(batch_id)
+    # the lookups are independent, so fetch the batch alongside its documents and runs
+    batch, docs, workflows = await asyncio.gather(
+        operations.get_batch(batch_id),
+        operations.get_documents_in_batch(batch_id),
+        wf_ops.get_workflows(batch_id),
+    )
     if batch:
-        grp = asyncio.gather(
-            operations.get_documents_in_batch(batch_id),
-            wf_ops.get_workflows(batch_id),
-        )
-        docs, workflows = await grp
-
         completed = [x for x in workflows[0] if x.status == RunStatus.COMPLETED]
         stat_counts = collections.Counter([x.status.value for x in workflows[0]])
         batchres = {
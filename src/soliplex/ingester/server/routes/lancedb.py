@@ -1,19 +1,30 @@
 """LanceDB database management routes."""
 
+import asyncio
+import hashlib
 import json
 import logging
+import os
+import time
+from datetime import datetime
+from importlib.metadata import version as pkg_version
 from pathlib import Path
 
+import lancedb
 from fastapi import APIRouter
 from fastapi import Depends
 from fastapi import Query
+from fastapi import Request
 from fastapi import Response
 from fastapi import status
+from fastapi.concurrency import run_in_threadpool
+from fastapi.responses import JSONResponse
 from haiku.rag.app import HaikuRAGApp
 from haiku.rag.config import get_config
 
 from soliplex.ingester.lib.auth import get_current_user
 from soliplex.ingester.lib.config import get_settings
+from soliplex.ingester.lib.http_cache import etag_matches
 
 logger = logging.getLogger(__name__)
 
@@ -24,6 +35,62 @@ lancedb_router = APIRouter(
 )
 
 
+def _package_version(name: str) -> str:
+    """Return the installed version of a package, or "unknown"."""
+    try:
+        return pkg_version(name)
+    except Exception:
+        return "unknown"
+
+
+# resolved once at import; installed package versions do not change at runtime
+LANCEDB_VERSION = _package_version("lancedb")
+HAIKU_RAG_VERSION = _package_version("haiku.rag-slim")
+
+CONNECTION_TTL = 60.0
+
+_conn_cache: dict[Path, tuple[lancedb.DBConnection, float]] = {}
+# one lock per path, so a slow connect to one database does not hold up the others
+_conn_locks: dict[Path, asyncio.Lock] = {}
+# db_path -> (tree etag, documents version count, chunks version count)
+_version_cache: dict[Path, tuple[str, int, int]] = {}
+# db_path -> (settings table version, parsed settings)
+_settings_cache: dict[Path, tuple[int, tuple[str, str | None, str | None, int | None]]] = {}
+
+
+def _evict_expired_connections(now: float) -> None:
+    """Drop connections older than CONNECTION_TTL, with their locks unless a connect is in flight."""
+    for path, (_, opened) in list(_conn_cache.items()):
+        if now - opened >= CONNECTION_TTL:
+            del _conn_cache[path]
+            lock = _conn_locks.get(path)
+            if lock is not None and not lock.locked():
+                del _conn_locks[path]
+
+
+async def get_connection(db_path: Path) -> lancedb.DBConnection:
+    """Return a LanceDB connection for db_path, reusing one opened in the last CONNECTION_TTL seconds."""
+    _evict_expired_connections(time.monotonic())
+    lock = _conn_locks.setdefault(db_path, asyncio.Lock())
+    async with lock:
+        # another request may have connected while this one waited for the lock
+        now = time.monotonic()
+        cached = _conn_cache.get(db_path)
+        if cached is not None and now - cached[1] < CONNECTION_TTL:
+            return cached[0]
+        db_conn = await run_in_threadpool(lancedb.connect, db_path)
+        _conn_cache[db_path] = (db_conn, now)
+        return db_conn
+
+
+def clear_caches() -> None:
+    """Drop all cached LanceDB connections and table metadata."""
+    _conn_cache.clear()
+    _conn_locks.clear()
+    _version_cache.clear()
+    _settings_cache.clear()
+
+
 def create_app(db: Path | None = None, read_only: bool = False) -> HaikuRAGApp:
     """Create HaikuRAGApp with loaded config and resolved database path.
 
@@ -54,13 +121,132 @@ def get_folder_size(path: Path) -> int:
     return total
 
 
+_BYTE_UNITS = ("B", "KB", "MB", "GB", "TB", "PB")
+
+
 def format_bytes(size: int) -> str:
     """Format bytes to human-readable string."""
-    for unit in ["B", "KB", "MB", "GB", "TB"]:
-        if size < 1024:
-            return f"{size:.2f} {unit}"
-        size /= 1024
-    return f"{size:.2f} PB"
+    if size < 1024:
+        return f"{size:.2f} B"
+    # each unit step is 2**10, so the bit length picks the unit without a loop
+    exp = min(int(size).bit_length() - 1, 50) // 10
+    return f"{size / (1 << (10 * exp)):.2f} {_BYTE_UNITS[exp]}"
+
+
+# listing only needs these; skipping content and docling_document avoids reading the large columns
+DOCUMENT_LIST_COLUMNS = ["id", "uri", "title", "metadata", "created_at", "updated_at"]
+# ids per chunk-count query when a listing is paged
+CHUNK_COUNT_BATCH = 500
+
+
+def read_stored_settings(settings_tbl) -> tuple[str, str | None, str | None, int | None]:
+    """Read the haiku.rag settings row.
+
+    Returns:
+        (stored_version, embed_provider, embed_model, vector_dim)
+    """
+    stored_version = "unknown"
+    embed_provider = None
+    embed_model = None
+    vector_dim = None
+    # only the settings column is needed; skip decoding the rest of the row
+    arrow = settings_tbl.search().where("id = 'settings'").select(["settings"]).limit(1).to_arrow()
+    rows = arrow.to_pylist() if arrow is not None else []
+    if rows:
+        raw = rows[0].get("settings") or "{}"
+        data = json.loads(raw) if isinstance(raw, str) else (raw or {})
+        stored_version = str(data.get("version", stored_version))
+        embeddings = data.get("embeddings", {})
+        embed_model_obj = embeddings.get("model", {})
+        embed_provider = embed_model_obj.get("provider")
+        embed_model = embed_model_obj.get("name")
+        vector_dim = embed_model_obj.get("vector_dim")
+    return stored_version, embed_provider, embed_model, vector_dim
+
+
+def count_chunks(chunks_table, document_ids: list[str] | None = None) -> dict[str, int]:
+    """Count chunks per document id.
+
+    With document_ids None, runs one grouped count over the whole table.
+    Otherwise the ids are sent in batches of CHUNK_COUNT_BATCH so that each
+    IN predicate stays small.
+    """
+    if document_ids is None:
+        batches = [None]
+    else:
+        batches = [document_ids[i : i + CHUNK_COUNT_BATCH] for i in range(0, len(document_ids), CHUNK_COUNT_BATCH)]
+
+    counts: dict[str, int] = {}
+    for batch in batches:
+        query = chunks_table.search()
+        if batch is not None:
+            ids = ", ".join("'" + doc_id.replace("'", "''") + "'" for doc_id in batch)
+            query = query.where(f"document_id IN ({ids})")
+        grouped = query.select(["document_id"]).to_arrow().group_by("document_id").aggregate([("document_id", "count")])
+        counts.update(zip(grouped["document_id"].to_pylist(), grouped["document_id_count"].to_pylist(), strict=True))
+    return counts
+
+
+def query_documents(
+    db_conn: lancedb.DBConnection,
+    limit: int | None = None,
+    offset: int | None = None,
+    filter: str | None = None,
+) -> list[dict]:
+    """Read document listing rows straight from the haiku.rag documents and chunks tables.
+
+    Mirrors haiku.rag's DocumentRepository.list_all, but projects only the listed
+    columns and builds the response dicts from the Arrow rows instead of
+    constructing a Document model per row. Chunk counts come from a grouped
+    count over the chunks table; see count_chunks.
+    """
+    query = db_conn.open_table("documents").search()
+    if filter is not None:
+        query = query.where(filter)
+    if offset is not None:
+        query = query.offset(offset)
+    if limit is not None:
+        query = query.limit(limit)
+    rows = query.select(DOCUMENT_LIST_COLUMNS).to_arrow().to_pylist()
+
+    chunk_counts: dict[str, int] = {}
+    if rows:
+        # an unpaged listing covers (nearly) every document, so count the whole table instead of filtering by id
+        document_ids = None if limit is None else [row["id"] for row in rows]
+        chunk_counts = count_chunks(db_conn.open_table("chunks"), document_ids)
+
+    # same fallback haiku.rag applies when building a Document from a row without timestamps
+    now = datetime.now().isoformat()
+    doc_list = []
+    for row in rows:
+        doc_dict = {
+            "id": row["id"],
+            "uri": row["uri"],
+            "title": row["title"],
+            # timestamps are stored as ISO strings already
+            "created_at": row["created_at"] or now,
+            "updated_at": row["updated_at"] or now,
+            "chunk_count": chunk_counts.get(row["id"], 0),
+        }
+        metadata = json.loads(row["metadata"]) if row["metadata"] else None
+        if metadata:
+            doc_dict["metadata"] = metadata
+        doc_list.append(doc_dict)
+    return doc_list
+
+
+def tree_etag(root: Path) -> str:
+    """Build a weak ETag from the modification times of every directory under root.
+
+    LanceDB never rewrites data files in place: writes, deletes and compaction
+    add or remove files, which bumps the parent directory's mtime. Hashing the
+    directory mtimes therefore tracks content changes without stat-ing each file.
+    """
+    digest = hashlib.blake2b(digest_size=16)
+    for dirpath, dirnames, _ in os.walk(str(root)):
+        dirnames.sort()
+        digest.update(f"{dirpath}:{os.stat(dirpath).st_mtime_ns};".encode())
+    return f'W/"{digest.hexdigest()}"'
 
 
 def resolve_lancedb_path(db_name: str, lancedb_dir: str) -> Path:
@@ -72,11 +258,12 @@ def resolve_lancedb_path(db_name: str, lancedb_dir: str) -> Path:
 
 
 @lancedb_router.get("/list", status_code=status.HTTP_200_OK, summary="List all LanceDB databases")
-async def list_databases():
+async def list_databases(request: Request, response: Response):
     """
     List all folders in the lancedb_dir.
 
-    Returns each folder's name and storage size.
+    Returns each folder's name and storage size. Supports conditional
+    requests via ETag / If-None-Match.
     """
     settings = get_settings()
     lancedb_dir = Path(settings.lancedb_dir)
@@ -89,6 +276,12 @@ async def list_databases():
             "message": "LanceDB directory does not exist",
         }
 
+    # the walk stats every directory; keep it off the event loop
+    etag = await run_in_threadpool(tree_etag, lancedb_dir)
+    if etag_matches(request, etag):
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers={"ETag": etag})
+    response.headers["ETag"] = etag
+
     databases = []
     try:
         for entry in sorted(lancedb_dir.rglob("chunks.lance")):
@@ -116,6 +309,7 @@ async def list_databases():
 
 @lancedb_router.get("/info", status_code=status.HTTP_200_OK, summary="Get LanceDB database info")
 async def get_info(
+    request: Request,
     response: Response,
     db: str = Query(..., description="Database name relative to lancedb_dir"),
 ):
@@ -126,34 +320,26 @@ async def get_info(
 
     The db parameter is relative to lancedb_dir and will have
     '/haiku.rag.lancedb' appended if not already present.
+    Supports conditional requests via ETag / If-None-Match.
     """
-    from importlib.metadata import version as pkg_version
-
-    import lancedb
-
     settings = get_settings()
     db_path = resolve_lancedb_path(db, settings.lancedb_dir)
 
-    if not db_path.exists():
+    # lancedb.connect() creates missing directories, so this stat cannot be dropped
+    if not db_path.is_dir():
         response.status_code = status.HTTP_404_NOT_FOUND
         return {
             "status": "error",
             "error": f"Database not found: {db_path}",
         }
 
-    # Get version info
-    try:
-        ldb_version = pkg_version("lancedb")
-    except Exception:
-        ldb_version = "unknown"
-    try:
-        hr_version = pkg_version("haiku.rag-slim")
-    except Exception:
-        hr_version = "unknown"
+    etag = await run_in_threadpool(tree_etag, db_path)
+    if etag_matches(request, etag):
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers={"ETag": etag})
 
     # Connect to database
     try:
-        db_conn = lancedb.connect(db_path)
+        db_conn = await get_connection(db_path)
         table_names = set(db_conn.list_tables().tables)
 
     except Exception as e:
@@ -188,46 +374,52 @@ async def get_info(
     if "settings" in table_names:
         try:
             settings_tbl = db_conn.open_table("settings")
-            arrow = settings_tbl.search().where("id = 'settings'").limit(1).to_arrow()
-            rows = arrow.to_pylist() if arrow is not None else []
-            if rows:
-                raw = rows[0].get("settings") or "{}"
-                data = json.loads(raw) if isinstance(raw, str) else (raw or {})
-                stored_version = str(data.get("version", stored_version))
-                embeddings = data.get("embeddings", {})
-                embed_model_obj = embeddings.get("model", {})
-                embed_provider = embed_model_obj.get("provider")
-                embed_model = embed_model_obj.get("name")
-                vector_dim = embed_model_obj.get("vector_dim")
+            # the settings row rarely changes; re-read it only when the table version moves
+            settings_version = settings_tbl.version
+            cached_settings = _settings_cache.get(db_path)
+            if cached_settings is not None and cached_settings[0] == settings_version:
+                stored_settings = cached_settings[1]
+            else:
+                stored_settings = read_stored_settings(settings_tbl)
+                _settings_cache[db_path] = (settings_version, stored_settings)
+            stored_version, embed_provider, embed_model, vector_dim = stored_settings
         except Exception as e:
             logger.warning(f"Could not read settings table: {e}")
 
-    # Get table version counts
+    # Get table version counts; listing reads every manifest, so reuse the
+    # previous counts while the database tree is unchanged
     doc_versions = 0
     chunk_versions = 0
-    try:
-        if "documents" in table_names:
-            doc_versions = len(list(db_conn.open_table("documents").list_versions()))
-        if "chunks" in table_names:
-            chunk_versions = len(list(db_conn.open_table("chunks").list_versions()))
-    except Exception:
-        pass
+    cached_versions = _version_cache.get(db_path)
+    if cached_versions is not None and cached_versions[0] == etag:
+        _, doc_versions, chunk_versions = cached_versions
+    else:
+        try:
+            if "documents" in table_names:
+                doc_versions = len(db_conn.open_table("documents").list_versions())
+            if "chunks" in table_names:
+                chunk_versions = len(db_conn.open_table("chunks").list_versions())
+            _version_cache[db_path] = (etag, doc_versions, chunk_versions)
+        except Exception:
+            pass
 
     # Extract stats
-    num_docs = table_stats["documents"].get("num_rows", 0)
-    doc_bytes = table_stats["documents"].get("total_bytes", 0)
-    num_chunks = table_stats["chunks"].get("num_rows", 0)
-    chunk_bytes = table_stats["chunks"].get("total_bytes", 0)
-    has_vector_index = table_stats["chunks"].get("has_vector_index", False)
-    num_indexed_rows = table_stats["chunks"].get("num_indexed_rows", 0)
-    num_unindexed_rows = table_stats["chunks"].get("num_unindexed_rows", 0)
-
+    doc_stats, chunk_stats = table_stats["documents"], table_stats["chunks"]
+    num_docs = doc_stats.get("num_rows", 0)
+    doc_bytes = doc_stats.get("total_bytes", 0)
+    num_chunks = chunk_stats.get("num_rows", 0)
+    chunk_bytes = chunk_stats.get("total_bytes", 0)
+    has_vector_index = chunk_stats.get("has_vector_index", False)
+    num_indexed_rows = chunk_stats.get("num_indexed_rows", 0)
+    num_unindexed_rows = chunk_stats.get("num_unindexed_rows", 0)
+
+    response.headers["ETag"] = etag
     return {
         "status": "ok",
         "path": str(db_path),
         "versions": {
-            "lancedb": ldb_version,
-            "haiku_rag": hr_version,
+            "lancedb": LANCEDB_VERSION,
+            "haiku_rag": HAIKU_RAG_VERSION,
             "stored_version": stored_version,
         },
         "embeddings": {
@@ -294,7 +486,7 @@ async def list_documents(
     settings = get_settings()
     db_path = resolve_lancedb_path(db, settings.lancedb_dir)
 
-    if not db_path.exists():
+    if not db_path.is_dir():
         response.status_code = status.HTTP_404_NOT_FOUND
         return {
             "status": "error",
@@ -302,44 +494,18 @@ async def list_documents(
         }
 
     try:
-        from haiku.rag.client import HaikuRAG
-        from haiku.rag.config import get_config
-
-        config = get_config()
+        db_conn = await get_connection(db_path)
+        doc_list = await run_in_threadpool(query_documents, db_conn, limit=limit, offset=offset, filter=filter)
 
-        async with HaikuRAG(
-            db_path=db_path,
-            config=config,
-            read_only=True,
-        ) as client:
-            documents = await client.list_documents(
-                limit=limit,
-                offset=offset,
-                filter=filter,
-            )
-
-            # Convert documents to serializable format
-            doc_list = []
-            for doc in documents:
-                doc_dict = {
-                    "id": doc.id,
-                    "uri": doc.uri,
-                    "title": getattr(doc, "title", None),
-                    "created_at": doc.created_at.isoformat() if getattr(doc, "created_at", None) else None,
-                    "updated_at": doc.updated_at.isoformat() if getattr(doc, "updated_at", None) else None,
-                    "chunk_count": getattr(doc, "chunk_count", None),
-                }
-                # Include metadata if present
-                if hasattr(doc, "metadata") and doc.metadata:
-                    doc_dict["metadata"] = doc.metadata
-                doc_list.append(doc_dict)
-
-            return {
+        # rows are already plain JSON types; skip the per-value jsonable_encoder walk
+        return JSONResponse(
+            {
                 "status": "ok",
                 "path": str(db_path),
                 "document_count": len(doc_list),
                 "documents": doc_list,
             }
+        )
 
     except Exception as e:
         logger.exception("Error listing documents", exc_info=e)
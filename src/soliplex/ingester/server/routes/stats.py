@@ -2,7 +2,6 @@ import logging
 
 from fastapi import APIRouter
 from fastapi import Depends
-from fastapi import Response
 from fastapi import status
 
 from soliplex.ingester.lib.auth import get_current_user
@@ -18,13 +17,8 @@ stats_router = APIRouter(prefix="/api/v1/stats", tags=["stats"], dependencies=[D
     status_code=status.HTTP_200_OK,
     summary="get workflow durations by run_group_id",
 )
-async def get_run_group_durations(run_group_id: int, response: Response):
-    try:
-        return await wf_ops.get_run_group_durations(run_group_id)
-    except Exception as e:
-        logger.exception("error getting run group durations", exc_info=e)
-        response.status_code = status.HTTP_500_INTERNAL_SERVER_ERROR
-        return {"error": str(e)}
+async def get_run_group_durations(run_group_id: int):
+    return await wf_ops.get_run_group_durations(run_group_id)
 
 
 @stats_router.get(
@@ -32,10 +26,5 @@ async def get_run_group_durations(run_group_id: int, response: Response):
     status_code=status.HTTP_200_OK,
     summary="get workflow step stats by run_group_id",
 )
-async def get_run_group_step_stats(run_group_id: int, response: Response):
-    try:
-        return await wf_ops.get_step_stats(run_group_id)
-    except Exception as e:
-        logger.exception("error getting run group step stats", exc_info=e)
-        response.status_code = status.HTTP_500_INTERNAL_SERVER_ERROR
-        return {"error": str(e)}
+async def get_run_group_step_stats(run_group_id: int):
+    return await wf_ops.get_step_stats(run_group_id)
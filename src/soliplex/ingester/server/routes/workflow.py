@@ -1,27 +1,97 @@
 import logging
+import time
 
 import yaml
 from fastapi import APIRouter
 from fastapi import Depends
 from fastapi import Form
+from fastapi import Request
 from fastapi import Response
 from fastapi import status
+from fastapi.concurrency import run_in_threadpool
+from fastapi.responses import JSONResponse
+from pydantic import TypeAdapter
 
 from soliplex.ingester.lib import workflow as workflow
 from soliplex.ingester.lib.auth import get_current_user
+from soliplex.ingester.lib.http_cache import last_modified
+from soliplex.ingester.lib.http_cache import not_modified_since
+from soliplex.ingester.lib.models import LifecycleHistory
 from soliplex.ingester.lib.models import PaginatedResponse
 from soliplex.ingester.lib.models import RunGroup
 from soliplex.ingester.lib.models import WorkflowParams
 from soliplex.ingester.lib.models import WorkflowRun
 from soliplex.ingester.lib.models import WorkflowRunWithDetails
-from soliplex.ingester.lib.models import WorkflowStepType
 from soliplex.ingester.lib.wf import operations as wf_ops
 from soliplex.ingester.lib.wf import registry as wf_registry
+from soliplex.ingester.server.errors import BadRequestError
 
 logger = logging.getLogger(__name__)
 
 wf_router = APIRouter(prefix="/api/v1/workflow", tags=["workflow"], dependencies=[Depends(get_current_user)])
 
+# serializes lifecycle records straight to JSON bytes without intermediate dicts
+_lifecycle_adapter = TypeAdapter(list[LifecycleHistory])
+# parameterized once at import; subscripting a generic model per request repeats the class lookup
+_PagedRun = PaginatedResponse[WorkflowRun]
+_PagedDetails = PaginatedResponse[WorkflowRunWithDetails]
+
+# run group stats are polled by the UI; serve repeats from memory for a few seconds
+RUN_GROUP_STATS_TTL = 10.0
+_stats_cache: dict[int, tuple[float, dict]] = {}
+
+
+def clear_caches() -> None:
+    """Drop all cached run group stats."""
+    _stats_cache.clear()
+
+
+def _validate_pagination(page: int | None, rows_per_page: int | None) -> int | None:
+    """
+    Validate pagination parameters and apply the default page size.
+
+    Parameters
+    ----------
+    page : int | None
+        1-based page number, or None for no pagination
+    rows_per_page : int | None
+        Page size, defaults to 10 when page is given
+
+    Returns
+    -------
+    int | None
+        Effective rows_per_page
+
+    Raises
+    ------
+    BadRequestError
+        If page or rows_per_page is less than 1
+    """
+    if page is not None and page < 1:
+        raise BadRequestError("page must be >= 1")
+    if page is not None and rows_per_page is None:
+        rows_per_page = 10
+    if rows_per_page is not None and rows_per_page < 1:
+        raise BadRequestError("rows_per_page must be >= 1")
+    return rows_per_page
+
+
+def _paginate(
+    items: list,
+    total: int,
+    page: int | None,
+    rows_per_page: int,
+    response_cls: type[PaginatedResponse],
+) -> PaginatedResponse:
+    """Wrap one page of items in a paginated response with total_pages computed."""
+    return response_cls(
+        items=items,
+        total=total,
+        page=page or 1,
+        rows_per_page=rows_per_page,
+        total_pages=(total + rows_per_page - 1) // rows_per_page,
+    )
+
 
 @wf_router.get(
     "/",
@@ -34,12 +104,7 @@ async def get_workflows(
     include_doc_info: bool = False,
     page: int | None = None,
     rows_per_page: int | None = None,
-) -> (
-    list[WorkflowRun]
-    | list[WorkflowRunWithDetails]
-    | PaginatedResponse[WorkflowRun]
-    | PaginatedResponse[WorkflowRunWithDetails]
-):
+) -> list[WorkflowRun] | list[WorkflowRunWithDetails] | _PagedRun | _PagedDetails:
     """
     Get workflow runs with optional pagination.
 
@@ -47,17 +112,7 @@ async def get_workflows(
     When page provided: Returns paginated response with metadata
     Results sorted by created_date descending (newest first)
     """
-    # Validate pagination parameters
-    if page is not None and page < 1:
-        raise ValueError("page must be >= 1")
-
-    # Set default rows_per_page if page is provided but rows_per_page is not
-    if page is not None and rows_per_page is None:
-        rows_per_page = 10
-
-    # Validate rows_per_page
-    if rows_per_page is not None and rows_per_page < 1:
-        raise ValueError("rows_per_page must be >= 1")
+    rows_per_page = _validate_pagination(page, rows_per_page)
 
     # Get data from operations layer
     items, total = await wf_ops.get_workflows(
@@ -72,26 +127,8 @@ async def get_workflows(
     if page is None and rows_per_page is None:
         return items
 
-    # Calculate total_pages
-    total_pages = (total + rows_per_page - 1) // rows_per_page if rows_per_page > 0 else 0
-
-    # Return paginated response
-    if include_steps or include_doc_info:
-        return PaginatedResponse[WorkflowRunWithDetails](
-            items=items,
-            total=total,
-            page=page or 1,
-            rows_per_page=rows_per_page or 10,
-            total_pages=total_pages,
-        )
-    else:
-        return PaginatedResponse[WorkflowRun](
-            items=items,
-            total=total,
-            page=page or 1,
-            rows_per_page=rows_per_page or 10,
-            total_pages=total_pages,
-        )
+    response_cls = _PagedDetails if include_steps or include_doc_info else _PagedRun
+    return _paginate(items, total, page, rows_per_page, response_cls)
 
 
 @wf_router.get(
@@ -105,12 +142,7 @@ async def get_workflows_for_status(
     include_doc_info: bool = False,
     page: int | None = None,
     rows_per_page: int | None = None,
-) -> (
-    list[WorkflowRun]
-    | list[WorkflowRunWithDetails]
-    | PaginatedResponse[WorkflowRun]
-    | PaginatedResponse[WorkflowRunWithDetails]
-):
+) -> list[WorkflowRun] | list[WorkflowRunWithDetails] | _PagedRun | _PagedDetails:
     """
     Get workflow runs filtered by status with optional pagination.
 
@@ -118,17 +150,7 @@ async def get_workflows_for_status(
     When page provided: Returns paginated response with metadata
     Results sorted by created_date descending (newest first)
     """
-    # Validate pagination parameters
-    if page is not None and page < 1:
-        raise ValueError("page must be >= 1")
-
-    # Set default rows_per_page if page is provided but rows_per_page is not
-    if page is not None and rows_per_page is None:
-        rows_per_page = 10
-
-    # Validate rows_per_page
-    if rows_per_page is not None and rows_per_page < 1:
-        raise ValueError("rows_per_page must be >= 1")
+    rows_per_page = _validate_pagination(page, rows_per_page)
 
     # Get data from operations layer
     items, total = await wf_ops.get_workflows_for_status(
@@ -143,32 +165,21 @@ async def get_workflows_for_status(
     if page is None and rows_per_page is None:
         return items
 
-    # Calculate total_pages
-    total_pages = (total + rows_per_page - 1) // rows_per_page if rows_per_page > 0 else 0
-
-    # Return paginated response
-    if include_doc_info:
-        return PaginatedResponse[WorkflowRunWithDetails](
-            items=items,
-            total=total,
-            page=page or 1,
-            rows_per_page=rows_per_page or 10,
-            total_pages=total_pages,
-        )
-    return PaginatedResponse[WorkflowRun](
-        items=items,
-        total=total,
-        page=page or 1,
-        rows_per_page=rows_per_page or 10,
-        total_pages=total_pages,
-    )
+    response_cls = _PagedDetails if include_doc_info else _PagedRun
+    return _paginate(items, total, page, rows_per_page, response_cls)
+
+
+def _yaml_file_response(request: Request, mtime_ns: int, content: str) -> Response:
+    """Return YAML file content with Last-Modified, or an empty 304 if the client's copy is current."""
+    headers = {"Last-Modified": last_modified(mtime_ns)}
+    if not_modified_since(request, mtime_ns):
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+    return Response(content=content, media_type="text/yaml", headers=headers)
 
 
 @wf_router.get("/definitions", summary="get workflow definitions")
 async def list_workflows():
-    wf = await wf_registry.load_workflow_registry()
-    res = [{"id": x.id, "name": x.name} for x in wf.values()]
-    return res
+    return Response(content=await wf_registry.get_workflow_list_json(), media_type="application/json")
 
 
 @wf_router.get(
@@ -176,10 +187,10 @@ async def list_workflows():
     status_code=status.HTTP_200_OK,
     summary="get workflow definition by id",
 )
-async def get_workflow_def(workflow_id: str, response: Response):
-    yaml_content = await wf_registry.get_workflow_definition_yaml_content(workflow_id)
-    if yaml_content is not None:
-        return Response(content=yaml_content, media_type="text/yaml")
+async def get_workflow_def(workflow_id: str, request: Request, response: Response):
+    yaml_file = await wf_registry.get_workflow_definition_yaml_content(workflow_id)
+    if yaml_file is not None:
+        return _yaml_file_response(request, *yaml_file)
     else:
         response.status_code = status.HTTP_404_NOT_FOUND
         return {"error": f"workflow definition {workflow_id} not found"}
@@ -187,16 +198,14 @@ async def get_workflow_def(workflow_id: str, response: Response):
 
 @wf_router.get("/param-sets", summary="get param sets")
 async def list_params():
-    wf = await wf_registry.load_param_registry()
-    res = [{"id": x.id, "name": x.name, "source": x.source} for x in wf.values()]
-    return res
+    return Response(content=await wf_registry.get_param_list_json(), media_type="application/json")
 
 
 @wf_router.get("/param-sets/{set_id}", summary="get param set by id")
-async def get_param_set(set_id: str, response: Response):
-    yaml_content = await wf_registry.get_param_set_yaml_content(set_id)
-    if yaml_content is not None:
-        return Response(content=yaml_content, media_type="text/yaml")
+async def get_param_set(set_id: str, request: Request, response: Response):
+    yaml_file = await wf_registry.get_param_set_yaml_content(set_id)
+    if yaml_file is not None:
+        return _yaml_file_response(request, *yaml_file)
     else:
         response.status_code = status.HTTP_404_NOT_FOUND
         return {"error": f"param set {set_id} not found"}
@@ -207,15 +216,8 @@ async def get_param_set(set_id: str, response: Response):
     summary="get param set by target lancedb file",
     status_code=status.HTTP_200_OK,
 )
-async def get_param_set_by_target(target: str, response: Response) -> list[WorkflowParams]:
-    param_reg = await wf_registry.load_param_registry()
-    ret = []
-    for pset in param_reg.values():
-        if WorkflowStepType.STORE in pset.config:
-            store_step = pset.config[WorkflowStepType.STORE]
-            if "data_dir" in store_step and store_step["data_dir"] == target:
-                ret.append(pset)
-    return ret
+async def get_param_set_by_target(target: str) -> list[WorkflowParams]:
+    return await wf_registry.get_param_sets_by_target(target)
 
 
 @wf_router.post(
@@ -240,21 +242,22 @@ async def upload_param_set(
     dict
         Success message with parameter set ID
     """
+    # Parse and validate in a worker thread so large uploads don't stall the event loop
+    try:
+        loaded = await run_in_threadpool(wf_registry.parse_yaml, yaml_content)
+    except yaml.YAMLError as e:
+        response.status_code = status.HTTP_400_BAD_REQUEST
+        return {"error": f"Invalid YAML syntax: {str(e)}"}
+
+    # Validate against Pydantic model
     try:
-        # Parse YAML
-        try:
-            loaded = yaml.safe_load(yaml_content)
-        except yaml.YAMLError as e:
-            response.status_code = status.HTTP_400_BAD_REQUEST
-            return {"error": f"Invalid YAML syntax: {str(e)}"}
-
-        # Validate against Pydantic model
-        try:
-            param_set = WorkflowParams.model_validate(loaded)
-        except Exception as e:
-            response.status_code = status.HTTP_400_BAD_REQUEST
-            return {"error": f"Invalid parameter set format: {str(e)}"}
+        param_set = await run_in_threadpool(WorkflowParams.model_validate, loaded)
+    except Exception as e:
+        response.status_code = status.HTTP_400_BAD_REQUEST
+        return {"error": f"Invalid parameter set format: {str(e)}"}
 
+    # loading the registry raises ValueError too, e.g. for a duplicate id among the existing files
+    try:
         # Check for duplicate ID
         existing_registry = await wf_registry.load_param_registry()
         if param_set.id in existing_registry:
@@ -266,16 +269,11 @@ async def upload_param_set(
 
         # Save to file
         file_path = await wf_registry.save_param_set(yaml_content, overwrite=False)
-
-        return {"message": "Parameter set created successfully", "id": param_set.id, "file_path": str(file_path)}
-
     except ValueError as e:
         response.status_code = status.HTTP_400_BAD_REQUEST
         return {"error": str(e)}
-    except Exception as e:
-        logger.exception("Error uploading parameter set", exc_info=e)
-        response.status_code = status.HTTP_500_INTERNAL_SERVER_ERROR
-        return {"error": f"Internal server error: {str(e)}"}
+
+    return {"message": "Parameter set created successfully", "id": param_set.id, "file_path": str(file_path)}
 
 
 @wf_router.delete(
@@ -301,18 +299,11 @@ async def delete_param_set_endpoint(set_id: str, response: Response) -> dict:
     except ValueError as e:
         response.status_code = status.HTTP_403_FORBIDDEN
         return {"error": str(e)}
-    except Exception as e:
-        logger.exception("Error deleting parameter set", exc_info=e)
-        response.status_code = status.HTTP_500_INTERNAL_SERVER_ERROR
-        return {"error": str(e)}
 
 
 @wf_router.get("/steps", status_code=status.HTTP_200_OK, summary="get run steps by status")
 async def get_workflow_status(status: wf_ops.RunStatus):
-    try:
-        return await wf_ops.get_run_steps(status)
-    except Exception as e:
-        return {"error": str(e)}
+    return await wf_ops.get_run_steps(status)
 
 
 @wf_router.get(
@@ -320,12 +311,8 @@ async def get_workflow_status(status: wf_ops.RunStatus):
     status_code=status.HTTP_200_OK,
     summary="get workflow run groups by batch_id(optional)",
 )
-async def get_workflow_run_groups(response: Response, batch_id: int | None = None) -> list[RunGroup]:
-    try:
-        return await wf_ops.get_run_groups_for_batch(batch_id)
-    except Exception as e:
-        response.status_code = status.HTTP_500_INTERNAL_SERVER_ERROR
-        return {"error": str(e)}
+async def get_workflow_run_groups(batch_id: int | None = None) -> list[RunGroup]:
+    return await wf_ops.get_run_groups_for_batch(batch_id)
 
 
 @wf_router.get(
@@ -333,12 +320,8 @@ async def get_workflow_run_groups(response: Response, batch_id: int | None = Non
     status_code=status.HTTP_200_OK,
     summary="get workflow run group by id",
 )
-async def get_workflow_run_group(run_group_id: int, response: Response):
-    try:
-        return await wf_ops.get_run_group(run_group_id)
-    except Exception as e:
-        response.status_code = status.HTTP_500_INTERNAL_SERVER_ERROR
-        return {"error": str(e)}
+async def get_workflow_run_group(run_group_id: int):
+    return await wf_ops.get_run_group(run_group_id)
 
 
 @wf_router.delete(
@@ -374,17 +357,11 @@ async def delete_workflow_run_group(run_group_id: int, response: Response) -> di
     """
     try:
         result = await wf_ops.delete_run_group(run_group_id)
-    except wf_ops.NotFoundError as e:
-        response.status_code = status.HTTP_404_NOT_FOUND
-        return {"error": str(e)}
     except RuntimeError as e:
         response.status_code = status.HTTP_400_BAD_REQUEST
         return {"error": str(e)}
-    except Exception as e:
-        logger.exception("error deleting run group", exc_info=e)
-        response.status_code = status.HTTP_500_INTERNAL_SERVER_ERROR
-        return {"error": str(e)}
     else:
+        _stats_cache.pop(run_group_id, None)
         return {
             "message": f"RunGroup {run_group_id} deleted successfully",
             "statistics": result,
@@ -396,13 +373,17 @@ async def delete_workflow_run_group(run_group_id: int, response: Response) -> di
     status_code=status.HTTP_200_OK,
     summary="get workflow runs by run_group_id",
 )
-async def get_run_group_stats(run_group_id: int, response: Response):
-    try:
-        return await wf_ops.get_run_group_stats(run_group_id)
-    except Exception as e:
-        response.status_code = status.HTTP_500_INTERNAL_SERVER_ERROR
-        logger.exception("error getting run group stats", exc_info=e)
-        return {"error": str(e)}
+async def get_run_group_stats(run_group_id: int):
+    now = time.monotonic()
+    cached = _stats_cache.get(run_group_id)
+    if cached is not None and now - cached[0] < RUN_GROUP_STATS_TTL:
+        return cached[1]
+    stats = await wf_ops.get_run_group_stats(run_group_id)
+    # drop expired entries so groups that are no longer polled do not accumulate
+    for key in [key for key, (fetched, _) in _stats_cache.items() if now - fetched >= RUN_GROUP_STATS_TTL]:
+        del _stats_cache[key]
+    _stats_cache[run_group_id] = (now, stats)
+    return stats
 
 
 @wf_router.get(
@@ -411,10 +392,7 @@ async def get_run_group_stats(run_group_id: int, response: Response):
     summary="get workflow runs by batch_id",
 )
 async def get_workflow_runs(batch_id: int):
-    try:
-        return await wf_ops.get_workflow_runs(batch_id)
-    except Exception as e:
-        return {"error": str(e)}
+    return await wf_ops.get_workflow_runs(batch_id)
 
 
 @wf_router.get(
@@ -423,18 +401,12 @@ async def get_workflow_runs(batch_id: int):
     summary="get workflow run by id",
 )
 async def get_workflow(workflow_id: int):
-    try:
-        result = await wf_ops.get_workflow_run(workflow_id, include_steps=True)
-        # get_workflow_run returns a tuple (run, steps) when get_steps=True
-        run, steps = result
-        # Convert to dict and add steps
-        run_dict = run.model_dump()
-        run_dict["steps"] = [step.model_dump() for step in steps]
-
-    except Exception as e:
-        return {"error": str(e)}
-    else:
-        return run_dict
+    # get_workflow_run returns a tuple (run, steps) when include_steps=True
+    run, steps = await wf_ops.get_workflow_run(workflow_id, include_steps=True)
+    # dump JSON-ready values so the response skips jsonable_encoder
+    run_dict = run.model_dump(mode="json")
+    run_dict["steps"] = [step.model_dump(mode="json") for step in steps]
+    return JSONResponse(content=run_dict)
 
 
 @wf_router.post(
@@ -443,18 +415,12 @@ async def get_workflow(workflow_id: int):
     summary="Start a new workflow run (one doc)",
 )
 async def start_workflow(
-    response: Response,
     doc_id: str = Form(...),
     workflow_definiton_id: str | None = Form(None),
     param_id: str | None = Form(None),
     priority: int = Form(0),
 ):
-    try:
-        return await wf_ops.create_single_workflow_run(workflow_definiton_id, doc_id, priority=priority, param_id=param_id)
-    except Exception as e:
-        response.status_code = status.HTTP_500_INTERNAL_SERVER_ERROR
-        logger.exception("error starting workflow", exc_info=e)
-        return {"error": str(e)}
+    return await wf_ops.create_single_workflow_run(workflow_definiton_id, doc_id, priority=priority, param_id=param_id)
 
 
 @wf_router.post(
@@ -462,12 +428,10 @@ async def start_workflow(
     status_code=status.HTTP_201_CREATED,
     summary="Retry a failed workflow run for a run group",
 )
-async def retry_workflow(response: Response, run_group_id: int):
-    try:
-        return await wf_ops.reset_failed_steps(run_group_id)
-    except Exception as e:
-        response.status_code = status.HTTP_500_INTERNAL_SERVER_ERROR
-        return {"error": str(e)}
+async def retry_workflow(run_group_id: int):
+    result = await wf_ops.reset_failed_steps(run_group_id)
+    _stats_cache.pop(run_group_id, None)
+    return result
 
 
 @wf_router.get(
@@ -475,7 +439,7 @@ async def retry_workflow(response: Response, run_group_id: int):
     status_code=status.HTTP_200_OK,
     summary="get lifecycle history for workflow run",
 )
-async def get_workflow_lifecycle_history(workflow_id: int, response: Response):
+async def get_workflow_lifecycle_history(workflow_id: int):
     """
     Get lifecycle history events for a specific workflow run.
 
@@ -483,11 +447,6 @@ async def get_workflow_lifecycle_history(workflow_id: int, response: Response):
     """
     try:
         history = await wf_ops.get_lifecycle_history(workflow_run_id=workflow_id)
-        return [record.model_dump() for record in history]
     except ValueError as e:
-        response.status_code = status.HTTP_400_BAD_REQUEST
-        return {"error": str(e)}
-    except Exception as e:
-        logger.exception("error getting lifecycle history", exc_info=e)
-        response.status_code = status.HTTP_500_INTERNAL_SERVER_ERROR
-        return {"error": str(e)}
+        raise BadRequestError(str(e)) from e
+    return Response(content=_lifecycle_adapter.dump_json(history), media_type="application/json")
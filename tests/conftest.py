@@ -5,20 +5,61 @@ All database fixtures are function-scoped to ensure complete test isolation.
 Each test gets a fresh in-memory SQLite database.
 """
 
+from unittest.mock import AsyncMock
+
+import pytest
 import pytest_asyncio
+from sqlalchemy.dialects import sqlite
+from sqlalchemy.ext.asyncio import create_async_engine
+from sqlalchemy.schema import CreateIndex
+from sqlalchemy.schema import CreateTable
+from sqlmodel import SQLModel
 
 from soliplex.ingester.lib.models import Database
 
+MEMORY_DB_URL = "sqlite+aiosqlite:///:memory:"
+
+
+@pytest.fixture(scope="session", autouse=True)
+def _stub_start_worker():
+    """
+    Keep the app lifespan from starting a real workflow worker in any test.
+
+    The stub is installed once for the session, so fixtures that enter the
+    app (e.g. a TestClient) do not need to patch it themselves.
+    """
+    from soliplex.ingester.lib.wf import runner
+
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setattr(runner, "start_worker", AsyncMock())
+        yield
+
+
+@pytest.fixture(scope="session")
+def schema_script() -> str:
+    """
+    Compile the CREATE statements for every table and index once per session.
+
+    A new in-memory database is always empty, so the db fixture runs this
+    script directly instead of create_all, which checks each table first.
+    """
+    dialect = sqlite.dialect()
+    statements = []
+    for table in SQLModel.metadata.sorted_tables:
+        statements.append(str(CreateTable(table).compile(dialect=dialect)).strip())
+        statements.extend(str(CreateIndex(index).compile(dialect=dialect)).strip() for index in table.indexes)
+    return ";\n".join(statements) + ";"
+
 
 @pytest_asyncio.fixture(scope="function")
-async def db():
+async def db(schema_script):
     """
     Create a fresh in-memory database for each test.
 
     This fixture:
     - Resets any existing database state
     - Creates a new in-memory SQLite database
-    - Initializes all tables
+    - Creates all tables from the session's compiled schema script
     - Yields for the test to run
     - Cleans up after the test
 
@@ -29,8 +70,14 @@ async def db():
             async with get_session() as session:
                 ...
     """
-    # Reset to a fresh in-memory database
-    await Database.reset("sqlite+aiosqlite:///:memory:")
+    # Start from a fresh in-memory database; the pool keeps its single connection for the engine's lifetime
+    await Database.close()
+    engine = create_async_engine(MEMORY_DB_URL, connect_args={"check_same_thread": False})
+    async with engine.begin() as conn:
+        raw = await conn.get_raw_connection()
+        await raw.driver_connection.executescript(schema_script)
+    Database._engine = engine
+    Database._initialized = True
     yield Database
     # Cleanup after test
     await Database.close()
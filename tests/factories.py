@@ -10,6 +10,9 @@ Usage:
     # Create a document with custom values
     doc = make_document(hash="custom-hash", mime_type="text/plain")
 
+    # Mock settings for dependency overrides
+    settings = make_settings(api_key_enabled=False, log_level="INFO")
+
     # Create and persist to database
     async with db.session() as session:
         batch = make_batch()
@@ -18,9 +21,42 @@ Usage:
 """
 
 import datetime
-import uuid
+import itertools
+from unittest.mock import Mock
 
 from soliplex.ingester.lib import models
+from soliplex.ingester.lib.config import Settings
+
+# unique-per-process suffixes; cheaper than uuid4 and enough for test data
+_counter = itertools.count()
+
+
+def _uniq(prefix: str) -> str:
+    """Return prefix plus a unique 32-character hex suffix, the width of a uuid4 hex."""
+    return f"{prefix}-{next(_counter):032x}"
+
+
+# Mock(spec=cls) runs dir() on the class every time; compute the attribute list once
+_SETTINGS_SPEC = dir(Settings)
+
+
+def make_settings(**attrs) -> Mock:
+    """
+    Create a Settings mock with the given attributes set.
+
+    Args:
+        **attrs: Settings attributes to set on the mock.
+
+    Returns:
+        A Mock specced against Settings.
+    """
+    settings = Mock(spec=_SETTINGS_SPEC)
+    settings.configure_mock(**attrs)
+    return settings
+
+
+# shared default payload for DocumentBytes; tests can compare against it by identity
+TINY_BYTES = b"test content"
 
 
 def make_document(
@@ -39,7 +75,7 @@ def make_document(
         hash: Document hash. If None, generates a unique hash.
         mime_type: MIME type of the document.
         file_size: Size of the document in bytes.
-        doc_meta: Document metadata dictionary.
+        doc_meta: Document metadata dictionary. If None, the model default is used.
         rag_id: RAG system ID.
         batch_id: Associated batch ID.
         **kwargs: Additional fields to pass to Document.
@@ -48,15 +84,14 @@ def make_document(
         A Document instance (not persisted to database).
     """
     if hash is None:
-        hash = f"sha256-{uuid.uuid4().hex}"
-    if doc_meta is None:
-        doc_meta = {}
+        hash = _uniq("sha256")
+    if doc_meta is not None:
+        kwargs["doc_meta"] = doc_meta
 
     return models.Document(
         hash=hash,
         mime_type=mime_type,
         file_size=file_size,
-        doc_meta=doc_meta,
         rag_id=rag_id,
         batch_id=batch_id,
         **kwargs,
@@ -68,7 +103,7 @@ def make_batch(
     source: str = "pytest",
     start_date: datetime.datetime | None = None,
     completed_date: datetime.datetime | None = None,
-    batch_meta: dict | None = None,
+    batch_params: dict[str, str] | None = None,
     **kwargs,
 ) -> models.DocumentBatch:
     """
@@ -79,7 +114,7 @@ def make_batch(
         source: Source identifier.
         start_date: When the batch started. Defaults to now.
         completed_date: When the batch completed. None if still running.
-        batch_meta: Batch metadata dictionary.
+        batch_params: Batch parameters dictionary. If None, the model default (empty dict) is used.
         **kwargs: Additional fields to pass to DocumentBatch.
 
     Returns:
@@ -87,15 +122,14 @@ def make_batch(
     """
     if start_date is None:
         start_date = datetime.datetime.now()
-    if batch_meta is None:
-        batch_meta = {}
+    if batch_params is not None:
+        kwargs["batch_params"] = batch_params
 
     return models.DocumentBatch(
         name=name,
         source=source,
         start_date=start_date,
         completed_date=completed_date,
-        batch_meta=batch_meta,
         **kwargs,
     )
 
@@ -106,7 +140,6 @@ def make_document_uri(
     doc_hash: str | None = None,
     batch_id: int | None = None,
     version: int = 1,
-    uri_meta: dict | None = None,
     **kwargs,
 ) -> models.DocumentURI:
     """
@@ -118,18 +151,15 @@ def make_document_uri(
         doc_hash: Hash of the associated document.
         batch_id: Associated batch ID.
         version: Version number.
-        uri_meta: URI metadata dictionary.
         **kwargs: Additional fields to pass to DocumentURI.
 
     Returns:
         A DocumentURI instance (not persisted to database).
     """
     if uri is None:
-        uri = f"/tmp/test_{uuid.uuid4().hex[:8]}.pdf"
+        uri = f"/tmp/test_{next(_counter):08x}.pdf"
     if doc_hash is None:
-        doc_hash = f"sha256-{uuid.uuid4().hex}"
-    if uri_meta is None:
-        uri_meta = {}
+        doc_hash = _uniq("sha256")
 
     return models.DocumentURI(
         uri=uri,
@@ -137,7 +167,6 @@ def make_document_uri(
         doc_hash=doc_hash,
         batch_id=batch_id,
         version=version,
-        uri_meta=uri_meta,
         **kwargs,
     )
 
@@ -166,13 +195,12 @@ def make_run_group(
     Returns:
         A RunGroup instance (not persisted to database).
     """
-    now = datetime.datetime.now()
-    if start_date is None:
-        start_date = now
-    if created_date is None:
-        created_date = now
+    if start_date is None or created_date is None:
+        now = datetime.datetime.now()
+        start_date = start_date or now
+        created_date = created_date or now
     if name is None:
-        name = f"Test Run Group {uuid.uuid4().hex[:8]}"
+        name = f"Test Run Group {next(_counter):08x}"
 
     return models.RunGroup(
         workflow_definition_id=workflow_definition_id,
@@ -209,21 +237,20 @@ def make_workflow_run(
         priority: Run priority (higher = more important).
         start_date: When the run started.
         created_date: When the run was created.
-        run_params: Run parameters dictionary.
+        run_params: Run parameters dictionary. If None, the model default is used.
         **kwargs: Additional fields to pass to WorkflowRun.
 
     Returns:
         A WorkflowRun instance (not persisted to database).
     """
-    now = datetime.datetime.now()
     if doc_id is None:
-        doc_id = f"sha256-{uuid.uuid4().hex}"
-    if start_date is None:
-        start_date = now
-    if created_date is None:
-        created_date = now
-    if run_params is None:
-        run_params = {}
+        doc_id = _uniq("sha256")
+    if start_date is None or created_date is None:
+        now = datetime.datetime.now()
+        start_date = start_date or now
+        created_date = created_date or now
+    if run_params is not None:
+        kwargs["run_params"] = run_params
 
     return models.WorkflowRun(
         doc_id=doc_id,
@@ -234,7 +261,6 @@ def make_workflow_run(
         priority=priority,
         start_date=start_date,
         created_date=created_date,
-        run_params=run_params,
         **kwargs,
     )
 
@@ -244,7 +270,7 @@ def make_run_step(
     step_type: models.WorkflowStepType = models.WorkflowStepType.PARSE,
     step_config_id: int = 1,
     status: models.RunStatus = models.RunStatus.PENDING,
-    step_order: int = 0,
+    workflow_step_number: int = 0,
     created_date: datetime.datetime | None = None,
     **kwargs,
 ) -> models.RunStep:
@@ -256,7 +282,7 @@ def make_run_step(
         step_type: Type of workflow step.
         step_config_id: Associated step config ID.
         status: Current step status.
-        step_order: Order of this step in the workflow.
+        workflow_step_number: Position of this step in the workflow.
         created_date: When the step was created.
         **kwargs: Additional fields to pass to RunStep.
 
@@ -271,7 +297,7 @@ def make_run_step(
         step_type=step_type,
         step_config_id=step_config_id,
         status=status,
-        step_order=step_order,
+        workflow_step_number=workflow_step_number,
         created_date=created_date,
         **kwargs,
     )
@@ -279,8 +305,7 @@ def make_run_step(
 
 def make_step_config(
     step_type: models.WorkflowStepType = models.WorkflowStepType.PARSE,
-    config_hash: str | None = None,
-    parameters: dict | None = None,
+    config_json: dict[str, str | int | bool] | None = None,
     **kwargs,
 ) -> models.StepConfig:
     """
@@ -288,22 +313,18 @@ def make_step_config(
 
     Args:
         step_type: Type of workflow step.
-        config_hash: Hash of the configuration. If None, generates a unique hash.
-        parameters: Configuration parameters dictionary.
+        config_json: Configuration for this step. If None, generates a unique one.
         **kwargs: Additional fields to pass to StepConfig.
 
     Returns:
         A StepConfig instance (not persisted to database).
     """
-    if config_hash is None:
-        config_hash = f"config-{uuid.uuid4().hex}"
-    if parameters is None:
-        parameters = {}
+    if config_json is None:
+        config_json = {"name": _uniq("config")}
 
     return models.StepConfig(
         step_type=step_type,
-        config_hash=config_hash,
-        parameters=parameters,
+        config_json=config_json,
         **kwargs,
     )
 
@@ -311,7 +332,7 @@ def make_step_config(
 def make_document_bytes(
     hash: str | None = None,
     artifact_type: models.ArtifactType = models.ArtifactType.DOC,
-    file_bytes: bytes = b"test content",
+    file_bytes: bytes = TINY_BYTES,
     **kwargs,
 ) -> models.DocumentBytes:
     """
@@ -327,7 +348,7 @@ def make_document_bytes(
         A DocumentBytes instance (not persisted to database).
     """
     if hash is None:
-        hash = f"sha256-{uuid.uuid4().hex}"
+        hash = _uniq("sha256")
 
     return models.DocumentBytes(
         hash=hash,
@@ -1,68 +1,28 @@
 import logging
+from pathlib import Path
+from types import MappingProxyType
 
-import aiofiles
 import pytest
 
 import soliplex.ingester.lib.docling as docling
 
 logger = logging.getLogger(__name__)
 
+pytestmark = pytest.mark.asyncio
 
-@pytest.mark.asyncio
-async def xtest_docling_cmd():
-    input_file = "tests/files/complex.pdf"
-    fmt = "json"
-    async with aiofiles.open(input_file, "rb") as f:
-        ba = await f.read()
-    res = await docling.run_docling(ba, input_file, fmt)
-    logger.info(res[:10])
-    async with aiofiles.open(input_file.replace("pdf", fmt), "wb") as f:
-        await f.write(res)
-
-
-@pytest.mark.asyncio
-async def test_docling_convert():
-    input_file = "tests/files/basic_ocr.pdf"
-    async with aiofiles.open(input_file, "rb") as f:
-        ba = await f.read()
-    test_config = {
-        "do_ocr": True,
-        "force_ocr": False,
-        "ocr_engine": "easyocr",
-        "ocr_lang": "en",
-        "pdf_backend": "dlparse_v2",
-        "table_mode": "accurate",
-    }
-
-    js = await docling.docling_convert(ba, input_file, "application/pdf", config_dict=test_config)
-    assert js
-
-
-@pytest.mark.asyncio
-async def test_docling_convert_img_desc():
-    input_file = "tests/files/picture_classification.pdf"
-    async with aiofiles.open(input_file, "rb") as f:
-        ba = await f.read()
-    test_config = {
+_OCR_CONFIG = MappingProxyType(
+    {
         "do_ocr": True,
         "force_ocr": False,
         "ocr_engine": "easyocr",
         "ocr_lang": "en",
         "pdf_backend": "dlparse_v2",
         "table_mode": "accurate",
-        "do_picture_description": True,
     }
-
-    js = await docling.docling_convert(ba, input_file, "application/pdf", config_dict=test_config)
-    assert js
-
-
-@pytest.mark.asyncio
-async def test_docling_convert_no_img():
-    input_file = "tests/files/amt_handbook_sample.pdf"
-    async with aiofiles.open(input_file, "rb") as f:
-        ba = await f.read()
-    test_config = {
+)
+_IMG_DESC_CONFIG = MappingProxyType({**_OCR_CONFIG, "do_picture_description": True})
+_NO_IMG_CONFIG = MappingProxyType(
+    {
         "do_ocr": False,
         "force_ocr": False,
         "ocr_engine": "easyocr",
@@ -71,6 +31,40 @@ async def test_docling_convert_no_img():
         "table_mode": "accurate",
         "image_export_mode": "placeholder",
     }
+)
+
+
+class _FileBytes(dict):
+    """Read each file on first access and keep its bytes for the rest of the session."""
+
+    def __missing__(self, path: str) -> bytes:
+        data = self[path] = Path(path).read_bytes()
+        return data
+
+
+@pytest.fixture(scope="session")
+def pdf_bytes() -> dict[str, bytes]:
+    return _FileBytes()
+
+
+async def xtest_docling_cmd(pdf_bytes):
+    input_file = "tests/files/complex.pdf"
+    fmt = "json"
+    ba = pdf_bytes[input_file]
+    res = await docling.run_docling(ba, input_file, fmt)
+    logger.info(res[:10])
+    Path(input_file.replace("pdf", fmt)).write_bytes(res)
+
 
-    js = await docling.docling_convert(ba, input_file, "application/pdf", config_dict=test_config)
+@pytest.mark.parametrize(
+    "input_file,config",
+    [
+        ("tests/files/basic_ocr.pdf", _OCR_CONFIG),
+        ("tests/files/picture_classification.pdf", _IMG_DESC_CONFIG),
+        ("tests/files/amt_handbook_sample.pdf", _NO_IMG_CONFIG),
+    ],
+    ids=["ocr", "img_desc", "no_img"],
+)
+async def test_docling_convert(input_file, config, pdf_bytes):
+    js = await docling.docling_convert(pdf_bytes[input_file], input_file, "application/pdf", config_dict=config)
     assert js
@@ -1,23 +1,36 @@
 import json
 import logging
-from unittest.mock import AsyncMock
+from types import SimpleNamespace as NS
+from unittest.mock import DEFAULT
 from unittest.mock import Mock
 from unittest.mock import patch
 
 import pytest
 from fastapi.testclient import TestClient
 
+from soliplex.ingester.lib.models import WorkflowRun
+from soliplex.ingester.server import app
+from soliplex.ingester.server.routes.workflow import clear_caches
+
 logger = logging.getLogger(__name__)
 
+# form fields shared by the ingest-document tests; each adds its own doc_meta
+_INGEST_BASE = {"source_uri": "/test.pdf", "source": "test", "batch_id": 1}
+
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def test_client():
-    """Create a test client with mocked lifespan"""
-    with patch("soliplex.ingester.lib.wf.runner.start_worker", new_callable=AsyncMock):
-        from soliplex.ingester.server import app
+    """Create one test client for the whole session; conftest stubs the worker start"""
+    # entering the client runs the lifespan once and keeps one event loop portal for every request
+    # unhandled errors are rendered by the app's exception handlers; assert on the response
+    with TestClient(app, raise_server_exceptions=False) as client:
+        yield client
 
-        client = TestClient(app)
-        return client
+
+@pytest.fixture(autouse=True)
+def _clear_route_caches():
+    """Keep cached run group stats from leaking between tests"""
+    clear_caches()
 
 
 def test_source_status(test_client):
@@ -99,28 +112,28 @@ def test_start_workflows_error(test_client):
 
 def test_batch_status_success(test_client):
     """Test batch status endpoint"""
-    with patch("soliplex.ingester.server.routes.batch.operations.get_batch") as mock_get_batch:
-        with patch("soliplex.ingester.server.routes.batch.operations.get_documents_in_batch") as mock_get_docs:
-            with patch("soliplex.ingester.server.routes.batch.wf_ops.get_workflows") as mock_get_wf:
-                mock_batch = Mock()
-                mock_get_batch.return_value = mock_batch
-
-                mock_doc1 = Mock()
-                mock_doc1.rag_id = "rag1"
-                mock_doc2 = Mock()
-                mock_doc2.rag_id = None
-                mock_get_docs.return_value = [mock_doc1, mock_doc2]
-
-                mock_wf = Mock()
-                mock_wf.status.value = "completed"
-                mock_get_wf.return_value = [mock_wf]
-
-                response = test_client.get("/api/v1/batch/status?batch_id=1")
-                assert response.status_code == 200
-                data = response.json()
-                assert data["document_count"] == 2
-                assert data["parsed"] == 1
-                assert data["remaining"] == 1
+    with (
+        patch.multiple(
+            "soliplex.ingester.server.routes.batch.operations", get_batch=DEFAULT, get_documents_in_batch=DEFAULT
+        ) as mock_ops,
+        patch("soliplex.ingester.server.routes.batch.wf_ops.get_workflows") as mock_get_wf,
+    ):
+        mock_batch = Mock()
+        mock_ops["get_batch"].return_value = mock_batch
+
+        mock_doc1 = NS(rag_id="rag1")
+        mock_doc2 = NS(rag_id=None)
+        mock_ops["get_documents_in_batch"].return_value = [mock_doc1, mock_doc2]
+
+        mock_wf = NS(status=NS(value="completed"))
+        mock_get_wf.return_value = [mock_wf]
+
+        response = test_client.get("/api/v1/batch/status?batch_id=1")
+        assert response.status_code == 200
+        data = response.json()
+        assert data["document_count"] == 2
+        assert data["parsed"] == 1
+        assert data["remaining"] == 1
 
 
 def test_batch_status_not_found(test_client):
@@ -158,20 +171,13 @@ def test_get_docs_no_params(test_client):
 def test_ingest_document_success(test_client):
     """Test ingest document endpoint"""
     with patch("soliplex.ingester.server.routes.document.workflow.initial_load") as mock_load:
-        mock_uri = Mock()
-        mock_uri.id = 1
-        mock_doc = Mock()
-        mock_doc.hash = "hash123"
+        mock_uri = NS(id=1)
+        mock_doc = NS(hash="hash123")
         mock_load.return_value = (mock_uri, mock_doc)
 
         response = test_client.post(
             "/api/v1/document/ingest-document",
-            data={
-                "source_uri": "/test.pdf",
-                "source": "test",
-                "batch_id": 1,
-                "doc_meta": '{"key": "value"}',
-            },
+            data={**_INGEST_BASE, "doc_meta": '{"key": "value"}'},
         )
         assert response.status_code == 201
         data = response.json()
@@ -182,12 +188,7 @@ def test_ingest_document_invalid_json(test_client):
     """Test ingest document with invalid JSON metadata"""
     response = test_client.post(
         "/api/v1/document/ingest-document",
-        data={
-            "source_uri": "/test.pdf",
-            "source": "test",
-            "batch_id": 1,
-            "doc_meta": "invalid json",
-        },
+        data={**_INGEST_BASE, "doc_meta": "invalid json"},
     )
     assert response.status_code == 400
 
@@ -196,12 +197,7 @@ def test_ingest_document_invalid_metadata_type(test_client):
     """Test ingest document with non-dict metadata"""
     response = test_client.post(
         "/api/v1/document/ingest-document",
-        data={
-            "source_uri": "/test.pdf",
-            "source": "test",
-            "batch_id": 1,
-            "doc_meta": '["not", "a", "dict"]',
-        },
+        data={**_INGEST_BASE, "doc_meta": '["not", "a", "dict"]'},
     )
     assert response.status_code == 500
 
@@ -212,12 +208,7 @@ def test_ingest_document_key_error(test_client):
         mock_load.side_effect = KeyError("test_key")
         response = test_client.post(
             "/api/v1/document/ingest-document",
-            data={
-                "source_uri": "/test.pdf",
-                "source": "test",
-                "batch_id": 1,
-                "doc_meta": "{}",
-            },
+            data={**_INGEST_BASE, "doc_meta": "{}"},
         )
         assert response.status_code == 400
 
@@ -228,12 +219,7 @@ def test_ingest_document_exception(test_client):
         mock_load.side_effect = Exception("test error")
         response = test_client.post(
             "/api/v1/document/ingest-document",
-            data={
-                "source_uri": "/test.pdf",
-                "source": "test",
-                "batch_id": 1,
-                "doc_meta": "{}",
-            },
+            data={**_INGEST_BASE, "doc_meta": "{}"},
         )
         assert response.status_code == 500
 
@@ -289,9 +275,7 @@ def test_get_workflows_for_status(test_client):
 def test_list_workflows_definitions(test_client):
     """Test list workflow definitions endpoint"""
     with patch("soliplex.ingester.server.routes.workflow.wf_registry.load_registry") as mock_load:
-        mock_wf1 = Mock()
-        mock_wf1.id = "wf1"
-        mock_wf1.name = "Workflow 1"
+        mock_wf1 = NS(id="wf1", name="Workflow 1")
         mock_load.return_value = {"wf1": mock_wf1}
         response = test_client.get("/api/v1/workflow/definitions")
         assert response.status_code == 200
@@ -318,9 +302,7 @@ def test_get_workflow_def_not_found(test_client):
 def test_list_params(test_client):
     """Test list param sets endpoint"""
     with patch("soliplex.ingester.server.routes.workflow.wf_registry.load_param_registry") as mock_load:
-        mock_param = Mock()
-        mock_param.id = "p1"
-        mock_param.name = "Params 1"
+        mock_param = NS(id="p1", name="Params 1")
         mock_load.return_value = {"p1": mock_param}
         response = test_client.get("/api/v1/workflow/param-sets")
         assert response.status_code == 200
@@ -346,14 +328,21 @@ def test_get_param_set_not_found(test_client):
 
 def test_get_param_set_by_target(test_client):
     """Test get param set by target"""
+    from soliplex.ingester.lib.models import WorkflowParams
     from soliplex.ingester.lib.models import WorkflowStepType
-
-    with patch("soliplex.ingester.server.routes.workflow.wf_registry.load_param_registry") as mock_load:
-        mock_param = Mock()
-        mock_param.config = {WorkflowStepType.STORE: {"data_dir": "/test/dir"}}
-        mock_load.return_value = {"p1": mock_param}
-        response = test_client.get("/api/v1/workflow/param_sets/target//test/dir")
+    from soliplex.ingester.lib.wf.registry import build_param_target_index
+
+    reg = {
+        "p1": WorkflowParams(id="p1", config={WorkflowStepType.STORE: {"data_dir": "test-dir"}}),
+        "p2": WorkflowParams(id="p2", config={WorkflowStepType.STORE: {"data_dir": "other-dir"}}),
+    }
+    with (
+        patch("soliplex.ingester.server.routes.workflow.wf_registry.load_param_registry", return_value=reg),
+        patch("soliplex.ingester.server.routes.workflow.wf_registry._param_target_index", build_param_target_index(reg)),
+    ):
+        response = test_client.get("/api/v1/workflow/param_sets/target/test-dir")
         assert response.status_code == 200
+        assert [pset["id"] for pset in response.json()] == ["p1"]
 
 
 def test_get_workflow_status(test_client):
@@ -369,7 +358,7 @@ def test_get_workflow_status_error(test_client):
     with patch("soliplex.ingester.server.routes.workflow.wf_ops.get_run_steps") as mock_get:
         mock_get.side_effect = Exception("test error")
         response = test_client.get("/api/v1/workflow/steps?status=completed")
-        assert response.status_code == 200
+        assert response.status_code == 500
         assert "error" in response.json()
 
 
@@ -434,16 +423,17 @@ def test_get_workflow_runs_error(test_client):
     with patch("soliplex.ingester.server.routes.workflow.wf_ops.get_workflow_runs") as mock_get:
         mock_get.side_effect = Exception("test error")
         response = test_client.get("/api/v1/workflow/runs?batch_id=1")
-        assert response.status_code == 200
+        assert response.status_code == 500
         assert "error" in response.json()
 
 
 def test_get_workflow_by_id(test_client):
     """Test get workflow by id endpoint"""
     with patch("soliplex.ingester.server.routes.workflow.wf_ops.get_workflow_run") as mock_get:
-        mock_get.return_value = {}
+        mock_get.return_value = (WorkflowRun(id=1, doc_id="sha256-abc"), [])
         response = test_client.get("/api/v1/workflow/runs/1")
         assert response.status_code == 200
+        assert response.json()["steps"] == []
 
 
 def test_get_workflow_by_id_error(test_client):
@@ -451,7 +441,7 @@ def test_get_workflow_by_id_error(test_client):
     with patch("soliplex.ingester.server.routes.workflow.wf_ops.get_workflow_run") as mock_get:
         mock_get.side_effect = Exception("test error")
         response = test_client.get("/api/v1/workflow/runs/1")
-        assert response.status_code == 200
+        assert response.status_code == 500
         assert "error" in response.json()
 
 
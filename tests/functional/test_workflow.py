@@ -1,6 +1,7 @@
+import asyncio
 import logging
+from pathlib import Path
 
-import aiofiles
 import pytest
 
 import soliplex.ingester.lib.operations as doc_ops
@@ -15,112 +16,18 @@ from tests.unit import data
 logger = logging.getLogger(__name__)
 
 
-@pytest.mark.asyncio
-async def xtest_create_workflow_run(db):
-    batch_id = await doc_ops.new_batch("pytest-source", "pytest-batch")
-    test_uri = "/tmp/test.pdf"
-    mime_type = "application/pdf"
-    test_bytes = b"test bytes"
-    test_source = "pytest"
-    test_doc_meta = {"test": "test"}
-
-    uri1, doc1 = await doc_ops.create_document_from_uri(
-        test_uri,
-        test_source,
-        mime_type,
-        test_bytes,
-        doc_meta=test_doc_meta,
-        batch_id=batch_id,
-    )
-
-    wf_run = await wf_ops.create_workflow_run(
-        workflow_definitinon_id="batch",
-        batch_id=batch_id,
-        doc_id=doc1.hash,
-        param_id="test1",
-    )
-    assert wf_run is not None
+@pytest.fixture(scope="session")
+def amt_pdf_bytes() -> bytes:
+    return Path("tests/files/amt_handbook_sample.pdf").read_bytes()
 
 
 @pytest.mark.asyncio
-async def xtest_split_ingestion(db):
+async def test_workflow(db, amt_pdf_bytes):
     batch_id = await doc_ops.new_batch("pytest", "pytest")
 
     test_uri = "/tmp/test.pdf"
     test_bytes = bytes(data.MIN_PDF, "utf-8")
-    async with aiofiles.open("tests/files/amt_handbook_sample.pdf", "rb") as f:
-        test_bytes = await f.read()
-    test_source = "test source"
-    test_doc_meta = {"test": "test"}
-
-    docuri1, doc1 = await doc_ops.create_document_from_uri(
-        test_uri,
-        test_source,
-        file_bytes=test_bytes,
-        doc_meta=test_doc_meta,
-        batch_id=batch_id,
-    )
-    rg = await wf_ops.create_run_group(workflow_definition_id="batch", batch_id=batch_id, param_id="default")
-    wf_run, steps = await wf_ops.create_workflow_run(rg, doc_id=doc1.hash)
-    ids = await wf_ops.get_step_config_ids("default")
-    sc_map = {}
-    for id in ids.values():
-        sc = await wf_ops.get_step_config_by_id(id)
-
-        sc_map[sc.step_type] = sc
-    assert doc1 is not None
-    assert docuri1 is not None
-    op = await wf_ops.find_operator_for_workflow_run(wf_run.id, WorkflowStepType.PARSE, ArtifactType.PARSED_JSON)
-    assert op
-
-    await workflow.split_parse_document(
-        batch_id,
-        doc1.hash,
-        test_source,
-        step_config=sc_map[WorkflowStepType.PARSE],
-        force=True,
-        workflow_run=wf_run,
-    )
-    await workflow.chunk_document(
-        batch_id,
-        doc1.hash,
-        test_source,
-        step_config=sc_map[WorkflowStepType.CHUNK],
-        force=True,
-        workflow_run=wf_run,
-    )
-    await workflow.embed_document(
-        batch_id,
-        doc1.hash,
-        test_source,
-        step_config=sc_map[WorkflowStepType.EMBED],
-        force=True,
-        workflow_run=wf_run,
-    )
-    await workflow.save_to_rag(
-        batch_id,
-        doc1.hash,
-        test_source,
-        step_config=sc_map[WorkflowStepType.STORE],
-        force=True,
-        workflow_run=wf_run,
-    )
-
-    doc_history = await doc_ops.get_document_uri_history(docuri1.id)
-    for h in doc_history:
-        logger.info(h)
-    assert doc_history is not None
-    assert len(doc_history) == 4  # created, parsed, chunked,  saved
-
-
-@pytest.mark.asyncio
-async def test_workflow(db):
-    batch_id = await doc_ops.new_batch("pytest", "pytest")
-
-    test_uri = "/tmp/test.pdf"
-    test_bytes = bytes(data.MIN_PDF, "utf-8")
-    async with aiofiles.open("tests/files/amt_handbook_sample.pdf", "rb") as f:
-        test_bytes = await f.read()
+    test_bytes = amt_pdf_bytes
     test_source = "test source"
     test_doc_meta = {"test": "test"}
 
@@ -136,11 +43,7 @@ async def test_workflow(db):
 
     wf_run, steps = await wf_ops.create_workflow_run(rg, doc_id=doc1.hash)
     ids = await wf_ops.get_step_config_ids("default")
-    sc_map = {}
-    for id in ids.values():
-        sc = await wf_ops.get_step_config_by_id(id)
-
-        sc_map[sc.step_type] = sc
+    await asyncio.gather(*(wf_ops.get_step_config_by_id(i) for i in ids.values()))
     assert doc1 is not None
     assert docuri1 is not None
     op = await wf_ops.find_operator_for_workflow_run(wf_run.id, WorkflowStepType.PARSE, ArtifactType.PARSED_JSON)
@@ -189,14 +92,13 @@ async def test_workflow(db):
 
 
 @pytest.mark.asyncio
-async def test_ingestion(db):
+async def test_ingestion(db, amt_pdf_bytes):
     batch_id = await doc_ops.new_batch("pytest", "pytest")
     rg = await wf_ops.create_run_group(workflow_definition_id="test_wf", batch_id=batch_id, param_id="default")
 
     test_uri = "/tmp/test.pdf"
     test_bytes = bytes(data.MIN_PDF, "utf-8")
-    async with aiofiles.open("tests/files/amt_handbook_sample.pdf", "rb") as f:
-        test_bytes = await f.read()
+    test_bytes = amt_pdf_bytes
     test_source = "test source"
     test_doc_meta = {"test": "test"}
 
@@ -210,11 +112,8 @@ async def test_ingestion(db):
     wf_run, steps = await wf_ops.create_workflow_run(rg, doc_id=doc1.hash)
     ids = await wf_ops.get_step_config_ids("default")
 
-    sc_map = {}
-    for id in ids.values():
-        sc = await wf_ops.get_step_config_by_id(id)
-
-        sc_map[sc.step_type] = sc
+    step_configs = await asyncio.gather(*(wf_ops.get_step_config_by_id(i) for i in ids.values()))
+    sc_map = {sc.step_type: sc for sc in step_configs}
     assert doc1 is not None
     assert docuri1 is not None
 
@@ -267,25 +166,3 @@ async def test_ingestion(db):
         logger.info(h)
     assert doc_history is not None
     assert len(doc_history) == 5  # created, parsed, chunked, embed, saved
-
-
-@pytest.mark.asyncio
-async def xtest_status(db):
-    batch_id = await doc_ops.new_batch("pytest", "pytest")
-
-    test_uri = "/tmp/test.pdf"
-    test_bytes = bytes(data.MIN_PDF, "utf-8")
-    async with aiofiles.open("tests/files/amt_handbook_sample.pdf", "rb") as f:
-        test_bytes = await f.read()
-    test_source = "test source"
-    test_doc_meta = {"test": "test"}
-
-    docuri1, doc1 = await doc_ops.create_document_from_uri(
-        test_uri,
-        test_source,
-        file_bytes=test_bytes,
-        doc_meta=test_doc_meta,
-        batch_id=batch_id,
-    )
-    rg = await wf_ops.create_run_group(workflow_definition_id="batch", batch_id=batch_id, param_id="default")
-    wf_run, steps = await wf_ops.create_workflow_run(rg, doc_id=doc1.hash)
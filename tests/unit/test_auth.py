@@ -9,13 +9,13 @@ Tests cover:
 - Auth disabled scenarios
 """
 
-from unittest.mock import AsyncMock
 from unittest.mock import Mock
 from unittest.mock import patch
 
+import httpx
 import pytest
+import pytest_asyncio
 from fastapi import HTTPException
-from fastapi.testclient import TestClient
 
 from soliplex.ingester.lib.auth import AuthenticatedUser
 from soliplex.ingester.lib.auth import get_current_user
@@ -23,35 +23,38 @@ from soliplex.ingester.lib.auth import get_user_from_proxy_headers
 from soliplex.ingester.lib.auth import require_auth
 from soliplex.ingester.lib.auth import validate_api_key
 from soliplex.ingester.lib.config import Settings
+from soliplex.ingester.lib.config import get_settings
+from soliplex.ingester.server import app
+from tests.factories import make_settings
 
 
-class TestValidateApiKey:
-    """Tests for validate_api_key function."""
+class _HeaderReq:
+    """Request stand-in whose headers are a plain dict."""
+
+    __slots__ = ("headers",)
 
-    def test_valid_api_key(self):
-        """Test validation with correct API key."""
-        settings = Mock(spec=Settings)
-        settings.api_key = "secret-key-123"
-        assert validate_api_key("secret-key-123", settings) is True
+    def __init__(self, headers: dict[str, str]):
+        self.headers = headers
 
-    def test_invalid_api_key(self):
-        """Test validation with incorrect API key."""
-        settings = Mock(spec=Settings)
-        settings.api_key = "secret-key-123"
-        assert validate_api_key("wrong-key", settings) is False
 
-    def test_no_api_key_configured(self):
-        """Test validation when no API key is configured."""
-        settings = Mock(spec=Settings)
-        settings.api_key = None
-        assert validate_api_key("any-key", settings) is False
+class TestValidateApiKey:
+    """Tests for validate_api_key function."""
 
-    def test_empty_api_key_configured(self):
-        """Test validation when empty API key is configured."""
-        settings = Mock(spec=Settings)
-        settings.api_key = ""
-        # Empty string is falsy, so should return False
-        assert validate_api_key("any-key", settings) is False
+    @pytest.mark.parametrize(
+        "configured,supplied,expected",
+        [
+            ("secret-key-123", "secret-key-123", True),
+            ("secret-key-123", "wrong-key", False),
+            (None, "any-key", False),
+            # empty string is falsy, so it never matches
+            ("", "any-key", False),
+        ],
+        ids=["valid", "invalid", "not_configured", "empty_configured"],
+    )
+    def test_validate_api_key(self, configured, supplied, expected):
+        """Test validation against the configured API key."""
+        settings = make_settings(api_key=configured)
+        assert validate_api_key(supplied, settings) is expected
 
 
 class TestGetUserFromProxyHeaders:
@@ -59,13 +62,12 @@ class TestGetUserFromProxyHeaders:
 
     def test_with_x_auth_request_headers(self):
         """Test extraction from X-Auth-Request-* headers."""
-        request = Mock()
-        request.headers.get = Mock(
-            side_effect=lambda h: {
+        request = _HeaderReq(
+            {
                 "X-Auth-Request-User": "testuser",
                 "X-Auth-Request-Email": "test@example.com",
                 "X-Auth-Request-Groups": "admin,users",
-            }.get(h)
+            }
         )
 
         user = get_user_from_proxy_headers(request)
@@ -78,13 +80,12 @@ class TestGetUserFromProxyHeaders:
 
     def test_with_x_forwarded_headers(self):
         """Test extraction from X-Forwarded-* headers (fallback)."""
-        request = Mock()
-        request.headers.get = Mock(
-            side_effect=lambda h: {
+        request = _HeaderReq(
+            {
                 "X-Forwarded-User": "forwardeduser",
                 "X-Forwarded-Email": "forwarded@example.com",
                 "X-Forwarded-Groups": "group1",
-            }.get(h)
+            }
         )
 
         user = get_user_from_proxy_headers(request)
@@ -96,8 +97,7 @@ class TestGetUserFromProxyHeaders:
 
     def test_with_no_user_header(self):
         """Test when no user header is present."""
-        request = Mock()
-        request.headers.get = Mock(return_value=None)
+        request = _HeaderReq({})
 
         user = get_user_from_proxy_headers(request)
 
@@ -105,11 +105,10 @@ class TestGetUserFromProxyHeaders:
 
     def test_with_user_but_no_email_or_groups(self):
         """Test when only user header is present."""
-        request = Mock()
-        request.headers.get = Mock(
-            side_effect=lambda h: {
+        request = _HeaderReq(
+            {
                 "X-Auth-Request-User": "minimaluser",
-            }.get(h)
+            }
         )
 
         user = get_user_from_proxy_headers(request)
@@ -126,9 +125,7 @@ class TestGetCurrentUser:
     @pytest.mark.asyncio
     async def test_auth_disabled_returns_anonymous(self):
         """Test that disabled auth allows anonymous access."""
-        settings = Mock(spec=Settings)
-        settings.api_key_enabled = False
-        settings.auth_trust_proxy_headers = False
+        settings = make_settings(api_key_enabled=False, auth_trust_proxy_headers=False)
 
         request = Mock()
         credentials = None
@@ -141,10 +138,7 @@ class TestGetCurrentUser:
     @pytest.mark.asyncio
     async def test_valid_bearer_token(self):
         """Test authentication with valid Bearer token."""
-        settings = Mock(spec=Settings)
-        settings.api_key_enabled = True
-        settings.auth_trust_proxy_headers = False
-        settings.api_key = "valid-token"
+        settings = make_settings(api_key_enabled=True, auth_trust_proxy_headers=False, api_key="valid-token")
 
         request = Mock()
         credentials = Mock()
@@ -158,10 +152,7 @@ class TestGetCurrentUser:
     @pytest.mark.asyncio
     async def test_invalid_bearer_token_raises_401(self):
         """Test that invalid Bearer token raises 401."""
-        settings = Mock(spec=Settings)
-        settings.api_key_enabled = True
-        settings.auth_trust_proxy_headers = False
-        settings.api_key = "valid-token"
+        settings = make_settings(api_key_enabled=True, auth_trust_proxy_headers=False, api_key="valid-token")
 
         request = Mock()
         credentials = Mock()
@@ -176,16 +167,13 @@ class TestGetCurrentUser:
     @pytest.mark.asyncio
     async def test_proxy_headers_authentication(self):
         """Test authentication via OAuth2 Proxy headers."""
-        settings = Mock(spec=Settings)
-        settings.api_key_enabled = False
-        settings.auth_trust_proxy_headers = True
+        settings = make_settings(api_key_enabled=False, auth_trust_proxy_headers=True)
 
-        request = Mock()
-        request.headers.get = Mock(
-            side_effect=lambda h: {
+        request = _HeaderReq(
+            {
                 "X-Auth-Request-User": "proxyuser",
                 "X-Auth-Request-Email": "proxy@example.com",
-            }.get(h)
+            }
         )
         credentials = None
 
@@ -198,12 +186,9 @@ class TestGetCurrentUser:
     @pytest.mark.asyncio
     async def test_no_proxy_headers_raises_401(self):
         """Test that missing proxy headers raise 401 when required."""
-        settings = Mock(spec=Settings)
-        settings.api_key_enabled = False
-        settings.auth_trust_proxy_headers = True
+        settings = make_settings(api_key_enabled=False, auth_trust_proxy_headers=True)
 
-        request = Mock()
-        request.headers.get = Mock(return_value=None)
+        request = _HeaderReq({})
         credentials = None
 
         with pytest.raises(HTTPException) as exc_info:
@@ -215,16 +200,12 @@ class TestGetCurrentUser:
     @pytest.mark.asyncio
     async def test_bearer_token_takes_priority_over_proxy(self):
         """Test that Bearer token is checked before proxy headers."""
-        settings = Mock(spec=Settings)
-        settings.api_key_enabled = True
-        settings.auth_trust_proxy_headers = True
-        settings.api_key = "api-token"
+        settings = make_settings(api_key_enabled=True, auth_trust_proxy_headers=True, api_key="api-token")
 
-        request = Mock()
-        request.headers.get = Mock(
-            side_effect=lambda h: {
+        request = _HeaderReq(
+            {
                 "X-Auth-Request-User": "proxyuser",
-            }.get(h)
+            }
         )
         credentials = Mock()
         credentials.credentials = "api-token"
@@ -238,17 +219,13 @@ class TestGetCurrentUser:
     @pytest.mark.asyncio
     async def test_fallback_to_proxy_when_no_bearer(self):
         """Test fallback to proxy headers when no Bearer token provided."""
-        settings = Mock(spec=Settings)
-        settings.api_key_enabled = True
-        settings.auth_trust_proxy_headers = True
-        settings.api_key = "api-token"
+        settings = make_settings(api_key_enabled=True, auth_trust_proxy_headers=True, api_key="api-token")
 
-        request = Mock()
-        request.headers.get = Mock(
-            side_effect=lambda h: {
+        request = _HeaderReq(
+            {
                 "X-Auth-Request-User": "proxyuser",
                 "X-Auth-Request-Email": "proxy@example.com",
-            }.get(h)
+            }
         )
         credentials = None  # No Bearer token
 
@@ -261,13 +238,9 @@ class TestGetCurrentUser:
     @pytest.mark.asyncio
     async def test_both_enabled_neither_provided_raises_401(self):
         """Test 401 when both methods enabled but neither credentials provided."""
-        settings = Mock(spec=Settings)
-        settings.api_key_enabled = True
-        settings.auth_trust_proxy_headers = True
-        settings.api_key = "api-token"
+        settings = make_settings(api_key_enabled=True, auth_trust_proxy_headers=True, api_key="api-token")
 
-        request = Mock()
-        request.headers.get = Mock(return_value=None)
+        request = _HeaderReq({})
         credentials = None
 
         with pytest.raises(HTTPException) as exc_info:
@@ -279,10 +252,7 @@ class TestGetCurrentUser:
     @pytest.mark.asyncio
     async def test_api_key_only_no_token_raises_401(self):
         """Test 401 when only API key auth enabled and no token provided."""
-        settings = Mock(spec=Settings)
-        settings.api_key_enabled = True
-        settings.auth_trust_proxy_headers = False
-        settings.api_key = "api-token"
+        settings = make_settings(api_key_enabled=True, auth_trust_proxy_headers=False, api_key="api-token")
 
         request = Mock()
         credentials = None
@@ -327,112 +297,89 @@ class TestRequireAuth:
 
 
 class TestAuthIntegration:
-    """Integration tests for authentication with FastAPI TestClient."""
-
-    @pytest.fixture
-    def app_with_auth_enabled(self):
-        """Create app with API key authentication enabled."""
-        settings = Mock(spec=Settings)
-        settings.api_key_enabled = True
-        settings.auth_trust_proxy_headers = False
-        settings.api_key = "test-api-key"
-        settings.doc_db_url = "sqlite+aiosqlite:///:memory:"
-        settings.log_level = "INFO"
-
-        with patch("soliplex.ingester.lib.wf.runner.start_worker", new_callable=AsyncMock):
-            from soliplex.ingester.lib.config import get_settings
-            from soliplex.ingester.server import app
-
-            # Override the dependency in the app
-            app.dependency_overrides[get_settings] = lambda: settings
-
-            client = TestClient(app, raise_server_exceptions=False)
-            yield client, settings
+    """Integration tests for authentication through the app's ASGI interface."""
+
+    @pytest_asyncio.fixture
+    async def client(self):
+        """Create an in-process ASGI client; the app lifespan is not run."""
+        transport = httpx.ASGITransport(app=app, raise_app_exceptions=False)
+        async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+            yield client
+
+    def _with_settings(self, client, **auth):
+        """Point the app's settings dependency at a real Settings with the given auth options."""
+        # model_construct skips env/.env loading and validation; unset fields get their defaults
+        settings = Settings.model_construct(
+            api_key_enabled=auth["api_key_enabled"],
+            auth_trust_proxy_headers=auth["auth_trust_proxy_headers"],
+            api_key=auth["api_key"],
+            doc_db_url="sqlite+aiosqlite:///:memory:",
+            log_level="INFO",
+        )
 
-            # Clean up overrides
-            app.dependency_overrides.clear()
+        app.dependency_overrides[get_settings] = lambda: settings
+        yield client, settings
+        app.dependency_overrides.clear()
 
     @pytest.fixture
-    def app_with_auth_disabled(self):
-        """Create app with authentication disabled."""
-        settings = Mock(spec=Settings)
-        settings.api_key_enabled = False
-        settings.auth_trust_proxy_headers = False
-        settings.api_key = None
-        settings.doc_db_url = "sqlite+aiosqlite:///:memory:"
-        settings.log_level = "INFO"
-
-        with patch("soliplex.ingester.lib.wf.runner.start_worker", new_callable=AsyncMock):
-            from soliplex.ingester.lib.config import get_settings
-            from soliplex.ingester.server import app
-
-            app.dependency_overrides[get_settings] = lambda: settings
-
-            client = TestClient(app, raise_server_exceptions=False)
-            yield client, settings
-
-            app.dependency_overrides.clear()
+    def app_with_auth_enabled(self, client):
+        """App with API key authentication enabled."""
+        yield from self._with_settings(client, api_key_enabled=True, auth_trust_proxy_headers=False, api_key="test-api-key")
 
     @pytest.fixture
-    def app_with_proxy_auth(self):
-        """Create app with proxy header authentication enabled."""
-        settings = Mock(spec=Settings)
-        settings.api_key_enabled = False
-        settings.auth_trust_proxy_headers = True
-        settings.api_key = None
-        settings.doc_db_url = "sqlite+aiosqlite:///:memory:"
-        settings.log_level = "INFO"
-
-        with patch("soliplex.ingester.lib.wf.runner.start_worker", new_callable=AsyncMock):
-            from soliplex.ingester.lib.config import get_settings
-            from soliplex.ingester.server import app
-
-            app.dependency_overrides[get_settings] = lambda: settings
+    def app_with_auth_disabled(self, client):
+        """App with authentication disabled."""
+        yield from self._with_settings(client, api_key_enabled=False, auth_trust_proxy_headers=False, api_key=None)
 
-            client = TestClient(app, raise_server_exceptions=False)
-            yield client, settings
-
-            app.dependency_overrides.clear()
+    @pytest.fixture
+    def app_with_proxy_auth(self, client):
+        """App with proxy header authentication enabled."""
+        yield from self._with_settings(client, api_key_enabled=False, auth_trust_proxy_headers=True, api_key=None)
 
-    def test_request_with_valid_bearer_token(self, app_with_auth_enabled):
+    @pytest.mark.asyncio
+    async def test_request_with_valid_bearer_token(self, app_with_auth_enabled):
         """Test API request with valid Bearer token."""
         client, settings = app_with_auth_enabled
 
         with patch("soliplex.ingester.server.routes.batch.operations.list_batches") as mock_list:
             mock_list.return_value = []
-            response = client.get("/api/v1/batch/", headers={"Authorization": "Bearer test-api-key"})
+            response = await client.get("/api/v1/batch/", headers={"Authorization": "Bearer test-api-key"})
             assert response.status_code == 200
 
-    def test_request_with_invalid_bearer_token(self, app_with_auth_enabled):
+    @pytest.mark.asyncio
+    async def test_request_with_invalid_bearer_token(self, app_with_auth_enabled):
         """Test API request with invalid Bearer token."""
         client, settings = app_with_auth_enabled
 
-        response = client.get("/api/v1/batch/", headers={"Authorization": "Bearer wrong-key"})
+        response = await client.get("/api/v1/batch/", headers={"Authorization": "Bearer wrong-key"})
         assert response.status_code == 401
 
-    def test_request_without_token_when_required(self, app_with_auth_enabled):
+    @pytest.mark.asyncio
+    async def test_request_without_token_when_required(self, app_with_auth_enabled):
         """Test API request without token when auth is required."""
         client, settings = app_with_auth_enabled
 
-        response = client.get("/api/v1/batch/")
+        response = await client.get("/api/v1/batch/")
         assert response.status_code == 401
 
-    def test_request_without_token_when_auth_disabled(self, app_with_auth_disabled):
+    @pytest.mark.asyncio
+    async def test_request_without_token_when_auth_disabled(self, app_with_auth_disabled):
         """Test API request without token when auth is disabled."""
         client, settings = app_with_auth_disabled
 
         with patch("soliplex.ingester.server.routes.batch.operations.list_batches") as mock_list:
             mock_list.return_value = []
-            response = client.get("/api/v1/batch/")
+            response = await client.get("/api/v1/batch/")
             assert response.status_code == 200
 
-    def test_request_with_proxy_headers(self, app_with_proxy_auth):
+    @pytest.mark.asyncio
+    async def test_request_with_proxy_headers(self, app_with_proxy_auth):
         """Test API request with OAuth2 Proxy headers."""
         client, settings = app_with_proxy_auth
 
         with patch("soliplex.ingester.server.routes.batch.operations.list_batches") as mock_list:
             mock_list.return_value = []
-            response = client.get(
+            response = await client.get(
                 "/api/v1/batch/",
                 headers={
                     "X-Auth-Request-User": "testuser",
@@ -441,11 +388,12 @@ class TestAuthIntegration:
             )
             assert response.status_code == 200
 
-    def test_request_without_proxy_headers_when_required(self, app_with_proxy_auth):
+    @pytest.mark.asyncio
+    async def test_request_without_proxy_headers_when_required(self, app_with_proxy_auth):
         """Test API request without proxy headers when required."""
         client, settings = app_with_proxy_auth
 
-        response = client.get("/api/v1/batch/")
+        response = await client.get("/api/v1/batch/")
         assert response.status_code == 401
 
 
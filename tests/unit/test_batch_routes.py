@@ -0,0 +1,50 @@
+"""
+Unit tests for batch routes module.
+
+Tests cover:
+- Batch status endpoint
+"""
+
+from unittest.mock import AsyncMock
+from unittest.mock import Mock
+from unittest.mock import patch
+
+import pytest
+from fastapi import status
+
+from soliplex.ingester.lib.models import RunStatus
+from soliplex.ingester.server.routes import batch as batch_routes
+
+
+class TestBatchStatus:
+    """Tests for batch_status endpoint."""
+
+    @pytest.mark.asyncio
+    async def test_counts(self):
+        """Test that document and workflow counts are combined into the status."""
+        runs = [Mock(status=RunStatus.COMPLETED), Mock(status=RunStatus.PENDING)]
+        with (
+            patch.object(batch_routes.operations, "get_batch", AsyncMock(return_value={"id": 1})),
+            patch.object(batch_routes.operations, "get_documents_in_batch", AsyncMock(return_value=["a", "b", "c"])),
+            patch.object(batch_routes.wf_ops, "get_workflows", AsyncMock(return_value=(runs, 2))),
+        ):
+            result = await batch_routes.batch_status(1, Mock())
+
+        assert result["document_count"] == 3
+        assert result["parsed"] == 1
+        assert result["remaining"] == 2
+        assert result["workflow_count"] == {RunStatus.COMPLETED.value: 1, RunStatus.PENDING.value: 1}
+
+    @pytest.mark.asyncio
+    async def test_not_found(self):
+        """Test that a missing batch returns 404."""
+        response = Mock()
+        with (
+            patch.object(batch_routes.operations, "get_batch", AsyncMock(return_value=None)),
+            patch.object(batch_routes.operations, "get_documents_in_batch", AsyncMock(return_value=[])),
+            patch.object(batch_routes.wf_ops, "get_workflows", AsyncMock(return_value=([], 0))),
+        ):
+            result = await batch_routes.batch_status(99, response)
+
+        assert response.status_code == status.HTTP_404_NOT_FOUND
+        assert result == {"error": "Batch 99 not found"}
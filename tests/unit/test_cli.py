@@ -0,0 +1,51 @@
+"""
+Unit tests for CLI module.
+
+Tests cover:
+- Event loop selection for long-running commands
+"""
+
+import asyncio
+import sys
+from unittest.mock import patch
+
+import pytest
+
+from soliplex.ingester import cli
+
+
+async def _loop_name() -> str:
+    return type(asyncio.get_running_loop()).__module__
+
+
+class TestRunEventLoop:
+    """Tests for _run_event_loop."""
+
+    def test_uses_uvloop(self):
+        """Test that uvloop runs the coroutine when it is installed."""
+        pytest.importorskip("uvloop")
+        with patch.object(cli.platform, "system", return_value="Linux"):
+            result = cli._run_event_loop(_loop_name())
+
+        assert result.startswith("uvloop")
+
+    def test_falls_back_without_uvloop(self):
+        """Test that the asyncio loop runs the coroutine when uvloop cannot be imported."""
+        # a None entry in sys.modules makes the import raise ImportError
+        with (
+            patch.object(cli.platform, "system", return_value="Linux"),
+            patch.dict(sys.modules, {"uvloop": None}),
+        ):
+            result = cli._run_event_loop(_loop_name())
+
+        assert result.startswith("asyncio")
+
+    def test_windows_uses_asyncio(self):
+        """Test that Windows keeps the asyncio loop for psycopg compatibility."""
+        with (
+            patch.object(cli.platform, "system", return_value="Windows"),
+            patch.object(cli.asyncio, "run", wraps=asyncio.run) as mock_run,
+        ):
+            cli._run_event_loop(_loop_name())
+
+        mock_run.assert_called_once()
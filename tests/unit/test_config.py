@@ -5,8 +5,8 @@ import soliplex.ingester.lib.config as cfg
 logger = logging.getLogger(__name__)
 
 
-def test_config_settings(monkeypatch):
+def test_config_settings():
     logger.info("test_config_settings started")
     settings = cfg.get_settings()
     assert settings
-    logger.info(f"settings={settings}")
+    logger.info("settings=%s", settings)
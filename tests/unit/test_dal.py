@@ -1,4 +1,5 @@
 import logging
+from types import SimpleNamespace
 from unittest.mock import AsyncMock
 from unittest.mock import Mock
 from unittest.mock import patch
@@ -11,6 +12,31 @@ from soliplex.ingester.lib import models
 logger = logging.getLogger(__name__)
 
 
+def _s3_config(**overrides) -> SimpleNamespace:
+    """Build S3 settings with valid values, overriding the given fields."""
+    fields = {
+        "bucket": "test-bucket",
+        "endpoint_url": "http://localhost:9000",
+        "access_key_id": "key",
+        "access_secret": "secret",
+        "region": "us-east-1",
+    }
+    fields.update(overrides)
+    return SimpleNamespace(**fields)
+
+
+@pytest.fixture
+def use_settings(monkeypatch):
+    """Return a function that makes dal.get_settings() return a namespace with the given fields."""
+
+    def _use(**fields) -> SimpleNamespace:
+        settings = SimpleNamespace(**fields)
+        monkeypatch.setattr(dal, "get_settings", lambda: settings)
+        return settings
+
+    return _use
+
+
 @pytest.mark.asyncio
 async def test_recursive_listdir(tmp_path):
     """Test recursive_listdir function"""
@@ -77,99 +103,80 @@ async def test_read_file_url(tmp_path):
 
 
 @pytest.mark.asyncio
-async def test_read_s3_url():
+async def test_read_s3_url(use_settings):
     """Test read_s3_url function"""
-    with patch("soliplex.ingester.lib.dal.get_settings") as mock_settings:
-        with patch("soliplex.ingester.lib.dal.opendal.AsyncOperator") as mock_op_class:
-            mock_s3_config = Mock()
-            mock_s3_config.bucket = "test-bucket"
-            mock_s3_config.endpoint_url = "http://localhost:9000"
-            mock_s3_config.access_key_id = "key"
-            mock_s3_config.access_secret = "secret"
-            mock_s3_config.region = "us-east-1"
+    use_settings(file_store_target="s3", input_s3=_s3_config())
+    with patch("soliplex.ingester.lib.dal.opendal.AsyncOperator") as mock_op_class:
+        mock_op = AsyncMock()
+        mock_op.read.return_value = b"s3 content"
+        mock_op_class.return_value = mock_op
 
-            mock_settings_obj = Mock()
-            mock_settings_obj.file_store_target = "s3"
-            mock_settings_obj.input_s3 = mock_s3_config
-            mock_settings.return_value = mock_settings_obj
+        result = await dal.read_s3_url("s3://test-bucket/path/to/file.txt")
+        assert result == b"s3 content"
+        mock_op.read.assert_called_once_with("path/to/file.txt")
 
-            mock_op = AsyncMock()
-            mock_op.read.return_value = b"s3 content"
-            mock_op_class.return_value = mock_op
 
-            result = await dal.read_s3_url("s3://test-bucket/path/to/file.txt")
-            assert result == b"s3 content"
-            mock_op.read.assert_called_once_with("path/to/file.txt")
+@pytest.fixture(params=["db", "fs"])
+def storage_op(request, tmp_path):
+    """A DBStorageOperator on a fresh database, or a FileStorageOperator on an empty directory."""
+    if request.param == "db":
+        request.getfixturevalue("db")
+        return dal.DBStorageOperator("doc", "test_root")
+    return dal.FileStorageOperator(str(tmp_path))
 
 
 @pytest.mark.asyncio
-async def test_db_storage_operator_read(db):
-    """Test DBStorageOperator read method"""
-    op = dal.DBStorageOperator("doc", "test_root")
-
-    # Write a document first
+async def test_storage_operator_write_read(storage_op):
+    """Test that written bytes read back unchanged"""
     test_bytes = b"test content"
-    await op.write("test_hash", test_bytes)
+    await storage_op.write("test_hash", test_bytes)
 
-    # Read it back
-    result = await op.read("test_hash")
+    result = await storage_op.read("test_hash")
     assert result == test_bytes
 
 
 @pytest.mark.asyncio
-async def test_db_storage_operator_read_not_found(db):
-    """Test DBStorageOperator read method with file not found"""
-    op = dal.DBStorageOperator("doc", "test_root")
-
+async def test_storage_operator_read_not_found(storage_op):
+    """Test read of a missing path"""
     with pytest.raises(FileNotFoundError):
-        await op.read("nonexistent_hash")
+        await storage_op.read("nonexistent_hash")
 
 
 @pytest.mark.asyncio
-async def test_db_storage_operator_exists(db):
-    """Test DBStorageOperator exists method"""
+async def test_storage_operator_exists(storage_op):
+    """Test exists before and after a write"""
+    assert not await storage_op.exists("test_hash")
 
-    op = dal.DBStorageOperator("doc", "test_root")
+    await storage_op.write("test_hash", b"test content")
 
-    # Should not exist initially
-    exists = await op.exists("test_hash")
-    assert not exists
-
-    # Write a document
-    await op.write("test_hash", b"test content")
-
-    # Should exist now
-    exists = await op.exists("test_hash")
-    assert exists
+    assert await storage_op.exists("test_hash")
 
 
 @pytest.mark.asyncio
-async def test_db_storage_operator_write(db):
-    """Test DBStorageOperator write method"""
-    op = dal.DBStorageOperator("doc", "test_root")
+async def test_storage_operator_delete(storage_op):
+    """Test that a deleted path no longer exists"""
+    await storage_op.write("test_hash", b"test content")
+    assert await storage_op.exists("test_hash")
 
-    test_bytes = b"test content"
-    await op.write("test_hash", test_bytes)
+    await storage_op.delete("test_hash")
 
-    # Verify it was written
-    result = await op.read("test_hash")
-    assert result == test_bytes
+    assert not await storage_op.exists("test_hash")
 
 
 @pytest.mark.asyncio
-async def test_db_storage_operator_list(db):
-    """Test DBStorageOperator list method"""
-    op = dal.DBStorageOperator("doc", "test_root")
+async def test_storage_operator_delete_missing(storage_op):
+    """Test delete of a missing path"""
+    with pytest.raises(FileNotFoundError):
+        await storage_op.delete("test_hash")
 
-    # Write multiple documents
-    await op.write("hash1", b"content1")
-    await op.write("hash2", b"content2")
 
-    # List them
-    hashes = await op.list("")
-    assert len(hashes) == 2
-    assert "hash1" in hashes
-    assert "hash2" in hashes
+@pytest.mark.asyncio
+async def test_storage_operator_list(storage_op):
+    """Test list after writing two paths"""
+    await storage_op.write("hash1_ab", b"content1")
+    await storage_op.write("hash2_cd", b"content2")
+
+    assert sorted(await storage_op.list("")) == ["hash1_ab", "hash2_cd"]
 
 
 @pytest.mark.asyncio
@@ -182,36 +189,6 @@ async def test_db_storage_operator_get_uri():
     assert uri == "bytes://test_hash"
 
 
-@pytest.mark.asyncio
-async def test_db_storage_operator_delete(db):
-    """Test DBStorageOperator delete method"""
-    op = dal.DBStorageOperator("doc", "test_root")
-
-    # Write a document
-    await op.write("test_hash", b"test content")
-
-    # Verify it exists
-    exists = await op.exists("test_hash")
-    assert exists
-
-    # Delete it
-    await op.delete("test_hash")
-
-    # Verify it's gone
-    exists = await op.exists("test_hash")
-    assert not exists
-
-
-@pytest.mark.asyncio
-async def test_db_storage_operator_delete_missing(db):
-    """Test DBStorageOperator delete method"""
-    op = dal.DBStorageOperator("doc", "test_root")
-
-    # Delete a document that doesn't exist
-    with pytest.raises(FileNotFoundError):
-        await op.delete("test_hash")
-
-
 @pytest.mark.asyncio
 async def test_file_storage_operator_init_relative_path(tmp_path):
     """Test FileStorageOperator initialization with relative path"""
@@ -229,80 +206,6 @@ async def test_file_storage_operator_init_absolute_path(tmp_path):
     assert test_path.exists()
 
 
-@pytest.mark.asyncio
-async def test_file_storage_operator_read(tmp_path):
-    """Test FileStorageOperator read method"""
-    op = dal.FileStorageOperator(str(tmp_path))
-    test_bytes = b"test content"
-    await op.write("test_hash_abc", test_bytes)
-
-    result = await op.read("test_hash_abc")
-    assert result == test_bytes
-
-
-@pytest.mark.asyncio
-async def test_file_storage_operator_exists(tmp_path):
-    """Test FileStorageOperator exists method"""
-    op = dal.FileStorageOperator(str(tmp_path))
-
-    # Should not exist initially
-    exists = await op.exists("test_hash_xyz")
-    assert not exists
-
-    # Write a file
-    await op.write("test_hash_xyz", b"test content")
-
-    # Should exist now
-    exists = await op.exists("test_hash_xyz")
-    assert exists
-
-
-@pytest.mark.asyncio
-async def test_file_storage_operator_write(tmp_path):
-    """Test FileStorageOperator write method"""
-    op = dal.FileStorageOperator(str(tmp_path))
-    test_bytes = b"test content"
-    await op.write("test_hash_def", test_bytes)
-
-    # Verify it was written
-    result = await op.read("test_hash_def")
-    assert result == test_bytes
-
-
-@pytest.mark.asyncio
-async def test_file_storage_operator_delete(tmp_path):
-    """Test FileStorageOperator delete method"""
-    op = dal.FileStorageOperator(str(tmp_path))
-
-    # Write a file
-    await op.write("test_hash_ghi", b"test content")
-
-    # Verify it exists
-    exists = await op.exists("test_hash_ghi")
-    assert exists
-
-    # Delete it
-    await op.delete("test_hash_ghi")
-
-    # Verify it's gone
-    exists = await op.exists("test_hash_ghi")
-    assert not exists
-
-
-@pytest.mark.asyncio
-async def test_file_storage_operator_list(tmp_path):
-    """Test FileStorageOperator list method"""
-    op = dal.FileStorageOperator(str(tmp_path))
-
-    # Write multiple files
-    await op.write("hash1_ab", b"content1")
-    await op.write("hash2_cd", b"content2")
-
-    # List them
-    files = await op.list("")
-    assert len(files) >= 2
-
-
 @pytest.mark.asyncio
 async def test_file_storage_operator_get_uri(tmp_path):
     """Test FileStorageOperator get_uri method"""
@@ -311,100 +214,59 @@ async def test_file_storage_operator_get_uri(tmp_path):
     assert uri.startswith("file://")
 
 
-def test_get_storage_operator_doc_artifact():
+def test_get_storage_operator_doc_artifact(use_settings):
     """Test get_storage_operator with DOC artifact type"""
-    with patch("soliplex.ingester.lib.dal.get_settings") as mock_settings:
-        mock_settings.return_value = Mock(
-            file_store_target="db",
-            file_store_dir="/tmp",
-            doc_store_dir="docs",
-        )
-        op = dal.get_storage_operator(models.ArtifactType.DOC)
-        assert isinstance(op, dal.DBStorageOperator)
+    use_settings(file_store_target="db", file_store_dir="/tmp", document_store_dir="docs")
+    op = dal.get_storage_operator(models.ArtifactType.DOC)
+    assert isinstance(op, dal.DBStorageOperator)
 
 
-def test_get_storage_operator_fs_target(tmp_path):
+def test_get_storage_operator_fs_target(use_settings, tmp_path):
     """Test get_storage_operator with fs target"""
-    with patch("soliplex.ingester.lib.dal.get_settings") as mock_settings:
-        mock_settings_obj = Mock()
-        mock_settings_obj.file_store_target = "fs"
-        mock_settings_obj.file_store_dir = str(tmp_path)
-        mock_settings_obj.document_store_dir = "docs"
-        mock_settings.return_value = mock_settings_obj
+    use_settings(file_store_target="fs", file_store_dir=str(tmp_path), document_store_dir="docs")
+    op = dal.get_storage_operator(models.ArtifactType.DOC)
+    assert isinstance(op, dal.FileStorageOperator)
 
-        op = dal.get_storage_operator(models.ArtifactType.DOC)
-        assert isinstance(op, dal.FileStorageOperator)
 
-
-def test_get_storage_operator_s3_target():
+def test_get_storage_operator_s3_target(use_settings):
     """Test get_storage_operator with s3 target"""
-
-    with patch("soliplex.ingester.lib.dal.get_settings") as mock_settings:
-        with patch("soliplex.ingester.lib.dal.opendal.AsyncOperator") as mock_op:
-            # Create mock S3 config
-            mock_s3_config = Mock()
-            mock_s3_config.bucket = "test-bucket"
-            mock_s3_config.endpoint_url = "http://localhost:9000"
-            mock_s3_config.access_key_id = "key"
-            mock_s3_config.access_secret = "secret"
-            mock_s3_config.region = "us-east-1"
-
-            mock_settings_obj = Mock()
-            mock_settings_obj.file_store_target = "s3"
-            mock_settings_obj.s3_doc = mock_s3_config
-            mock_settings.return_value = mock_settings_obj
-
-            _ = dal.get_storage_operator(models.ArtifactType.DOC)
-            mock_op.assert_called_once()
+    use_settings(file_store_target="s3", document_store_dir="docs", artifact_s3=_s3_config())
+    with patch("soliplex.ingester.lib.dal.opendal.AsyncOperator") as mock_op:
+        _ = dal.get_storage_operator(models.ArtifactType.DOC)
+        mock_op.assert_called_once()
 
 
-def test_get_storage_operator_unknown_target():
+def test_get_storage_operator_unknown_target(use_settings):
     """Test get_storage_operator with unknown target"""
-    with patch("soliplex.ingester.lib.dal.get_settings") as mock_settings:
-        mock_settings.return_value = Mock(file_store_target="unknown")
-        with pytest.raises(ValueError, match="Unknown target"):
-            dal.get_storage_operator(models.ArtifactType.DOC)
+    use_settings(file_store_target="unknown")
+    with pytest.raises(ValueError, match="Unknown target"):
+        dal.get_storage_operator(models.ArtifactType.DOC)
 
 
-def test_get_storage_operator_requires_step_config():
+def test_get_storage_operator_requires_step_config(use_settings):
     """Test get_storage_operator requires step_config for non-DOC artifacts"""
-    with patch("soliplex.ingester.lib.dal.get_settings") as mock_settings:
-        mock_settings.return_value = Mock(file_store_target="db")
-        with pytest.raises(ValueError, match="step_config is required"):
-            dal.get_storage_operator(models.ArtifactType.PARSED_MD)
+    use_settings(file_store_target="db")
+    with pytest.raises(ValueError, match="step_config is required"):
+        dal.get_storage_operator(models.ArtifactType.PARSED_MD)
 
 
-def test_get_storage_operator_validates_artifact_type():
+def test_get_storage_operator_validates_artifact_type(use_settings):
     """Test get_storage_operator validates artifact type against step type"""
-    mock_step_config = Mock()
-    mock_step_config.step_type = models.WorkflowStepType.INGEST
-    mock_step_config.id = 1
-
-    with patch("soliplex.ingester.lib.dal.get_settings") as mock_settings:
-        mock_settings.return_value = Mock(
-            file_store_target="db",
-            file_store_dir="/tmp",
-            parsed_md_store_dir="parsed",
-        )
-        # INGEST step should not produce PARSED_MD artifact
-        with pytest.raises(ValueError, match="Artifact type .* is not expected"):
-            dal.get_storage_operator(models.ArtifactType.PARSED_MD, step_config=mock_step_config)
+    step_config = SimpleNamespace(step_type=models.WorkflowStepType.INGEST, id=1)
+
+    use_settings(file_store_target="db", file_store_dir="/tmp", parsed_markdown_store_dir="parsed")
+    # INGEST step should not produce PARSED_MD artifact
+    with pytest.raises(ValueError, match="Artifact type .* is not expected"):
+        dal.get_storage_operator(models.ArtifactType.PARSED_MD, step_config=step_config)
 
 
-def test_get_storage_operator_with_valid_step_config():
+def test_get_storage_operator_with_valid_step_config(use_settings):
     """Test get_storage_operator with valid step config"""
-    mock_step_config = Mock()
-    mock_step_config.step_type = models.WorkflowStepType.PARSE
-    mock_step_config.id = 1
-
-    with patch("soliplex.ingester.lib.dal.get_settings") as mock_settings:
-        mock_settings.return_value = Mock(
-            file_store_target="db",
-            file_store_dir="/tmp",
-            parsed_md_store_dir="parsed",
-        )
-        op = dal.get_storage_operator(models.ArtifactType.PARSED_MD, step_config=mock_step_config)
-        assert isinstance(op, dal.DBStorageOperator)
+    step_config = SimpleNamespace(step_type=models.WorkflowStepType.PARSE, id=1)
+
+    use_settings(file_store_target="db", file_store_dir="/tmp", parsed_markdown_store_dir="parsed")
+    op = dal.get_storage_operator(models.ArtifactType.PARSED_MD, step_config=step_config)
+    assert isinstance(op, dal.DBStorageOperator)
 
 
 def test_file_operator_store_path():
@@ -418,11 +280,7 @@ def test_file_operator_store_path():
 # Tests for validate_s3_settings function
 def test_validate_s3_settings_missing_access_key_id():
     """Test validate_s3_settings raises error for missing access_key_id"""
-    s3_settings = Mock()
-    s3_settings.access_key_id = "default"
-    s3_settings.access_secret = "secret"
-    s3_settings.region = "us-east-1"
-    s3_settings.bucket = "test-bucket"
+    s3_settings = _s3_config(access_key_id="default")
 
     with pytest.raises(ValueError, match="s3.access_key_id is required"):
         dal.validate_s3_settings(s3_settings)
@@ -430,11 +288,7 @@ def test_validate_s3_settings_missing_access_key_id():
 
 def test_validate_s3_settings_empty_access_key_id():
     """Test validate_s3_settings raises error for empty access_key_id"""
-    s3_settings = Mock()
-    s3_settings.access_key_id = ""
-    s3_settings.access_secret = "secret"
-    s3_settings.region = "us-east-1"
-    s3_settings.bucket = "test-bucket"
+    s3_settings = _s3_config(access_key_id="")
 
     with pytest.raises(ValueError, match="s3.access_key_id is required"):
         dal.validate_s3_settings(s3_settings)
@@ -442,11 +296,7 @@ def test_validate_s3_settings_empty_access_key_id():
 
 def test_validate_s3_settings_missing_access_secret():
     """Test validate_s3_settings raises error for missing access_secret"""
-    s3_settings = Mock()
-    s3_settings.access_key_id = "key"
-    s3_settings.access_secret = "default"
-    s3_settings.region = "us-east-1"
-    s3_settings.bucket = "test-bucket"
+    s3_settings = _s3_config(access_secret="default")
 
     with pytest.raises(ValueError, match="s3.access_secret is required"):
         dal.validate_s3_settings(s3_settings)
@@ -454,11 +304,7 @@ def test_validate_s3_settings_missing_access_secret():
 
 def test_validate_s3_settings_empty_access_secret():
     """Test validate_s3_settings raises error for empty access_secret"""
-    s3_settings = Mock()
-    s3_settings.access_key_id = "key"
-    s3_settings.access_secret = ""
-    s3_settings.region = "us-east-1"
-    s3_settings.bucket = "test-bucket"
+    s3_settings = _s3_config(access_secret="")
 
     with pytest.raises(ValueError, match="s3.access_secret is required"):
         dal.validate_s3_settings(s3_settings)
@@ -466,11 +312,7 @@ def test_validate_s3_settings_empty_access_secret():
 
 def test_validate_s3_settings_missing_region():
     """Test validate_s3_settings raises error for missing region"""
-    s3_settings = Mock()
-    s3_settings.access_key_id = "key"
-    s3_settings.access_secret = "secret"
-    s3_settings.region = "default"
-    s3_settings.bucket = "test-bucket"
+    s3_settings = _s3_config(region="default")
 
     with pytest.raises(ValueError, match="s3.region is required"):
         dal.validate_s3_settings(s3_settings)
@@ -478,11 +320,7 @@ def test_validate_s3_settings_missing_region():
 
 def test_validate_s3_settings_empty_region():
     """Test validate_s3_settings raises error for empty region"""
-    s3_settings = Mock()
-    s3_settings.access_key_id = "key"
-    s3_settings.access_secret = "secret"
-    s3_settings.region = ""
-    s3_settings.bucket = "test-bucket"
+    s3_settings = _s3_config(region="")
 
     with pytest.raises(ValueError, match="s3.region is required"):
         dal.validate_s3_settings(s3_settings)
@@ -490,11 +328,7 @@ def test_validate_s3_settings_empty_region():
 
 def test_validate_s3_settings_missing_bucket():
     """Test validate_s3_settings raises error for missing bucket"""
-    s3_settings = Mock()
-    s3_settings.access_key_id = "key"
-    s3_settings.access_secret = "secret"
-    s3_settings.region = "us-east-1"
-    s3_settings.bucket = "default"
+    s3_settings = _s3_config(bucket="default")
 
     with pytest.raises(ValueError, match="s3.bucket is required"):
         dal.validate_s3_settings(s3_settings)
@@ -502,11 +336,7 @@ def test_validate_s3_settings_missing_bucket():
 
 def test_validate_s3_settings_empty_bucket():
     """Test validate_s3_settings raises error for empty bucket"""
-    s3_settings = Mock()
-    s3_settings.access_key_id = "key"
-    s3_settings.access_secret = "secret"
-    s3_settings.region = "us-east-1"
-    s3_settings.bucket = ""
+    s3_settings = _s3_config(bucket="")
 
     with pytest.raises(ValueError, match="s3.bucket is required"):
         dal.validate_s3_settings(s3_settings)
@@ -514,11 +344,7 @@ def test_validate_s3_settings_empty_bucket():
 
 def test_validate_s3_settings_valid():
     """Test validate_s3_settings passes with valid settings"""
-    s3_settings = Mock()
-    s3_settings.access_key_id = "key"
-    s3_settings.access_secret = "secret"
-    s3_settings.region = "us-east-1"
-    s3_settings.bucket = "test-bucket"
+    s3_settings = _s3_config()
 
     # Should not raise
     dal.validate_s3_settings(s3_settings)
@@ -527,12 +353,7 @@ def test_validate_s3_settings_valid():
 def test_create_s3_operator():
     """Test create_s3_operator function"""
     with patch("soliplex.ingester.lib.dal.opendal.AsyncOperator") as mock_op:
-        s3_settings = Mock()
-        s3_settings.access_key_id = "key"
-        s3_settings.access_secret = "secret"
-        s3_settings.region = "us-east-1"
-        s3_settings.bucket = "test-bucket"
-        s3_settings.endpoint_url = "http://localhost:9000"
+        s3_settings = _s3_config()
 
         dal.create_s3_operator(s3_settings, root="/test")
 
@@ -548,18 +369,11 @@ def test_create_s3_operator():
 
 
 @pytest.mark.asyncio
-async def test_read_s3_url_bucket_mismatch():
+async def test_read_s3_url_bucket_mismatch(use_settings):
     """Test read_s3_url raises error when bucket doesn't match configured bucket"""
-    with patch("soliplex.ingester.lib.dal.get_settings") as mock_settings:
-        mock_s3_config = Mock()
-        mock_s3_config.bucket = "configured-bucket"
-
-        mock_settings_obj = Mock()
-        mock_settings_obj.input_s3 = mock_s3_config
-        mock_settings.return_value = mock_settings_obj
-
-        with pytest.raises(ValueError, match="bucket .* does not match configured bucket"):
-            await dal.read_s3_url("s3://different-bucket/path/to/file.txt")
+    use_settings(input_s3=_s3_config(bucket="configured-bucket"))
+    with pytest.raises(ValueError, match="bucket .* does not match configured bucket"):
+        await dal.read_s3_url("s3://different-bucket/path/to/file.txt")
 
 
 # Tests for OpenDALAdapter class
@@ -616,15 +430,9 @@ async def test_opendal_adapter_list():
     """Test OpenDALAdapter list method"""
     mock_op = AsyncMock()
 
-    # Create mock entries
-    mock_entry1 = Mock()
-    mock_entry1.path = "file1.txt"
-    mock_entry2 = Mock()
-    mock_entry2.path = "file2.txt"
-
     # Mock the async iterator
     async def mock_list(prefix):
-        for entry in [mock_entry1, mock_entry2]:
+        for entry in [SimpleNamespace(path="file1.txt"), SimpleNamespace(path="file2.txt")]:
             yield entry
 
     mock_op.list.return_value = mock_list("")
@@ -0,0 +1,149 @@
+"""Tests for soliplex.ingester.lib.http_cache module."""
+
+from unittest.mock import Mock
+
+import pytest
+from fastapi import FastAPI
+from fastapi import Response
+from fastapi.testclient import TestClient
+
+from soliplex.ingester.lib.http_cache import ETagMiddleware
+from soliplex.ingester.lib.http_cache import content_etag
+from soliplex.ingester.lib.http_cache import etag_matches
+from soliplex.ingester.lib.http_cache import last_modified
+from soliplex.ingester.lib.http_cache import not_modified_since
+
+# 2024-01-01 12:00:00.5 UTC
+MTIME_NS = 1_704_110_400_500_000_000
+
+
+def test_etag_matches():
+    """Test If-None-Match comparison."""
+    etag = 'W/"abc"'
+    assert etag_matches(Mock(headers={"if-none-match": 'W/"abc"'}), etag)
+    assert etag_matches(Mock(headers={"if-none-match": '"abc"'}), etag)
+    assert etag_matches(Mock(headers={"if-none-match": '"other", W/"abc"'}), etag)
+    assert etag_matches(Mock(headers={"if-none-match": "*"}), etag)
+    assert not etag_matches(Mock(headers={"if-none-match": 'W/"other"'}), etag)
+    assert not etag_matches(Mock(headers={}), etag)
+
+
+def test_content_etag():
+    """Test that the content ETag depends only on the body."""
+    assert content_etag(b"abc") == content_etag(b"abc")
+    assert content_etag(b"abc") != content_etag(b"abd")
+    assert content_etag(b"abc").startswith('"')
+
+
+def test_last_modified():
+    """Test that mtimes are formatted as HTTP dates."""
+    assert last_modified(MTIME_NS) == "Mon, 01 Jan 2024 12:00:00 GMT"
+
+
+@pytest.mark.parametrize(
+    "headers,expected",
+    [
+        ({"if-modified-since": "Mon, 01 Jan 2024 12:00:00 GMT"}, True),
+        ({"if-modified-since": "Mon, 01 Jan 2024 13:00:00 GMT"}, True),
+        ({"if-modified-since": "Mon, 01 Jan 2024 11:59:59 GMT"}, False),
+        ({"if-modified-since": "not a date"}, False),
+        ({"if-modified-since": "Mon, 01 Jan 2024 12:00:00 GMT", "if-none-match": '"abc"'}, False),
+        ({}, False),
+    ],
+)
+def test_not_modified_since(headers, expected):
+    """Test If-Modified-Since comparison at one-second resolution."""
+    assert not_modified_since(Mock(headers=headers), MTIME_NS) is expected
+
+
+@pytest.fixture
+def client():
+    """Create a small app with the ETag middleware on /cached."""
+    state = {"body": "id: one\n"}
+    app = FastAPI()
+    app.add_middleware(ETagMiddleware, paths=("/cached",))
+
+    @app.get("/cached/yaml")
+    async def cached_yaml():
+        return Response(content=state["body"], media_type="text/yaml")
+
+    @app.get("/cached/missing")
+    async def cached_missing(response: Response):
+        response.status_code = 404
+        return {"error": "not found"}
+
+    @app.get("/cached/cookies")
+    async def cached_cookies(response: Response):
+        response.set_cookie("a", "1")
+        response.set_cookie("b", "2")
+        return {"ok": True}
+
+    @app.get("/other")
+    async def other():
+        return {"ok": True}
+
+    return TestClient(app), state
+
+
+def test_middleware_adds_headers(client):
+    """Test that cached paths get ETag and Cache-Control headers."""
+    test_client, _ = client
+
+    response = test_client.get("/cached/yaml")
+
+    assert response.status_code == 200
+    assert response.text == "id: one\n"
+    assert response.headers["etag"] == content_etag(b"id: one\n")
+    assert response.headers["cache-control"] == "no-cache"
+    assert response.headers["content-type"].startswith("text/yaml")
+
+
+def test_middleware_keeps_repeated_headers(client):
+    """Test that repeated headers such as Set-Cookie survive the rebuilt response."""
+    test_client, _ = client
+
+    response = test_client.get("/cached/cookies")
+
+    assert response.status_code == 200
+    assert response.json() == {"ok": True}
+    assert len(response.headers.get_list("set-cookie")) == 2
+    assert response.headers["etag"] == content_etag(response.content)
+    assert len(response.headers.get_list("etag")) == 1
+
+
+def test_middleware_not_modified(client):
+    """Test that a matching If-None-Match returns an empty 304."""
+    test_client, _ = client
+    etag = test_client.get("/cached/yaml").headers["etag"]
+
+    response = test_client.get("/cached/yaml", headers={"If-None-Match": etag})
+
+    assert response.status_code == 304
+    assert response.content == b""
+    assert response.headers["etag"] == etag
+
+
+def test_middleware_changed_content(client):
+    """Test that changed content is served with a new ETag."""
+    test_client, state = client
+    etag = test_client.get("/cached/yaml").headers["etag"]
+    state["body"] = "id: two\n"
+
+    response = test_client.get("/cached/yaml", headers={"If-None-Match": etag})
+
+    assert response.status_code == 200
+    assert response.text == "id: two\n"
+    assert response.headers["etag"] != etag
+
+
+def test_middleware_skips_errors_and_other_paths(client):
+    """Test that error responses and unlisted paths are left alone."""
+    test_client, _ = client
+
+    missing = test_client.get("/cached/missing")
+    other = test_client.get("/other")
+
+    assert missing.status_code == 404
+    assert "etag" not in missing.headers
+    assert other.status_code == 200
+    assert "etag" not in other.headers
@@ -9,20 +9,71 @@ Tests cover:
 - Helper functions
 """
 
+import asyncio
+import os
+import threading
+from datetime import datetime
 from pathlib import Path
 from unittest.mock import AsyncMock
 from unittest.mock import MagicMock
-from unittest.mock import Mock
 from unittest.mock import patch
 
+import lancedb
+import pyarrow as pa
 import pytest
 from fastapi.testclient import TestClient
+from haiku.rag.store.engine import get_documents_arrow_schema
 
-from soliplex.ingester.lib.config import Settings
+from soliplex.ingester.server.routes.lancedb import _conn_cache
+from soliplex.ingester.server.routes.lancedb import _conn_locks
+from soliplex.ingester.server.routes.lancedb import _package_version
+from soliplex.ingester.server.routes.lancedb import clear_caches
+from soliplex.ingester.server.routes.lancedb import count_chunks
 from soliplex.ingester.server.routes.lancedb import create_app
 from soliplex.ingester.server.routes.lancedb import format_bytes
+from soliplex.ingester.server.routes.lancedb import get_connection
 from soliplex.ingester.server.routes.lancedb import get_folder_size
+from soliplex.ingester.server.routes.lancedb import query_documents
 from soliplex.ingester.server.routes.lancedb import resolve_lancedb_path
+from soliplex.ingester.server.routes.lancedb import tree_etag
+from tests.factories import make_settings
+
+
+@pytest.fixture(autouse=True)
+def _clear_connections():
+    """Keep cached LanceDB connections from leaking between tests."""
+    clear_caches()
+    yield
+    clear_caches()
+
+
+def _document_row(doc_id: str, **overrides) -> dict:
+    """Build a haiku.rag documents table row."""
+    row = {
+        "id": doc_id,
+        "content": "document content",
+        "uri": f"/path/to/{doc_id}.pdf",
+        "title": f"Title {doc_id}",
+        "metadata": "{}",
+        "docling_document": b"docling",
+        "docling_version": "1.0",
+        "created_at": "2024-01-01T12:00:00",
+        "updated_at": "2024-01-01T12:00:00",
+    }
+    row.update(overrides)
+    return row
+
+
+def _make_database(path: Path, rows: list[dict], chunk_document_ids: list[str] = ()):
+    """Create real LanceDB documents and chunks tables with the columns the listing reads."""
+    db_conn = lancedb.connect(path)
+    documents_table = db_conn.create_table("documents", schema=get_documents_arrow_schema())
+    if rows:
+        documents_table.add(rows)
+    chunks_schema = pa.schema([("id", pa.string()), ("document_id", pa.string())])
+    chunks = [{"id": f"chunk-{i}", "document_id": doc_id} for i, doc_id in enumerate(chunk_document_ids)]
+    db_conn.create_table("chunks", data=chunks or None, schema=chunks_schema)
+    return db_conn
 
 
 class TestHelperFunctions:
@@ -56,6 +107,29 @@ class TestHelperFunctions:
         """Test formatting zero bytes."""
         assert format_bytes(0) == "0.00 B"
 
+    def test_format_bytes_unit_boundaries(self):
+        """Test formatting just below and above unit boundaries."""
+        assert format_bytes(1023) == "1023.00 B"
+        assert format_bytes(1024 * 1024 - 1) == "1024.00 KB"
+        assert format_bytes(1536 * 1024) == "1.50 MB"
+
+    def test_format_bytes_beyond_petabytes(self):
+        """Test formatting sizes larger than the biggest unit."""
+        assert format_bytes(2048 * 1024**5) == "2048.00 PB"
+
+    def test_package_version_installed(self):
+        """Test resolving the version of an installed package."""
+        with patch("soliplex.ingester.server.routes.lancedb.pkg_version", return_value="1.2.3"):
+            assert _package_version("lancedb") == "1.2.3"
+
+    def test_package_version_missing(self):
+        """Test resolving the version of a missing package."""
+        with patch(
+            "soliplex.ingester.server.routes.lancedb.pkg_version",
+            side_effect=ModuleNotFoundError("Package not found"),
+        ):
+            assert _package_version("missing") == "unknown"
+
     def test_get_folder_size_permission_error(self, tmp_path):
         """Test getting size when permission error occurs."""
         # Mock rglob to raise PermissionError
@@ -142,6 +216,22 @@ class TestHelperFunctions:
         (subdir / "file2.txt").write_bytes(b"y" * 200)
         assert get_folder_size(test_dir) == 300
 
+    def test_tree_etag_stable(self, tmp_path):
+        """Test that an unchanged tree produces the same weak ETag."""
+        (tmp_path / "db" / "chunks.lance").mkdir(parents=True)
+        etag = tree_etag(tmp_path)
+        assert etag.startswith('W/"')
+        assert tree_etag(tmp_path) == etag
+
+    def test_tree_etag_changes_when_files_added(self, tmp_path):
+        """Test that adding a file in a nested directory changes the ETag."""
+        data_dir = tmp_path / "db" / "chunks.lance" / "data"
+        data_dir.mkdir(parents=True)
+        before = tree_etag(tmp_path)
+        (data_dir / "fragment.lance").write_bytes(b"x")
+        os.utime(data_dir, ns=(0, os.stat(data_dir).st_mtime_ns + 1))
+        assert tree_etag(tmp_path) != before
+
     def test_get_folder_size_nonexistent(self, tmp_path):
         """Test getting size of non-existent folder."""
         nonexistent = tmp_path / "nonexistent"
@@ -149,29 +239,100 @@ class TestHelperFunctions:
         assert get_folder_size(nonexistent) == 0
 
 
+class TestConnectionCache:
+    """Tests for the LanceDB connection cache."""
+
+    @pytest.mark.asyncio
+    async def test_get_connection_reuses_connection(self, tmp_path):
+        """Test that a second lookup within the TTL reuses the connection."""
+        mock_conn = MagicMock()
+        with patch("lancedb.connect", return_value=mock_conn) as mock_connect:
+            first = await get_connection(tmp_path)
+            second = await get_connection(tmp_path)
+
+        assert first is mock_conn
+        assert second is mock_conn
+        mock_connect.assert_called_once_with(tmp_path)
+
+    @pytest.mark.asyncio
+    async def test_get_connection_reopens_after_ttl(self, tmp_path):
+        """Test that an expired connection is replaced."""
+        with (
+            patch("lancedb.connect", side_effect=[MagicMock(), MagicMock()]) as mock_connect,
+            patch("soliplex.ingester.server.routes.lancedb.CONNECTION_TTL", 0.0),
+        ):
+            first = await get_connection(tmp_path)
+            second = await get_connection(tmp_path)
+
+        assert first is not second
+        assert mock_connect.call_count == 2
+
+    @pytest.mark.asyncio
+    async def test_get_connection_keyed_by_path(self, tmp_path):
+        """Test that different databases get different connections."""
+        with patch("lancedb.connect", side_effect=[MagicMock(), MagicMock()]):
+            first = await get_connection(tmp_path / "a")
+            second = await get_connection(tmp_path / "b")
+
+        assert first is not second
+
+    @pytest.mark.asyncio
+    async def test_get_connection_evicts_expired_entries(self, tmp_path):
+        """Test that expired connections for other paths are dropped from the cache."""
+        with patch("lancedb.connect", side_effect=[MagicMock(), MagicMock()]):
+            await get_connection(tmp_path / "a")
+            with patch("soliplex.ingester.server.routes.lancedb.CONNECTION_TTL", 0.0):
+                await get_connection(tmp_path / "b")
+
+        assert list(_conn_cache) == [tmp_path / "b"]
+        assert list(_conn_locks) == [tmp_path / "b"]
+
+    @pytest.mark.asyncio
+    async def test_get_connection_slow_connect_does_not_block_other_paths(self, tmp_path):
+        """Test that a connect in progress for one path does not hold up another path."""
+        release = threading.Event()
+        fast_conn = MagicMock()
+
+        def connect(path):
+            if path == tmp_path / "slow":
+                release.wait(5)
+            return fast_conn if path == tmp_path / "fast" else MagicMock()
+
+        with patch("lancedb.connect", side_effect=connect):
+            slow = asyncio.create_task(get_connection(tmp_path / "slow"))
+            await asyncio.sleep(0.05)
+            try:
+                fast = await asyncio.wait_for(get_connection(tmp_path / "fast"), timeout=2)
+            finally:
+                release.set()
+                await slow
+
+        assert fast is fast_conn
+
+
 class TestListDatabases:
     """Tests for /api/v1/lancedb/list endpoint."""
 
     @pytest.fixture
     def client(self):
         """Create test client with mocked dependencies."""
-        settings = Mock(spec=Settings)
-        settings.api_key_enabled = False
-        settings.auth_trust_proxy_headers = False
-        settings.doc_db_url = "sqlite+aiosqlite:///:memory:"
-        settings.log_level = "INFO"
-        settings.lancedb_dir = "/data/lancedb"
+        settings = make_settings(
+            api_key_enabled=False,
+            auth_trust_proxy_headers=False,
+            doc_db_url="sqlite+aiosqlite:///:memory:",
+            log_level="INFO",
+            lancedb_dir="/data/lancedb",
+        )
 
-        with patch("soliplex.ingester.lib.wf.runner.start_worker", new_callable=AsyncMock):
-            from soliplex.ingester.lib.config import get_settings
-            from soliplex.ingester.server import app
+        from soliplex.ingester.lib.config import get_settings
+        from soliplex.ingester.server import app
 
-            app.dependency_overrides[get_settings] = lambda: settings
+        app.dependency_overrides[get_settings] = lambda: settings
 
-            client = TestClient(app, raise_server_exceptions=False)
-            yield client, settings
+        client = TestClient(app, raise_server_exceptions=False)
+        yield client, settings
 
-            app.dependency_overrides.clear()
+        app.dependency_overrides.clear()
 
     def test_list_databases_dir_not_exists(self, client):
         """Test listing databases when directory doesn't exist."""
@@ -260,6 +421,52 @@ class TestListDatabases:
             assert data["database_count"] == 1
             assert data["databases"][0]["name"] == "valid.lancedb"
 
+    def test_list_databases_not_modified(self, client, tmp_path):
+        """Test that a matching If-None-Match returns 304 without walking databases."""
+        test_client, settings = client
+        settings.lancedb_dir = str(tmp_path)
+        (tmp_path / "db1" / "chunks.lance").mkdir(parents=True)
+
+        with patch("soliplex.ingester.server.routes.lancedb.get_settings", return_value=settings):
+            first = test_client.get("/api/v1/lancedb/list")
+            etag = first.headers["etag"]
+
+            with patch("soliplex.ingester.server.routes.lancedb.get_folder_size") as mock_size:
+                response = test_client.get("/api/v1/lancedb/list", headers={"If-None-Match": etag})
+
+                assert response.status_code == 304
+                assert response.headers["etag"] == etag
+                mock_size.assert_not_called()
+
+            (tmp_path / "db2" / "chunks.lance").mkdir(parents=True)
+            response = test_client.get("/api/v1/lancedb/list", headers={"If-None-Match": etag})
+
+            assert response.status_code == 200
+            assert response.headers["etag"] != etag
+            assert response.json()["database_count"] == 2
+
+    def test_list_databases_etag_off_event_loop(self, client, tmp_path):
+        """Test that the directory walk for the ETag runs in a worker thread."""
+        test_client, settings = client
+        settings.lancedb_dir = str(tmp_path)
+        loops = []
+
+        def record_loop(root):
+            try:
+                loops.append(asyncio.get_running_loop())
+            except RuntimeError:
+                loops.append(None)
+            return tree_etag(root)
+
+        with (
+            patch("soliplex.ingester.server.routes.lancedb.get_settings", return_value=settings),
+            patch("soliplex.ingester.server.routes.lancedb.tree_etag", side_effect=record_loop),
+        ):
+            response = test_client.get("/api/v1/lancedb/list")
+
+        assert response.status_code == 200
+        assert loops == [None]
+
     def test_list_databases_handles_permission_error(self, client, tmp_path):
         """Test listing databases when permission error occurs during rglob."""
         test_client, settings = client
@@ -290,23 +497,23 @@ class TestGetInfo:
     @pytest.fixture
     def client(self):
         """Create test client with mocked dependencies."""
-        settings = Mock(spec=Settings)
-        settings.api_key_enabled = False
-        settings.auth_trust_proxy_headers = False
-        settings.doc_db_url = "sqlite+aiosqlite:///:memory:"
-        settings.log_level = "INFO"
-        settings.lancedb_dir = "/data/lancedb"
+        settings = make_settings(
+            api_key_enabled=False,
+            auth_trust_proxy_headers=False,
+            doc_db_url="sqlite+aiosqlite:///:memory:",
+            log_level="INFO",
+            lancedb_dir="/data/lancedb",
+        )
 
-        with patch("soliplex.ingester.lib.wf.runner.start_worker", new_callable=AsyncMock):
-            from soliplex.ingester.lib.config import get_settings
-            from soliplex.ingester.server import app
+        from soliplex.ingester.lib.config import get_settings
+        from soliplex.ingester.server import app
 
-            app.dependency_overrides[get_settings] = lambda: settings
+        app.dependency_overrides[get_settings] = lambda: settings
 
-            client = TestClient(app, raise_server_exceptions=False)
-            yield client, settings
+        client = TestClient(app, raise_server_exceptions=False)
+        yield client, settings
 
-            app.dependency_overrides.clear()
+        app.dependency_overrides.clear()
 
     def test_get_info_db_not_found(self, client, tmp_path):
         """Test getting info for non-existent database."""
@@ -321,6 +528,21 @@ class TestGetInfo:
             assert data["status"] == "error"
             assert "not found" in data["error"].lower()
 
+    def test_get_info_db_path_is_file(self, client, tmp_path):
+        """Test getting info when the database path is a regular file."""
+        test_client, settings = client
+        settings.lancedb_dir = str(tmp_path)
+        (tmp_path / "notadb").write_bytes(b"x")
+
+        with (
+            patch("soliplex.ingester.server.routes.lancedb.get_settings", return_value=settings),
+            patch("lancedb.connect") as mock_connect,
+        ):
+            response = test_client.get("/api/v1/lancedb/info", params={"db": "notadb"})
+
+            assert response.status_code == 404
+            mock_connect.assert_not_called()
+
     def test_get_info_success(self, client, tmp_path):
         """Test getting info for valid database."""
         test_client, settings = client
@@ -355,7 +577,6 @@ class TestGetInfo:
             patch("lancedb.connect", return_value=mock_db_conn),
             patch("haiku.rag.store.engine.Store", return_value=mock_store),
             patch("haiku.rag.config.get_config", return_value=MagicMock()),
-            patch("importlib.metadata.version", return_value="0.1.0"),
         ):
             response = test_client.get("/api/v1/lancedb/info", params={"db": "testdb"})
 
@@ -369,6 +590,154 @@ class TestGetInfo:
             assert "chunks" in data
             assert "vector_index" in data
             assert "tables" in data
+            assert response.headers["etag"] == tree_etag(db_path)
+
+    def test_get_info_reuses_version_counts(self, client, tmp_path):
+        """Test that version counts are not re-listed while the database is unchanged."""
+        test_client, settings = client
+        settings.lancedb_dir = str(tmp_path)
+
+        db_path = tmp_path / "testdb"
+        db_path.mkdir(parents=True)
+
+        mock_list_tables_result = MagicMock()
+        mock_list_tables_result.tables = ["documents", "chunks"]
+
+        mock_table = MagicMock()
+        mock_table.list_versions.return_value = [{"version": 1}, {"version": 2}]
+
+        mock_db_conn = MagicMock()
+        mock_db_conn.list_tables.return_value = mock_list_tables_result
+        mock_db_conn.open_table.return_value = mock_table
+
+        mock_store = MagicMock()
+        mock_store.get_stats.return_value = {
+            "documents": {"num_rows": 0, "total_bytes": 0},
+            "chunks": {"num_rows": 0, "total_bytes": 0, "has_vector_index": False},
+        }
+
+        with (
+            patch("soliplex.ingester.server.routes.lancedb.get_settings", return_value=settings),
+            patch("lancedb.connect", return_value=mock_db_conn),
+            patch("haiku.rag.store.engine.Store", return_value=mock_store),
+            patch("haiku.rag.config.get_config", return_value=MagicMock()),
+        ):
+            first = test_client.get("/api/v1/lancedb/info", params={"db": "testdb"}).json()
+            second = test_client.get("/api/v1/lancedb/info", params={"db": "testdb"}).json()
+            assert mock_table.list_versions.call_count == 2
+
+            (db_path / "chunks.lance").mkdir()
+            third = test_client.get("/api/v1/lancedb/info", params={"db": "testdb"}).json()
+            assert mock_table.list_versions.call_count == 4
+
+        for data in (first, second, third):
+            assert data["documents"]["versions"] == 2
+            assert data["chunks"]["versions"] == 2
+
+    def test_get_info_not_modified(self, client, tmp_path):
+        """Test that a matching If-None-Match returns 304 without opening the database."""
+        test_client, settings = client
+        settings.lancedb_dir = str(tmp_path)
+
+        db_path = tmp_path / "testdb"
+        db_path.mkdir(parents=True)
+        etag = tree_etag(db_path)
+
+        with (
+            patch("soliplex.ingester.server.routes.lancedb.get_settings", return_value=settings),
+            patch("lancedb.connect") as mock_connect,
+        ):
+            response = test_client.get("/api/v1/lancedb/info", params={"db": "testdb"}, headers={"If-None-Match": etag})
+
+            assert response.status_code == 304
+            assert response.headers["etag"] == etag
+            mock_connect.assert_not_called()
+
+    def test_get_info_reads_settings_column(self, client, tmp_path):
+        """Test that only the settings column is read from the settings table."""
+        test_client, settings = client
+        settings.lancedb_dir = str(tmp_path)
+
+        db_path = tmp_path / "testdb"
+        db_path.mkdir(parents=True)
+
+        mock_list_tables_result = MagicMock()
+        mock_list_tables_result.tables = ["settings"]
+
+        stored = '{"version": "0.27.1", "embeddings": {"model": {"provider": "ollama", "name": "qwen3", "vector_dim": 4096}}}'
+        mock_query = MagicMock()
+        mock_query.to_arrow.return_value.to_pylist.return_value = [{"settings": stored}]
+        mock_settings_tbl = MagicMock()
+        mock_settings_tbl.search.return_value.where.return_value.select.return_value.limit.return_value = mock_query
+
+        mock_db_conn = MagicMock()
+        mock_db_conn.list_tables.return_value = mock_list_tables_result
+        mock_db_conn.open_table.return_value = mock_settings_tbl
+
+        mock_store = MagicMock()
+        mock_store.get_stats.return_value = {
+            "documents": {"num_rows": 0, "total_bytes": 0},
+            "chunks": {"num_rows": 0, "total_bytes": 0, "has_vector_index": False},
+        }
+
+        with (
+            patch("soliplex.ingester.server.routes.lancedb.get_settings", return_value=settings),
+            patch("lancedb.connect", return_value=mock_db_conn),
+            patch("haiku.rag.store.engine.Store", return_value=mock_store),
+            patch("haiku.rag.config.get_config", return_value=MagicMock()),
+        ):
+            response = test_client.get("/api/v1/lancedb/info", params={"db": "testdb"})
+
+            assert response.status_code == 200
+            data = response.json()
+            assert data["versions"]["stored_version"] == "0.27.1"
+            assert data["embeddings"] == {"provider": "ollama", "model": "qwen3", "vector_dim": 4096}
+            mock_settings_tbl.search.return_value.where.return_value.select.assert_called_once_with(["settings"])
+
+    def test_get_info_reuses_settings_until_version_changes(self, client, tmp_path):
+        """Test that the settings row is re-read only when the settings table version changes."""
+        test_client, settings = client
+        settings.lancedb_dir = str(tmp_path)
+
+        db_path = tmp_path / "testdb"
+        db_path.mkdir(parents=True)
+
+        mock_list_tables_result = MagicMock()
+        mock_list_tables_result.tables = ["settings"]
+
+        mock_settings_tbl = MagicMock()
+        mock_settings_tbl.version = 1
+        query = mock_settings_tbl.search.return_value.where.return_value.select.return_value.limit.return_value
+        query.to_arrow.return_value.to_pylist.side_effect = [
+            [{"settings": '{"version": "0.27.0"}'}],
+            [{"settings": '{"version": "0.27.1"}'}],
+        ]
+
+        mock_db_conn = MagicMock()
+        mock_db_conn.list_tables.return_value = mock_list_tables_result
+        mock_db_conn.open_table.return_value = mock_settings_tbl
+
+        mock_store = MagicMock()
+        mock_store.get_stats.return_value = {
+            "documents": {"num_rows": 0, "total_bytes": 0},
+            "chunks": {"num_rows": 0, "total_bytes": 0, "has_vector_index": False},
+        }
+
+        with (
+            patch("soliplex.ingester.server.routes.lancedb.get_settings", return_value=settings),
+            patch("lancedb.connect", return_value=mock_db_conn),
+            patch("haiku.rag.store.engine.Store", return_value=mock_store),
+            patch("haiku.rag.config.get_config", return_value=MagicMock()),
+        ):
+            first = test_client.get("/api/v1/lancedb/info", params={"db": "testdb"}).json()
+            second = test_client.get("/api/v1/lancedb/info", params={"db": "testdb"}).json()
+            mock_settings_tbl.version = 2
+            third = test_client.get("/api/v1/lancedb/info", params={"db": "testdb"}).json()
+
+        assert first["versions"]["stored_version"] == "0.27.0"
+        assert second["versions"]["stored_version"] == "0.27.0"
+        assert third["versions"]["stored_version"] == "0.27.1"
+        assert mock_settings_tbl.search.call_count == 2
 
     def test_get_info_connection_error(self, client, tmp_path):
         """Test getting info when database connection fails."""
@@ -417,7 +786,6 @@ class TestGetInfo:
             patch("lancedb.connect", return_value=mock_db_conn),
             patch("haiku.rag.store.engine.Store", return_value=mock_store),
             patch("haiku.rag.config.get_config", return_value=MagicMock()),
-            patch("importlib.metadata.version", return_value="0.1.0"),
         ):
             response = test_client.get("/api/v1/lancedb/info", params={"db": "custom.lancedb"})
 
@@ -443,15 +811,13 @@ class TestGetInfo:
             "chunks": {"num_rows": 0, "total_bytes": 0, "has_vector_index": False},
         }
 
-        def version_side_effect(pkg):
-            raise ModuleNotFoundError(f"Package {pkg} not found")
-
         with (
             patch("soliplex.ingester.server.routes.lancedb.get_settings", return_value=settings),
             patch("lancedb.connect", return_value=mock_db_conn),
             patch("haiku.rag.store.engine.Store", return_value=mock_store),
             patch("haiku.rag.config.get_config", return_value=MagicMock()),
-            patch("importlib.metadata.version", side_effect=version_side_effect),
+            patch("soliplex.ingester.server.routes.lancedb.LANCEDB_VERSION", "unknown"),
+            patch("soliplex.ingester.server.routes.lancedb.HAIKU_RAG_VERSION", "unknown"),
         ):
             response = test_client.get("/api/v1/lancedb/info", params={"db": "testdb"})
 
@@ -479,7 +845,6 @@ class TestGetInfo:
             patch("lancedb.connect", return_value=mock_db_conn),
             patch("haiku.rag.store.engine.Store", side_effect=Exception("Store failed")),
             patch("haiku.rag.config.get_config", return_value=MagicMock()),
-            patch("importlib.metadata.version", return_value="0.1.0"),
         ):
             response = test_client.get("/api/v1/lancedb/info", params={"db": "testdb"})
 
@@ -515,7 +880,6 @@ class TestGetInfo:
             patch("lancedb.connect", return_value=mock_db_conn),
             patch("haiku.rag.store.engine.Store", return_value=mock_store),
             patch("haiku.rag.config.get_config", return_value=MagicMock()),
-            patch("importlib.metadata.version", return_value="0.1.0"),
         ):
             response = test_client.get("/api/v1/lancedb/info", params={"db": "testdb"})
 
@@ -554,7 +918,6 @@ class TestGetInfo:
             patch("lancedb.connect", return_value=mock_db_conn),
             patch("haiku.rag.store.engine.Store", return_value=mock_store),
             patch("haiku.rag.config.get_config", return_value=MagicMock()),
-            patch("importlib.metadata.version", return_value="0.1.0"),
         ):
             response = test_client.get("/api/v1/lancedb/info", params={"db": "testdb"})
 
@@ -571,23 +934,23 @@ class TestVacuum:
     @pytest.fixture
     def client(self):
         """Create test client with mocked dependencies."""
-        settings = Mock(spec=Settings)
-        settings.api_key_enabled = False
-        settings.auth_trust_proxy_headers = False
-        settings.doc_db_url = "sqlite+aiosqlite:///:memory:"
-        settings.log_level = "INFO"
-        settings.lancedb_dir = "/data/lancedb"
+        settings = make_settings(
+            api_key_enabled=False,
+            auth_trust_proxy_headers=False,
+            doc_db_url="sqlite+aiosqlite:///:memory:",
+            log_level="INFO",
+            lancedb_dir="/data/lancedb",
+        )
 
-        with patch("soliplex.ingester.lib.wf.runner.start_worker", new_callable=AsyncMock):
-            from soliplex.ingester.lib.config import get_settings
-            from soliplex.ingester.server import app
+        from soliplex.ingester.lib.config import get_settings
+        from soliplex.ingester.server import app
 
-            app.dependency_overrides[get_settings] = lambda: settings
+        app.dependency_overrides[get_settings] = lambda: settings
 
-            client = TestClient(app, raise_server_exceptions=False)
-            yield client, settings
+        client = TestClient(app, raise_server_exceptions=False)
+        yield client, settings
 
-            app.dependency_overrides.clear()
+        app.dependency_overrides.clear()
 
     def test_vacuum_success(self, client, tmp_path):
         """Test vacuum endpoint succeeds."""
@@ -629,25 +992,25 @@ class TestVacuum:
 
     def test_vacuum_requires_auth(self):
         """Test that vacuum endpoint requires authentication."""
-        settings = Mock(spec=Settings)
-        settings.api_key_enabled = True
-        settings.auth_trust_proxy_headers = False
-        settings.api_key = "test-api-key"
-        settings.doc_db_url = "sqlite+aiosqlite:///:memory:"
-        settings.log_level = "INFO"
-        settings.lancedb_dir = "/data/lancedb"
-
-        with patch("soliplex.ingester.lib.wf.runner.start_worker", new_callable=AsyncMock):
-            from soliplex.ingester.lib.config import get_settings
-            from soliplex.ingester.server import app
-
-            app.dependency_overrides[get_settings] = lambda: settings
-
-            test_client = TestClient(app, raise_server_exceptions=False)
-            response = test_client.get("/api/v1/lancedb/vacuum", params={"db": "test"})
-            assert response.status_code == 401
+        settings = make_settings(
+            api_key_enabled=True,
+            auth_trust_proxy_headers=False,
+            api_key="test-api-key",
+            doc_db_url="sqlite+aiosqlite:///:memory:",
+            log_level="INFO",
+            lancedb_dir="/data/lancedb",
+        )
+
+        from soliplex.ingester.lib.config import get_settings
+        from soliplex.ingester.server import app
+
+        app.dependency_overrides[get_settings] = lambda: settings
+
+        test_client = TestClient(app, raise_server_exceptions=False)
+        response = test_client.get("/api/v1/lancedb/vacuum", params={"db": "test"})
+        assert response.status_code == 401
 
-            app.dependency_overrides.clear()
+        app.dependency_overrides.clear()
 
 
 class TestListDocuments:
@@ -656,23 +1019,23 @@ class TestListDocuments:
     @pytest.fixture
     def client(self):
         """Create test client with mocked dependencies."""
-        settings = Mock(spec=Settings)
-        settings.api_key_enabled = False
-        settings.auth_trust_proxy_headers = False
-        settings.doc_db_url = "sqlite+aiosqlite:///:memory:"
-        settings.log_level = "INFO"
-        settings.lancedb_dir = "/data/lancedb"
+        settings = make_settings(
+            api_key_enabled=False,
+            auth_trust_proxy_headers=False,
+            doc_db_url="sqlite+aiosqlite:///:memory:",
+            log_level="INFO",
+            lancedb_dir="/data/lancedb",
+        )
 
-        with patch("soliplex.ingester.lib.wf.runner.start_worker", new_callable=AsyncMock):
-            from soliplex.ingester.lib.config import get_settings
-            from soliplex.ingester.server import app
+        from soliplex.ingester.lib.config import get_settings
+        from soliplex.ingester.server import app
 
-            app.dependency_overrides[get_settings] = lambda: settings
+        app.dependency_overrides[get_settings] = lambda: settings
 
-            client = TestClient(app, raise_server_exceptions=False)
-            yield client, settings
+        client = TestClient(app, raise_server_exceptions=False)
+        yield client, settings
 
-            app.dependency_overrides.clear()
+        app.dependency_overrides.clear()
 
     def test_list_documents_db_not_found(self, client, tmp_path):
         """Test listing documents for non-existent database."""
@@ -696,28 +1059,22 @@ class TestListDocuments:
         db_path = tmp_path / "testdb"
         db_path.mkdir(parents=True)
 
-        # Create mock documents
-        from datetime import datetime
-
-        mock_doc = MagicMock()
-        mock_doc.id = "doc-1"
-        mock_doc.uri = "/path/to/doc.pdf"
-        mock_doc.title = "Test Document"
-        mock_doc.created_at = datetime(2024, 1, 1, 12, 0, 0)
-        mock_doc.updated_at = datetime(2024, 1, 2, 12, 0, 0)
-        mock_doc.chunk_count = 5
-        mock_doc.metadata = {"source": "test"}
-
-        mock_client = MagicMock()
-        mock_client.__aenter__ = AsyncMock(return_value=mock_client)
-        mock_client.__aexit__ = AsyncMock(return_value=None)
-        mock_client.list_documents = AsyncMock(return_value=[mock_doc])
+        _make_database(
+            db_path,
+            [
+                _document_row(
+                    "doc-1",
+                    uri="/path/to/doc.pdf",
+                    title="Test Document",
+                    metadata='{"source": "test"}',
+                    created_at="2024-01-01T12:00:00",
+                    updated_at="2024-01-02T12:00:00",
+                )
+            ],
+            chunk_document_ids=["doc-1", "doc-1", "doc-2"],
+        )
 
-        with (
-            patch("soliplex.ingester.server.routes.lancedb.get_settings", return_value=settings),
-            patch("haiku.rag.client.HaikuRAG", return_value=mock_client),
-            patch("haiku.rag.config.get_config", return_value=MagicMock()),
-        ):
+        with patch("soliplex.ingester.server.routes.lancedb.get_settings", return_value=settings):
             response = test_client.get("/api/v1/lancedb/documents", params={"db": "testdb"})
 
             assert response.status_code == 200
@@ -730,7 +1087,10 @@ class TestListDocuments:
             assert doc["id"] == "doc-1"
             assert doc["uri"] == "/path/to/doc.pdf"
             assert doc["title"] == "Test Document"
-            assert doc["chunk_count"] == 5
+            assert doc["created_at"] == "2024-01-01T12:00:00"
+            assert doc["updated_at"] == "2024-01-02T12:00:00"
+            assert doc["chunk_count"] == 2
+            assert doc["metadata"] == {"source": "test"}
 
     def test_list_documents_with_pagination(self, client, tmp_path):
         """Test listing documents with limit and offset."""
@@ -740,28 +1100,20 @@ class TestListDocuments:
         db_path = tmp_path / "testdb"
         db_path.mkdir(parents=True)
 
-        mock_client = MagicMock()
-        mock_client.__aenter__ = AsyncMock(return_value=mock_client)
-        mock_client.__aexit__ = AsyncMock(return_value=None)
-        mock_client.list_documents = AsyncMock(return_value=[])
+        _make_database(
+            db_path,
+            [_document_row(f"doc-{i}") for i in range(5)],
+        )
 
-        with (
-            patch("soliplex.ingester.server.routes.lancedb.get_settings", return_value=settings),
-            patch("haiku.rag.client.HaikuRAG", return_value=mock_client),
-            patch("haiku.rag.config.get_config", return_value=MagicMock()),
-        ):
+        with patch("soliplex.ingester.server.routes.lancedb.get_settings", return_value=settings):
             response = test_client.get(
                 "/api/v1/lancedb/documents",
-                params={"db": "testdb", "limit": 10, "offset": 5},
+                params={"db": "testdb", "limit": 2, "offset": 1},
             )
 
             assert response.status_code == 200
-            # Verify the mock was called with the pagination params
-            mock_client.list_documents.assert_called_once_with(
-                limit=10,
-                offset=5,
-                filter=None,
-            )
+            data = response.json()
+            assert [doc["id"] for doc in data["documents"]] == ["doc-1", "doc-2"]
 
     def test_list_documents_with_filter(self, client, tmp_path):
         """Test listing documents with filter."""
@@ -771,27 +1123,23 @@ class TestListDocuments:
         db_path = tmp_path / "testdb"
         db_path.mkdir(parents=True)
 
-        mock_client = MagicMock()
-        mock_client.__aenter__ = AsyncMock(return_value=mock_client)
-        mock_client.__aexit__ = AsyncMock(return_value=None)
-        mock_client.list_documents = AsyncMock(return_value=[])
+        _make_database(
+            db_path,
+            [
+                _document_row("doc-1", uri="/data/test.pdf"),
+                _document_row("doc-2", uri="/data/other.pdf"),
+            ],
+        )
 
-        with (
-            patch("soliplex.ingester.server.routes.lancedb.get_settings", return_value=settings),
-            patch("haiku.rag.client.HaikuRAG", return_value=mock_client),
-            patch("haiku.rag.config.get_config", return_value=MagicMock()),
-        ):
+        with patch("soliplex.ingester.server.routes.lancedb.get_settings", return_value=settings):
             response = test_client.get(
                 "/api/v1/lancedb/documents",
                 params={"db": "testdb", "filter": "uri LIKE '%test%'"},
             )
 
             assert response.status_code == 200
-            mock_client.list_documents.assert_called_once_with(
-                limit=None,
-                offset=None,
-                filter="uri LIKE '%test%'",
-            )
+            data = response.json()
+            assert [doc["id"] for doc in data["documents"]] == ["doc-1"]
 
     def test_list_documents_error(self, client, tmp_path):
         """Test listing documents when error occurs."""
@@ -801,15 +1149,12 @@ class TestListDocuments:
         db_path = tmp_path / "testdb"
         db_path.mkdir(parents=True)
 
-        mock_client = MagicMock()
-        mock_client.__aenter__ = AsyncMock(return_value=mock_client)
-        mock_client.__aexit__ = AsyncMock(return_value=None)
-        mock_client.list_documents = AsyncMock(side_effect=Exception("Database error"))
+        db_conn = MagicMock()
+        db_conn.open_table.side_effect = Exception("Database error")
 
         with (
             patch("soliplex.ingester.server.routes.lancedb.get_settings", return_value=settings),
-            patch("haiku.rag.client.HaikuRAG", return_value=mock_client),
-            patch("haiku.rag.config.get_config", return_value=MagicMock()),
+            patch("soliplex.ingester.server.routes.lancedb.get_connection", AsyncMock(return_value=db_conn)),
         ):
             response = test_client.get("/api/v1/lancedb/documents", params={"db": "testdb"})
 
@@ -826,16 +1171,9 @@ class TestListDocuments:
         db_path = tmp_path / "emptydb"
         db_path.mkdir(parents=True)
 
-        mock_client = MagicMock()
-        mock_client.__aenter__ = AsyncMock(return_value=mock_client)
-        mock_client.__aexit__ = AsyncMock(return_value=None)
-        mock_client.list_documents = AsyncMock(return_value=[])
+        _make_database(db_path, [])
 
-        with (
-            patch("soliplex.ingester.server.routes.lancedb.get_settings", return_value=settings),
-            patch("haiku.rag.client.HaikuRAG", return_value=mock_client),
-            patch("haiku.rag.config.get_config", return_value=MagicMock()),
-        ):
+        with patch("soliplex.ingester.server.routes.lancedb.get_settings", return_value=settings):
             response = test_client.get("/api/v1/lancedb/documents", params={"db": "emptydb"})
 
             assert response.status_code == 200
@@ -852,36 +1190,16 @@ class TestListDocuments:
         db_path = tmp_path / "testdb"
         db_path.mkdir(parents=True)
 
-        from datetime import datetime
+        _make_database(db_path, [_document_row("doc-1", metadata="{}")])
 
-        # Create mock document without metadata attribute
-        mock_doc = MagicMock()
-        mock_doc.id = "doc-1"
-        mock_doc.uri = "/path/to/doc.pdf"
-        mock_doc.title = "Test Document"
-        mock_doc.created_at = datetime(2024, 1, 1, 12, 0, 0)
-        mock_doc.updated_at = datetime(2024, 1, 2, 12, 0, 0)
-        mock_doc.chunk_count = 5
-        # Set metadata to None to test the branch
-        mock_doc.metadata = None
-
-        mock_client = MagicMock()
-        mock_client.__aenter__ = AsyncMock(return_value=mock_client)
-        mock_client.__aexit__ = AsyncMock(return_value=None)
-        mock_client.list_documents = AsyncMock(return_value=[mock_doc])
-
-        with (
-            patch("soliplex.ingester.server.routes.lancedb.get_settings", return_value=settings),
-            patch("haiku.rag.client.HaikuRAG", return_value=mock_client),
-            patch("haiku.rag.config.get_config", return_value=MagicMock()),
-        ):
+        with patch("soliplex.ingester.server.routes.lancedb.get_settings", return_value=settings):
             response = test_client.get("/api/v1/lancedb/documents", params={"db": "testdb"})
 
             assert response.status_code == 200
             data = response.json()
             assert data["status"] == "ok"
             assert data["document_count"] == 1
-            # Document should not have metadata key when metadata is None
+            # Document should not have metadata key when metadata is empty
             assert "metadata" not in data["documents"][0]
 
     def test_list_documents_without_optional_fields(self, client, tmp_path):
@@ -892,21 +1210,12 @@ class TestListDocuments:
         db_path = tmp_path / "testdb"
         db_path.mkdir(parents=True)
 
-        # Create mock document without optional attributes
-        mock_doc = MagicMock(spec=["id", "uri"])
-        mock_doc.id = "doc-1"
-        mock_doc.uri = "/path/to/doc.pdf"
-
-        mock_client = MagicMock()
-        mock_client.__aenter__ = AsyncMock(return_value=mock_client)
-        mock_client.__aexit__ = AsyncMock(return_value=None)
-        mock_client.list_documents = AsyncMock(return_value=[mock_doc])
+        _make_database(
+            db_path,
+            [_document_row("doc-1", uri="/path/to/doc.pdf", title=None, created_at="", updated_at="")],
+        )
 
-        with (
-            patch("soliplex.ingester.server.routes.lancedb.get_settings", return_value=settings),
-            patch("haiku.rag.client.HaikuRAG", return_value=mock_client),
-            patch("haiku.rag.config.get_config", return_value=MagicMock()),
-        ):
+        with patch("soliplex.ingester.server.routes.lancedb.get_settings", return_value=settings):
             response = test_client.get("/api/v1/lancedb/documents", params={"db": "testdb"})
 
             assert response.status_code == 200
@@ -916,8 +1225,63 @@ class TestListDocuments:
             assert doc["id"] == "doc-1"
             assert doc["uri"] == "/path/to/doc.pdf"
             assert doc["title"] is None
-            assert doc["created_at"] is None
-            assert doc["updated_at"] is None
+            # missing timestamps fall back to the listing time, as haiku.rag's Document does
+            assert datetime.fromisoformat(doc["created_at"]) > datetime(2024, 1, 1)
+            assert doc["updated_at"] == doc["created_at"]
+            assert doc["chunk_count"] == 0
+
+    def test_list_documents_many_without_limit(self, client, tmp_path):
+        """Test that an unpaged listing of a large database counts chunks without an id filter."""
+        test_client, settings = client
+        settings.lancedb_dir = str(tmp_path)
+
+        db_path = tmp_path / "bigdb"
+        db_path.mkdir(parents=True)
+
+        doc_ids = [f"doc-{i}" for i in range(2000)]
+        _make_database(
+            db_path,
+            [_document_row(doc_id) for doc_id in doc_ids],
+            chunk_document_ids=[doc_id for i, doc_id in enumerate(doc_ids) for _ in range(i % 3)],
+        )
+
+        with (
+            patch("soliplex.ingester.server.routes.lancedb.get_settings", return_value=settings),
+            patch("soliplex.ingester.server.routes.lancedb.count_chunks", wraps=count_chunks) as mock_count,
+        ):
+            response = test_client.get("/api/v1/lancedb/documents", params={"db": "bigdb"})
+
+        assert response.status_code == 200
+        assert mock_count.call_args.args[1] is None
+        data = response.json()
+        assert data["document_count"] == 2000
+        assert {doc["id"]: doc["chunk_count"] for doc in data["documents"]} == {
+            doc_id: i % 3 for i, doc_id in enumerate(doc_ids)
+        }
+
+    def test_query_documents_counts_paged_chunks_in_batches(self, tmp_path):
+        """Test that a paged listing counts chunks for its ids in bounded batches."""
+        doc_ids = [f"doc-{i}" for i in range(10)]
+        db_conn = _make_database(
+            tmp_path / "store",
+            [_document_row(doc_id) for doc_id in doc_ids],
+            chunk_document_ids=[doc_id for i, doc_id in enumerate(doc_ids) for _ in range(i)],
+        )
+
+        with patch("soliplex.ingester.server.routes.lancedb.CHUNK_COUNT_BATCH", 2):
+            rows = query_documents(db_conn, limit=5, offset=3)
+
+        assert [(row["id"], row["chunk_count"]) for row in rows] == [(f"doc-{i}", i) for i in range(3, 8)]
+
+    def test_query_documents_skips_content_columns(self, tmp_path):
+        """Test that only the listing columns are read from the documents table."""
+        db_conn = _make_database(tmp_path / "store", [_document_row("doc-1")])
+
+        rows = query_documents(db_conn)
+
+        assert len(rows) == 1
+        assert "content" not in rows[0]
+        assert "docling_document" not in rows[0]
 
 
 class TestAuthenticationRequired:
@@ -926,24 +1290,24 @@ class TestAuthenticationRequired:
     @pytest.fixture
     def client_with_auth(self):
         """Create test client with API key authentication enabled."""
-        settings = Mock(spec=Settings)
-        settings.api_key_enabled = True
-        settings.auth_trust_proxy_headers = False
-        settings.api_key = "test-api-key"
-        settings.doc_db_url = "sqlite+aiosqlite:///:memory:"
-        settings.log_level = "INFO"
-        settings.lancedb_dir = "/data/lancedb"
+        settings = make_settings(
+            api_key_enabled=True,
+            auth_trust_proxy_headers=False,
+            api_key="test-api-key",
+            doc_db_url="sqlite+aiosqlite:///:memory:",
+            log_level="INFO",
+            lancedb_dir="/data/lancedb",
+        )
 
-        with patch("soliplex.ingester.lib.wf.runner.start_worker", new_callable=AsyncMock):
-            from soliplex.ingester.lib.config import get_settings
-            from soliplex.ingester.server import app
+        from soliplex.ingester.lib.config import get_settings
+        from soliplex.ingester.server import app
 
-            app.dependency_overrides[get_settings] = lambda: settings
+        app.dependency_overrides[get_settings] = lambda: settings
 
-            client = TestClient(app, raise_server_exceptions=False)
-            yield client, settings
+        client = TestClient(app, raise_server_exceptions=False)
+        yield client, settings
 
-            app.dependency_overrides.clear()
+        app.dependency_overrides.clear()
 
     def test_list_requires_auth(self, client_with_auth):
         """Test that list endpoint requires authentication."""
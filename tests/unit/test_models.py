@@ -1,6 +1,8 @@
 import datetime
 
 import pytest
+from sqlmodel import SQLModel
+from sqlmodel import select
 
 from soliplex.ingester.lib.models import Database
 from soliplex.ingester.lib.models import Document
@@ -11,6 +13,9 @@ from soliplex.ingester.lib.models import WorkflowRun
 from soliplex.ingester.lib.models import doc_hash
 from soliplex.ingester.lib.models import get_engine
 from soliplex.ingester.lib.models import get_session
+from tests.factories import TINY_BYTES
+from tests.factories import make_document_bytes
+from tests.factories import make_run_step
 
 
 def test_get_session():
@@ -102,17 +107,9 @@ def test_document_init():
 
 def test_document_bytes_init_with_file_bytes():
     """Test DocumentBytes init with file_bytes to cover line 175"""
-    from soliplex.ingester.lib.models import ArtifactType
-    from soliplex.ingester.lib.models import DocumentBytes
-
-    doc_bytes = DocumentBytes(
-        hash="test-hash",
-        artifact_type=ArtifactType.DOC.value,
-        storage_root="test",
-        file_bytes=b"test data",
-        file_size=None,
-    )
-    assert doc_bytes.file_size == 9
+    doc_bytes = make_document_bytes(storage_root="test", file_size=None)
+    assert doc_bytes.file_bytes is TINY_BYTES
+    assert doc_bytes.file_size == len(TINY_BYTES)
 
 
 def test_document_history_init():
@@ -184,39 +181,16 @@ def test_workflow_run_duration_without_completed_date():
 def test_run_step_duration_with_completed_date():
     """Test RunStep duration property when completed_date is set"""
     from soliplex.ingester.lib.models import RunStatus
-    from soliplex.ingester.lib.models import WorkflowStepType
 
     start = datetime.datetime(2024, 1, 1, 10, 0, 0)
     completed = datetime.datetime(2024, 1, 1, 10, 5, 0)
-    step = RunStep(
-        workflow_run_id=1,
-        workflow_step_number=1,
-        workflow_step_name="test",
-        step_type=WorkflowStepType.INGEST,
-        status=RunStatus.COMPLETED,
-        step_config_id=1,
-        start_date=start,
-        completed_date=completed,
-    )
+    step = make_run_step(status=RunStatus.COMPLETED, start_date=start, completed_date=completed)
     assert step.duration == 300.0
 
 
 def test_run_step_duration_without_completed_date():
     """Test RunStep duration property when completed_date is None"""
-    from soliplex.ingester.lib.models import RunStatus
-    from soliplex.ingester.lib.models import WorkflowStepType
-
-    start = datetime.datetime(2024, 1, 1, 10, 0, 0)
-    step = RunStep(
-        workflow_run_id=1,
-        workflow_step_number=1,
-        workflow_step_name="test",
-        step_type=WorkflowStepType.INGEST,
-        status=RunStatus.PENDING,
-        step_config_id=1,
-        start_date=start,
-        completed_date=None,
-    )
+    step = make_run_step(start_date=datetime.datetime(2024, 1, 1, 10, 0, 0), completed_date=None)
     assert step.duration is None
 
 
@@ -275,24 +249,87 @@ async def test_database_initialize_non_sqlite_url():
 
     with patch("soliplex.ingester.lib.models.create_async_engine", return_value=mock_engine) as mock_create:
         await Database.initialize("postgresql+asyncpg://localhost/test")
-        # Verify connect_args is empty for non-sqlite URL
-        mock_create.assert_called_once_with("postgresql+asyncpg://localhost/test", connect_args={})
+        # Verify the pool is sized from settings for non-sqlite URL
+        mock_create.assert_called_once_with(
+            "postgresql+asyncpg://localhost/test",
+            pool_size=20,
+            max_overflow=10,
+            pool_recycle=1800,
+            pool_pre_ping=True,
+        )
+        mock_conn.run_sync.assert_awaited_once_with(SQLModel.metadata.create_all)
+
+    await Database.close()
+
 
+@pytest.mark.asyncio
+async def test_database_initialize_existing_file(tmp_path):
+    """Test that initializing against an existing SQLite file keeps its tables and rows"""
+    url = f"sqlite+aiosqlite:///{tmp_path / 'documents.db'}"
+    await Database.reset(url)
+    async with get_session() as session:
+        session.add(DocumentBatch(name="kept", source="test", start_date=datetime.datetime.now()))
+
+    await Database.reset(url)
+    async with get_session() as session:
+        rs = await session.exec(select(DocumentBatch))
+        assert [batch.name for batch in rs.all()] == ["kept"]
+    await Database.close()
+
+
+@pytest.mark.asyncio
+async def test_database_initialize_null_pool():
+    """Test Database.initialize disables pooling when DB_NULL_POOL is set"""
+    from unittest.mock import AsyncMock
+    from unittest.mock import MagicMock
+    from unittest.mock import patch
+
+    from sqlalchemy.pool import NullPool
+
+    from soliplex.ingester.lib.config import Settings
+
+    await Database.close()
+
+    mock_engine = MagicMock()
+    mock_engine.dispose = AsyncMock()
+    mock_conn = MagicMock()
+    mock_conn.run_sync = AsyncMock()
+
+    mock_begin_cm = MagicMock()
+    mock_begin_cm.__aenter__ = AsyncMock(return_value=mock_conn)
+    mock_begin_cm.__aexit__ = AsyncMock(return_value=None)
+    mock_engine.begin.return_value = mock_begin_cm
+
+    settings = Settings(doc_db_url="postgresql+asyncpg://localhost/test", db_null_pool=True)
+    with (
+        patch("soliplex.ingester.lib.config.get_settings", return_value=settings) as mock_settings,
+        patch("soliplex.ingester.lib.models.create_async_engine", return_value=mock_engine) as mock_create,
+    ):
+        await Database.initialize()
+        mock_create.assert_called_once_with("postgresql+asyncpg://localhost/test", poolclass=NullPool)
+        mock_settings.assert_called_once_with()
+
+    await Database.close()
+
+
+@pytest.mark.asyncio
+async def test_database_initialize_sqlite_url_skips_settings():
+    """Test that an explicit SQLite URL initializes without reading settings"""
+    from unittest.mock import patch
+
+    await Database.close()
+
+    with patch("soliplex.ingester.lib.config.get_settings", side_effect=RuntimeError("no settings")) as mock_settings:
+        await Database.initialize("sqlite+aiosqlite:///:memory:")
+
+    mock_settings.assert_not_called()
     await Database.close()
 
 
 def test_document_bytes_with_explicit_file_size():
     """Test DocumentBytes when file_size is explicitly provided (branch 258->exit)"""
-    from soliplex.ingester.lib.models import ArtifactType
-    from soliplex.ingester.lib.models import DocumentBytes
-
-    doc_bytes = DocumentBytes(
-        hash="test-hash",
-        artifact_type=ArtifactType.DOC.value,
-        storage_root="test",
-        file_bytes=b"test data",
-        file_size=100,  # Explicit size, should not be overwritten
-    )
+    # Explicit size, should not be overwritten
+    doc_bytes = make_document_bytes(storage_root="test", file_size=100)
     assert doc_bytes.file_size == 100
 
 
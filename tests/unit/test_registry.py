@@ -1,5 +1,6 @@
 """Tests for soliplex.ingester.lib.wf.registry module."""
 
+import asyncio
 import tempfile
 from pathlib import Path
 from unittest.mock import MagicMock
@@ -117,6 +118,26 @@ async def test_load_workflow_registry_caching(reset_registries, workflow_yaml_co
             assert reg1 is reg2
 
 
+@pytest.mark.asyncio
+async def test_load_workflow_registry_concurrent_cold_load(reset_registries, workflow_yaml_content):
+    """Test that concurrent cold loads parse each workflow file once."""
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        wf_path = Path(tmp_dir) / "test_workflow.yaml"
+        wf_path.write_text(workflow_yaml_content)
+
+        mock_settings = MagicMock()
+        mock_settings.workflow_dir = tmp_dir
+
+        with (
+            patch.object(registry, "get_settings", return_value=mock_settings),
+            patch.object(registry, "load_workflow_definition", wraps=registry.load_workflow_definition) as mock_load,
+        ):
+            results = await asyncio.gather(*[registry.load_workflow_registry() for _ in range(5)])
+
+            assert mock_load.call_count == 1
+            assert all(reg is results[0] for reg in results)
+
+
 @pytest.mark.asyncio
 async def test_load_workflow_registry_force_reload(reset_registries, workflow_yaml_content):
     """Test force reload of workflow registry."""
@@ -264,6 +285,26 @@ async def test_load_param_registry_caching(reset_registries, param_yaml_content)
             assert reg1 is reg2
 
 
+@pytest.mark.asyncio
+async def test_load_param_registry_concurrent_cold_load(reset_registries, param_yaml_content):
+    """Test that concurrent cold loads parse each param file once."""
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        param_path = Path(tmp_dir) / "test_params.yaml"
+        param_path.write_text(param_yaml_content)
+
+        mock_settings = MagicMock()
+        mock_settings.param_dir = tmp_dir
+
+        with (
+            patch.object(registry, "get_settings", return_value=mock_settings),
+            patch.object(registry, "load_param_set", wraps=registry.load_param_set) as mock_load,
+        ):
+            results = await asyncio.gather(*[registry.load_param_registry() for _ in range(5)])
+
+            assert mock_load.call_count == 1
+            assert all(reg is results[0] for reg in results)
+
+
 @pytest.mark.asyncio
 async def test_load_param_registry_force_reload(reset_registries, param_yaml_content):
     """Test force reload of param registry."""
@@ -456,3 +497,95 @@ async def test_load_param_registry_empty_dir(reset_registries):
         with patch.object(registry, "get_settings", return_value=mock_settings):
             reg = await registry.load_param_registry()
             assert reg == {}
+
+
+@pytest.mark.asyncio
+async def test_get_param_sets_by_target(reset_registries):
+    """Test looking up param sets by their store data_dir."""
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        for set_id, data_dir in [("a", "/data/one"), ("b", "/data/two"), ("c", "/data/one")]:
+            (Path(tmp_dir) / f"{set_id}.yaml").write_text(f"id: {set_id}\nconfig:\n  store:\n    data_dir: {data_dir}\n")
+        (Path(tmp_dir) / "nostore.yaml").write_text("id: nostore\nconfig:\n  parse:\n    do_ocr: false\n")
+
+        mock_settings = MagicMock()
+        mock_settings.param_dir = tmp_dir
+
+        with patch.object(registry, "get_settings", return_value=mock_settings):
+            matches = await registry.get_param_sets_by_target("/data/one")
+            assert sorted(p.id for p in matches) == ["a", "c"]
+            assert [p.id for p in await registry.get_param_sets_by_target("/data/two")] == ["b"]
+            assert await registry.get_param_sets_by_target("/data/none") == []
+
+
+@pytest.mark.asyncio
+async def test_get_param_sets_by_target_after_invalidation(reset_registries):
+    """Test that the target index is rebuilt when the param registry is reloaded."""
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        (Path(tmp_dir) / "a.yaml").write_text("id: a\nconfig:\n  store:\n    data_dir: /data/one\n")
+
+        mock_settings = MagicMock()
+        mock_settings.param_dir = tmp_dir
+
+        with patch.object(registry, "get_settings", return_value=mock_settings):
+            assert [p.id for p in await registry.get_param_sets_by_target("/data/one")] == ["a"]
+
+            (Path(tmp_dir) / "b.yaml").write_text("id: b\nconfig:\n  store:\n    data_dir: /data/one\n")
+            registry._param_registry = None
+
+            assert sorted(p.id for p in await registry.get_param_sets_by_target("/data/one")) == ["a", "b"]
+
+
+def test_parse_yaml_matches_safe_load(param_yaml_content):
+    """Test that parse_yaml returns the same data as yaml.safe_load."""
+    import yaml
+
+    assert registry.parse_yaml(param_yaml_content) == yaml.safe_load(param_yaml_content)
+
+
+def test_parse_yaml_rejects_python_tags():
+    """Test that parse_yaml keeps safe_load's refusal to build arbitrary objects."""
+    import yaml
+
+    with pytest.raises(yaml.YAMLError):
+        registry.parse_yaml("!!python/object/apply:os.system ['true']")
+
+
+@pytest.mark.asyncio
+async def test_read_yaml_content_cache(tmp_path):
+    """Test that YAML content is reused until the file's mtime changes."""
+    import os
+
+    path = tmp_path / "params.yaml"
+    path.write_text("id: one\n")
+    registry._yaml_content_cache.pop(path, None)
+
+    assert await registry.read_yaml_content(path) == (path.stat().st_mtime_ns, "id: one\n")
+    with patch("soliplex.ingester.lib.wf.registry.aiofiles.open", side_effect=AssertionError("file re-read")):
+        assert (await registry.read_yaml_content(path))[1] == "id: one\n"
+
+    path.write_text("id: two\n")
+    stat = path.stat()
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+    assert await registry.read_yaml_content(path) == (stat.st_mtime_ns + 1_000_000, "id: two\n")
+    registry._yaml_content_cache.pop(path, None)
+
+
+@pytest.mark.asyncio
+async def test_get_param_list_json(reset_registries, param_yaml_content):
+    """Test that the param summary JSON is reused until the registry reloads."""
+    import json
+
+    with tempfile.TemporaryDirectory() as tmpdir:
+        Path(tmpdir, "params.yaml").write_text(param_yaml_content)
+        mock_settings = MagicMock()
+        mock_settings.param_dir = tmpdir
+        with patch("soliplex.ingester.lib.wf.registry.get_settings", return_value=mock_settings):
+            first = await registry.get_param_list_json()
+            assert await registry.get_param_list_json() is first
+
+            await registry.load_param_registry(force_reload=True)
+            reloaded = await registry.get_param_list_json()
+
+    assert reloaded is not first
+    assert reloaded == first
+    assert json.loads(first) == [{"id": "test_params", "name": None, "source": "app"}]
@@ -0,0 +1,59 @@
+"""Tests for soliplex.ingester.server.errors module."""
+
+import pytest
+from fastapi import FastAPI
+from fastapi import status
+from fastapi.middleware.cors import CORSMiddleware
+from fastapi.testclient import TestClient
+
+from soliplex.ingester.lib import operations
+from soliplex.ingester.lib.wf import operations as wf_ops
+from soliplex.ingester.server.errors import BadRequestError
+from soliplex.ingester.server.errors import add_exception_handlers
+
+
+@pytest.fixture
+def client():
+    """Create a small app whose routes raise the given exception."""
+    app = FastAPI()
+    add_exception_handlers(app)
+    app.add_middleware(CORSMiddleware, allow_origins=["*"])
+    errors = {
+        "run": wf_ops.NotFoundError("workflow run 7 not found"),
+        "batch": operations.BatchNotFoundError(3),
+        "bad_request": BadRequestError("page must be >= 1"),
+        "value": ValueError("unexpected value"),
+        "other": RuntimeError("boom"),
+    }
+
+    @app.get("/raise/{name}")
+    async def raise_error(name: str):
+        raise errors[name]
+
+    return TestClient(app, raise_server_exceptions=False)
+
+
+@pytest.mark.parametrize(
+    "name,expected_status,message",
+    [
+        ("run", status.HTTP_404_NOT_FOUND, "workflow run 7 not found"),
+        ("batch", status.HTTP_404_NOT_FOUND, "Batch 3 not found"),
+        ("bad_request", status.HTTP_400_BAD_REQUEST, "page must be >= 1"),
+        ("value", status.HTTP_500_INTERNAL_SERVER_ERROR, "unexpected value"),
+        ("other", status.HTTP_500_INTERNAL_SERVER_ERROR, "boom"),
+    ],
+)
+def test_error_status(client, name, expected_status, message):
+    """Test that each exception type maps to its status with an error body."""
+    response = client.get(f"/raise/{name}")
+
+    assert response.status_code == expected_status
+    assert response.json() == {"error": message}
+
+
+@pytest.mark.parametrize("name", ["run", "other"])
+def test_error_cors_headers(client, name):
+    """Test that mapped errors and 500 responses both carry CORS headers."""
+    response = client.get(f"/raise/{name}", headers={"Origin": "http://example.com"})
+
+    assert response.headers["access-control-allow-origin"] == "*"
@@ -5,6 +5,7 @@ import pytest
 import soliplex.ingester.lib.dal as dal
 import soliplex.ingester.lib.models as models
 from soliplex.ingester.lib.config import get_settings
+from tests.factories import make_step_config
 
 logger = logging.getLogger(__name__)
 
@@ -14,7 +15,7 @@ async def test_operators(db):
     bytea = b"test"
     get_settings().file_store_target = "db"
     for st in models.ArtifactType:
-        step_config = models.StepConfig(id=1, step_type=models.ARTIFACTS_TO_STEPS[st])
+        step_config = make_step_config(id=1, step_type=models.ARTIFACTS_TO_STEPS[st])
         logger.info(f" testing {st}")
         op = dal.get_storage_operator(st, step_config)
         assert op is not None
@@ -192,6 +192,32 @@ async def test_create_workflow_runs_for_batch(db):
         assert run.priority == 2
 
 
+@pytest.mark.asyncio
+async def test_create_workflow_runs_for_batch_loads_context_once(db):
+    """Test that the batch and step configs are looked up once per batch, not per document"""
+    from unittest.mock import patch
+
+    batch_id = await doc_ops.new_batch("test_source", "Test Batch")
+    for i in range(3):
+        await doc_ops.create_document_from_uri(
+            f"/tmp/context_test{i}.pdf", "test_source", "application/pdf", f"context {i}".encode(), batch_id=batch_id
+        )
+
+    with (
+        patch.object(wf_ops, "get_batch", wraps=wf_ops.get_batch) as mock_get_batch,
+        patch.object(wf_ops, "get_step_config_ids", wraps=wf_ops.get_step_config_ids) as mock_config_ids,
+    ):
+        run_group, runs = await wf_ops.create_workflow_runs_for_batch(
+            batch_id=batch_id, workflow_definition_id="batch", param_id="test_base"
+        )
+
+    assert len(runs) == 3
+    # one lookup in create_run_group and one for the shared run context
+    assert mock_get_batch.call_count == 2
+    assert mock_config_ids.call_count == 1
+    assert all(run.run_params["source"] == "test_source" for run in runs)
+
+
 @pytest.mark.asyncio
 async def test_get_workflow_run(db):
     """Test get_workflow_run function"""
@@ -321,6 +347,32 @@ async def test_get_workflows_for_status(db):
     assert len(all_pending) >= 1
 
 
+@pytest.mark.asyncio
+async def test_get_workflows_paginated_total(db):
+    """Test that paged queries report the full filtered total, including past the last page"""
+
+    batch_id = await doc_ops.new_batch("test_source", "Test Batch")
+    run_group = await wf_ops.create_run_group(workflow_definition_id="batch", batch_id=batch_id, param_id="test_base")
+    for i in range(3):
+        uri, doc = await doc_ops.create_document_from_uri(
+            f"/tmp/paged_{i}.pdf", "test_source", "application/pdf", f"paged {i}".encode(), batch_id=batch_id
+        )
+        await wf_ops.create_workflow_run(run_group=run_group, doc_id=doc.hash)
+
+    first_page, total = await wf_ops.get_workflows(batch_id, page=1, rows_per_page=2)
+    assert len(first_page) == 2
+    assert total == 3
+
+    last_page, total = await wf_ops.get_workflows_for_status(RunStatus.PENDING, batch_id, page=2, rows_per_page=2)
+    assert len(last_page) == 1
+    assert total == 3
+    assert {run.id for run in first_page}.isdisjoint({run.id for run in last_page})
+
+    past_end, total = await wf_ops.get_workflows(batch_id, page=5, rows_per_page=2)
+    assert past_end == []
+    assert total == 3
+
+
 @pytest.mark.asyncio
 async def test_get_run_step(db):
     """Test get_run_step function"""
@@ -11,11 +11,7 @@ import pytest
 import pytest_asyncio
 
 from soliplex.ingester.lib.models import Database
-from soliplex.ingester.lib.models import Document
-from soliplex.ingester.lib.models import DocumentBatch
 from soliplex.ingester.lib.models import DocumentInfo
-from soliplex.ingester.lib.models import DocumentURI
-from soliplex.ingester.lib.models import RunGroup
 from soliplex.ingester.lib.models import RunStatus
 from soliplex.ingester.lib.models import WorkflowRun
 from soliplex.ingester.lib.models import WorkflowRunWithDetails
@@ -23,6 +19,11 @@ from soliplex.ingester.lib.models import get_session
 from soliplex.ingester.lib.wf.operations import get_document_info_for_workflow_runs
 from soliplex.ingester.lib.wf.operations import get_workflows
 from soliplex.ingester.lib.wf.operations import get_workflows_for_status
+from tests.factories import make_batch
+from tests.factories import make_document
+from tests.factories import make_document_uri
+from tests.factories import make_run_group
+from tests.factories import make_workflow_run
 
 
 @pytest_asyncio.fixture
@@ -30,86 +31,51 @@ async def sample_data(db: Database):
     """Create sample test data with documents, URIs, batches, and workflow runs."""
     async with get_session() as session:
         # Create a batch
-        batch = DocumentBatch(
-            name="Test Batch",
-            source="test-source",
-            start_date=datetime.datetime.now(datetime.UTC),
-        )
+        batch = make_batch(source="test-source")
         session.add(batch)
         await session.flush()
         await session.refresh(batch)
 
         # Create documents
-        doc1 = Document(
-            hash="sha256-abc123",
-            mime_type="application/pdf",
-            file_size=1024000,
-            doc_meta={"page_count": "10"},
-        )
-        doc2 = Document(
-            hash="sha256-def456",
-            mime_type="text/plain",
-            file_size=512,
-            doc_meta={},
-        )
+        doc1 = make_document(hash="sha256-abc123", file_size=1024000, doc_meta={"page_count": "10"})
+        doc2 = make_document(hash="sha256-def456", mime_type="text/plain", file_size=512)
         session.add(doc1)
         session.add(doc2)
         await session.flush()
 
         # Create document URIs
-        uri1 = DocumentURI(
-            doc_hash="sha256-abc123",
-            uri="/path/to/document1.pdf",
-            source="test-source",
-            batch_id=batch.id,
+        uri1 = make_document_uri(
+            uri="/path/to/document1.pdf", source="test-source", doc_hash="sha256-abc123", batch_id=batch.id
         )
-        uri2 = DocumentURI(
-            doc_hash="sha256-def456",
-            uri="/path/to/document2.txt",
-            source="test-source",
-            batch_id=batch.id,
+        uri2 = make_document_uri(
+            uri="/path/to/document2.txt", source="test-source", doc_hash="sha256-def456", batch_id=batch.id
         )
         session.add(uri1)
         session.add(uri2)
         await session.flush()
 
         # Create run group
-        run_group = RunGroup(
-            workflow_definition_id="batch",
-            param_definition_id="default",
-            batch_id=batch.id,
-            created_date=datetime.datetime.now(datetime.UTC),
-            start_date=datetime.datetime.now(datetime.UTC),
-            status=RunStatus.RUNNING,
-            status_date=datetime.datetime.now(datetime.UTC),
-        )
+        run_group = make_run_group(batch_id=batch.id, status=RunStatus.RUNNING)
         session.add(run_group)
         await session.flush()
         await session.refresh(run_group)
 
         # Create workflow runs
-        run1 = WorkflowRun(
-            workflow_definition_id="batch",
+        run_params = {"param_id": "default", "source": "test-source"}
+        run1 = make_workflow_run(
+            doc_id="sha256-abc123",
             run_group_id=run_group.id,
             batch_id=batch.id,
-            doc_id="sha256-abc123",
-            created_date=datetime.datetime.now(datetime.UTC),
-            start_date=datetime.datetime.now(datetime.UTC),
             status=RunStatus.RUNNING,
-            status_date=datetime.datetime.now(datetime.UTC),
-            run_params={"param_id": "default", "source": "test-source"},
+            run_params=run_params,
         )
-        run2 = WorkflowRun(
-            workflow_definition_id="batch",
+        run2 = make_workflow_run(
+            doc_id="sha256-def456",
             run_group_id=run_group.id,
             batch_id=batch.id,
-            doc_id="sha256-def456",
-            created_date=datetime.datetime.now(datetime.UTC),
-            start_date=datetime.datetime.now(datetime.UTC),
             status=RunStatus.COMPLETED,
             completed_date=datetime.datetime.now(datetime.UTC),
-            status_date=datetime.datetime.now(datetime.UTC),
-            run_params={"param_id": "default", "source": "test-source"},
+            run_params=run_params,
         )
         session.add(run1)
         session.add(run2)
@@ -319,42 +285,20 @@ async def test_get_workflows_with_both_steps_and_doc_info(sample_data):
 @pytest.mark.asyncio
 async def test_document_info_missing_document(db: Database):
     """Test handling when Document record doesn't exist."""
-    now = datetime.datetime.now(datetime.UTC)
     async with get_session() as session:
         # Create batch and run without corresponding Document
-        batch = DocumentBatch(
-            name="Test Batch",
-            source="test",
-            start_date=now,
-        )
+        batch = make_batch()
         session.add(batch)
         await session.flush()
         await session.refresh(batch)
 
-        run_group = RunGroup(
-            workflow_definition_id="batch",
-            param_definition_id="default",
-            batch_id=batch.id,
-            created_date=now,
-            start_date=now,
-            status=RunStatus.RUNNING,
-            status_date=now,
-        )
+        run_group = make_run_group(batch_id=batch.id, status=RunStatus.RUNNING)
         session.add(run_group)
         await session.flush()
         await session.refresh(run_group)
 
         # Create workflow run without a Document
-        run = WorkflowRun(
-            workflow_definition_id="batch",
-            run_group_id=run_group.id,
-            batch_id=batch.id,
-            doc_id="sha256-nonexistent",
-            created_date=now,
-            start_date=now,
-            status=RunStatus.PENDING,
-            run_params={},
-        )
+        run = make_workflow_run(doc_id="sha256-nonexistent", run_group_id=run_group.id, batch_id=batch.id)
         session.add(run)
         await session.flush()
         await session.refresh(run)
@@ -0,0 +1,320 @@
+"""
+Unit tests for workflow routes module.
+
+Tests cover:
+- Get workflow run endpoint
+- Lifecycle history endpoint
+- Pagination helpers
+- Run group stats caching
+- Parameter set upload
+- Conditional YAML responses
+"""
+
+import datetime
+import json
+from unittest.mock import AsyncMock
+from unittest.mock import Mock
+from unittest.mock import patch
+
+import pytest
+from fastapi import status
+
+from soliplex.ingester.lib.models import LifeCycleEvent
+from soliplex.ingester.lib.models import LifecycleHistory
+from soliplex.ingester.lib.models import RunStatus
+from soliplex.ingester.lib.models import RunStep
+from soliplex.ingester.lib.models import WorkflowRun
+from soliplex.ingester.server.routes import workflow as wf_routes
+
+START = datetime.datetime(2024, 1, 1, 12, 0, 0)
+
+
+def _history(count: int) -> list[LifecycleHistory]:
+    """Build lifecycle history records for one workflow run."""
+    return [
+        LifecycleHistory(
+            id=i + 1,
+            event=LifeCycleEvent.ITEM_START,
+            run_group_id=1,
+            workflow_run_id=7,
+            start_date=START + datetime.timedelta(seconds=i),
+            completed_date=None,
+            status=RunStatus.COMPLETED,
+            status_date=START,
+            status_meta={"step": str(i)},
+        )
+        for i in range(count)
+    ]
+
+
+class TestGetWorkflowLifecycleHistory:
+    """Tests for get_workflow_lifecycle_history endpoint."""
+
+    @pytest.mark.asyncio
+    async def test_serializes_records(self):
+        """Test that records are returned as a JSON array body."""
+        history = _history(3)
+        with patch.object(wf_routes.wf_ops, "get_lifecycle_history", AsyncMock(return_value=history)):
+            result = await wf_routes.get_workflow_lifecycle_history(7)
+
+        assert result.media_type == "application/json"
+        body = json.loads(result.body)
+        assert [row["id"] for row in body] == [1, 2, 3]
+        assert body[0]["start_date"] == "2024-01-01T12:00:00"
+        assert body[0]["status"] == RunStatus.COMPLETED.value
+        assert body[2]["status_meta"] == {"step": "2"}
+
+    @pytest.mark.asyncio
+    async def test_empty_history(self):
+        """Test that an empty history is an empty JSON array."""
+        with patch.object(wf_routes.wf_ops, "get_lifecycle_history", AsyncMock(return_value=[])):
+            result = await wf_routes.get_workflow_lifecycle_history(7)
+
+        assert json.loads(result.body) == []
+
+    @pytest.mark.asyncio
+    async def test_value_error(self):
+        """Test that a ValueError propagates to the exception handlers."""
+        with (
+            patch.object(wf_routes.wf_ops, "get_lifecycle_history", AsyncMock(side_effect=ValueError("bad id"))),
+            pytest.raises(ValueError, match="bad id"),
+        ):
+            await wf_routes.get_workflow_lifecycle_history(7)
+
+
+class TestGetWorkflow:
+    """Tests for get_workflow endpoint."""
+
+    @pytest.mark.asyncio
+    async def test_includes_steps(self):
+        """Test that the run is returned with its steps."""
+        run = WorkflowRun(
+            id=7,
+            workflow_definition_id="batch",
+            run_group_id=1,
+            batch_id=1,
+            doc_id="sha256-abc",
+            created_date=START,
+            start_date=START,
+            completed_date=START + datetime.timedelta(seconds=5),
+            status_date=START,
+        )
+        steps = [
+            RunStep(
+                id=i,
+                workflow_run_id=7,
+                workflow_step_number=i,
+                workflow_step_name=f"step{i}",
+                created_date=START,
+                start_date=START,
+                status_date=START,
+                completed_date=None,
+            )
+            for i in range(2)
+        ]
+        with patch.object(wf_routes.wf_ops, "get_workflow_run", AsyncMock(return_value=(run, steps))):
+            result = await wf_routes.get_workflow(7)
+
+        body = json.loads(result.body)
+        assert body["id"] == 7
+        assert body["created_date"] == "2024-01-01T12:00:00"
+        assert body["duration"] == 5.0
+        assert [step["workflow_step_name"] for step in body["steps"]] == ["step0", "step1"]
+
+    @pytest.mark.asyncio
+    async def test_not_found(self):
+        """Test that a missing run propagates to the exception handlers."""
+        with (
+            patch.object(
+                wf_routes.wf_ops, "get_workflow_run", AsyncMock(side_effect=wf_routes.wf_ops.NotFoundError("missing"))
+            ),
+            pytest.raises(wf_routes.wf_ops.NotFoundError),
+        ):
+            await wf_routes.get_workflow(7)
+
+
+class TestPagination:
+    """Tests for the pagination helpers shared by the workflow list endpoints."""
+
+    def test_validate_defaults(self):
+        """Test that rows_per_page defaults to 10 only when a page is requested."""
+        assert wf_routes._validate_pagination(None, None) is None
+        assert wf_routes._validate_pagination(2, None) == 10
+        assert wf_routes._validate_pagination(None, 25) == 25
+
+    @pytest.mark.parametrize("page,rows_per_page", [(0, None), (1, 0)])
+    def test_validate_rejects(self, page, rows_per_page):
+        """Test that non-positive values are rejected."""
+        with pytest.raises(ValueError, match="must be >= 1"):
+            wf_routes._validate_pagination(page, rows_per_page)
+
+    @pytest.mark.parametrize("total,expected", [(0, 0), (1, 1), (10, 1), (11, 2)])
+    def test_total_pages(self, total, expected):
+        """Test total_pages rounding."""
+        result = wf_routes._paginate([], total, None, 10, wf_routes._PagedRun)
+
+        assert result.total_pages == expected
+        assert result.page == 1
+
+    @pytest.mark.asyncio
+    async def test_get_workflows_paginated(self):
+        """Test that detail requests use the details response class."""
+        with patch.object(wf_routes.wf_ops, "get_workflows", AsyncMock(return_value=([], 21))) as mock_get:
+            result = await wf_routes.get_workflows(include_doc_info=True, page=3)
+
+        assert isinstance(result, wf_routes._PagedDetails)
+        assert (result.page, result.rows_per_page, result.total_pages) == (3, 10, 3)
+        assert mock_get.call_args.kwargs["rows_per_page"] == 10
+
+    @pytest.mark.asyncio
+    async def test_get_workflows_for_status_unpaginated(self):
+        """Test that the raw list is returned without pagination parameters."""
+        with patch.object(wf_routes.wf_ops, "get_workflows_for_status", AsyncMock(return_value=(["run"], 1))):
+            result = await wf_routes.get_workflows_for_status(RunStatus.COMPLETED)
+
+        assert result == ["run"]
+
+
+class TestRunGroupStatsCache:
+    """Tests for caching in get_run_group_stats."""
+
+    @pytest.fixture(autouse=True)
+    def _clear_stats(self):
+        """Keep cached stats from leaking between tests."""
+        wf_routes.clear_caches()
+        yield
+        wf_routes.clear_caches()
+
+    @pytest.mark.asyncio
+    async def test_cached_within_ttl(self):
+        """Test that repeat polls within the TTL reuse the stats."""
+        mock_stats = AsyncMock(side_effect=[{"COMPLETED": 1}, {"COMPLETED": 2}])
+        with patch.object(wf_routes.wf_ops, "get_run_group_stats", mock_stats):
+            first = await wf_routes.get_run_group_stats(1)
+            second = await wf_routes.get_run_group_stats(1)
+
+        assert first == second == {"COMPLETED": 1}
+        assert mock_stats.await_count == 1
+
+    @pytest.mark.asyncio
+    async def test_expires_after_ttl(self):
+        """Test that stats are refreshed once the TTL has passed."""
+        mock_stats = AsyncMock(side_effect=[{"COMPLETED": 1}, {"COMPLETED": 2}])
+        with (
+            patch.object(wf_routes.wf_ops, "get_run_group_stats", mock_stats),
+            patch.object(wf_routes.time, "monotonic", side_effect=[100.0, 100.0 + wf_routes.RUN_GROUP_STATS_TTL]),
+        ):
+            await wf_routes.get_run_group_stats(1)
+            second = await wf_routes.get_run_group_stats(1)
+
+        assert second == {"COMPLETED": 2}
+        assert mock_stats.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_retry_invalidates(self):
+        """Test that retrying a run group drops its cached stats."""
+        mock_stats = AsyncMock(side_effect=[{"FAILED": 1}, {"PENDING": 1}])
+        with (
+            patch.object(wf_routes.wf_ops, "get_run_group_stats", mock_stats),
+            patch.object(wf_routes.wf_ops, "reset_failed_steps", AsyncMock(return_value=1)),
+        ):
+            await wf_routes.get_run_group_stats(1)
+            await wf_routes.retry_workflow(1)
+            second = await wf_routes.get_run_group_stats(1)
+
+        assert second == {"PENDING": 1}
+
+
+class TestUploadParamSet:
+    """Tests for upload_param_set endpoint."""
+
+    YAML = "id: uploaded\nname: Uploaded\nconfig: {}\n"
+
+    @pytest.mark.asyncio
+    async def test_parses_off_loop(self):
+        """Test that parsing and validation run through the threadpool."""
+        with (
+            patch.object(wf_routes, "run_in_threadpool", wraps=wf_routes.run_in_threadpool) as mock_pool,
+            patch.object(wf_routes.wf_registry, "load_param_registry", AsyncMock(return_value={})),
+            patch.object(wf_routes.wf_registry, "save_param_set", AsyncMock(return_value="/params/user_uploaded.yaml")),
+        ):
+            result = await wf_routes.upload_param_set(Mock(), self.YAML)
+
+        assert result["id"] == "uploaded"
+        assert [c.args[0] for c in mock_pool.call_args_list] == [
+            wf_routes.wf_registry.parse_yaml,
+            wf_routes.WorkflowParams.model_validate,
+        ]
+
+    @pytest.mark.asyncio
+    async def test_invalid_yaml(self):
+        """Test that a YAML syntax error returns 400."""
+        response = Mock()
+        result = await wf_routes.upload_param_set(response, "id: [unclosed")
+
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+        assert result["error"].startswith("Invalid YAML syntax")
+
+    @pytest.mark.asyncio
+    async def test_duplicate(self):
+        """Test that an existing id returns 409."""
+        response = Mock()
+        existing = Mock(source="app")
+        with patch.object(wf_routes.wf_registry, "load_param_registry", AsyncMock(return_value={"uploaded": existing})):
+            result = await wf_routes.upload_param_set(response, self.YAML)
+
+        assert response.status_code == status.HTTP_409_CONFLICT
+        assert result["existing_source"] == "app"
+
+    @pytest.mark.asyncio
+    async def test_registry_load_error(self):
+        """Test that a ValueError while loading the existing param sets returns 400."""
+        response = Mock()
+        load = AsyncMock(side_effect=ValueError("duplicate param set id p1"))
+        with patch.object(wf_routes.wf_registry, "load_param_registry", load):
+            result = await wf_routes.upload_param_set(response, self.YAML)
+
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+        assert result == {"error": "duplicate param set id p1"}
+
+
+class TestYamlEndpoints:
+    """Tests for Last-Modified handling on the raw YAML endpoints."""
+
+    MTIME_NS = 1_704_110_400_000_000_000
+
+    @pytest.mark.asyncio
+    async def test_sets_last_modified(self):
+        """Test that content is returned with a Last-Modified header."""
+        with patch.object(
+            wf_routes.wf_registry,
+            "get_workflow_definition_yaml_content",
+            AsyncMock(return_value=(self.MTIME_NS, "id: batch\n")),
+        ):
+            result = await wf_routes.get_workflow_def("batch", Mock(headers={}), Mock())
+
+        assert result.status_code == status.HTTP_200_OK
+        assert result.body == b"id: batch\n"
+        assert result.headers["last-modified"] == "Mon, 01 Jan 2024 12:00:00 GMT"
+
+    @pytest.mark.asyncio
+    async def test_not_modified(self):
+        """Test that an up-to-date If-Modified-Since gets an empty 304."""
+        request = Mock(headers={"if-modified-since": "Mon, 01 Jan 2024 12:00:00 GMT"})
+        with patch.object(
+            wf_routes.wf_registry, "get_param_set_yaml_content", AsyncMock(return_value=(self.MTIME_NS, "id: p\n"))
+        ):
+            result = await wf_routes.get_param_set("p", request, Mock())
+
+        assert result.status_code == status.HTTP_304_NOT_MODIFIED
+        assert result.body == b""
+
+    @pytest.mark.asyncio
+    async def test_not_found(self):
+        """Test that a missing param set still returns 404."""
+        response = Mock()
+        with patch.object(wf_routes.wf_registry, "get_param_set_yaml_content", AsyncMock(return_value=None)):
+            result = await wf_routes.get_param_set("missing", Mock(headers={}), response)
+
+        assert response.status_code == status.HTTP_404_NOT_FOUND
+        assert result == {"error": "param set missing not found"}